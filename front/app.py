@@ -1,12 +1,34 @@
-from flask import Flask, render_template
+from flask import Flask, jsonify, render_template, request
+import json
+import os
+import sys
+import threading
 import pandas as pd
 
+# A tabela canônica dos times e o arquivo dos gols ao vivo ficam junto dos scripts de raspagem
+DIRETORIO_RASPAGEM = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'notebooks', 'API - Raspagem (Players_score.csv)')
+sys.path.append(DIRETORIO_RASPAGEM)
+from times_canonicos import tabela_times
+
 app = Flask(__name__)
 
-# Carrega os times únicos do CSV
+# Carrega os times únicos do CSV. Os nomes são ligados ao id canônico uma única vez, então o mesmo clube escrito
+# de formas diferentes ("RB Bragantino", "Bragantino") aparece uma vez só, com o nome da tabela de times
+tabela = tabela_times()
 df = pd.read_csv('matchess.csv', delimiter=';')
-home_team_unique = df['home_team_name'].drop_duplicates()
-away_team_unique = df['away_team_name'].drop_duplicates()
+df['id_time_casa'] = tabela.ids_da_coluna(df['home_team_name'])
+df['id_time_fora'] = tabela.ids_da_coluna(df['away_team_name'])
+
+def times_unicos(ids, nomes):
+    canonicos = ids.map(tabela.nomes, na_action='ignore')
+    return canonicos.fillna(nomes).drop_duplicates()
+
+home_team_unique = times_unicos(df['id_time_casa'], df['home_team_name'])
+away_team_unique = times_unicos(df['id_time_fora'], df['away_team_name'])
+
+# Arquivo JSONL com os gols ao vivo, publicado pelo ao_vivo.py (ou recebido por webhook na rota abaixo)
+ARQUIVO_GOLS_AO_VIVO = os.environ.get('GOLS_AO_VIVO', os.path.join(DIRETORIO_RASPAGEM, 'gols_ao_vivo.jsonl'))
+lock_gols_ao_vivo = threading.Lock()
 
 # Rota para a página principal
 @app.route('/')
@@ -18,5 +40,34 @@ def index():
 def dashboard():
     return render_template('dashboard.html')
 
+# Rota dos gols ao vivo.
+# GET devolve os gols publicados a partir da posição `desde` do arquivo e a posição para a próxima consulta;
+# POST recebe um gol enviado pelo webhook do ao_vivo.py
+@app.route('/ao-vivo/gols', methods=['GET', 'POST'])
+def gols_ao_vivo():
+    if request.method == 'POST':
+        gol = request.get_json(force=True)
+        with lock_gols_ao_vivo, open(ARQUIVO_GOLS_AO_VIVO, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(gol, ensure_ascii=False) + '\n')
+        return jsonify({'status': 'ok'}), 201
+
+    desde = request.args.get('desde', 0, type=int)
+    gols = []
+    proximo = desde
+    if os.path.exists(ARQUIVO_GOLS_AO_VIVO):
+        with open(ARQUIVO_GOLS_AO_VIVO, 'rb') as f:
+            f.seek(desde)
+            # Só lê linhas completas: uma linha sendo escrita fica para a próxima consulta.
+            # Linhas corrompidas são puladas, para não travar a leitura nessa posição.
+            for linha in f:
+                if not linha.endswith(b'\n'):
+                    break
+                proximo += len(linha)
+                try:
+                    gols.append(json.loads(linha))
+                except json.JSONDecodeError:
+                    continue
+    return jsonify({'gols': gols, 'proximo': proximo})
+
 if __name__ == '__main__':
     app.run(debug=True)
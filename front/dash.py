@@ -1,7 +1,16 @@
+import json
+import os
+import sys
+from collections import deque
 import streamlit as st
 import pandas as pd
 import matplotlib.pyplot as plt
 
+# A tabela canônica dos times e o arquivo dos gols ao vivo ficam junto dos scripts de raspagem
+DIRETORIO_RASPAGEM = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'notebooks', 'API - Raspagem (Players_score.csv)')
+sys.path.append(DIRETORIO_RASPAGEM)
+from times_canonicos import tabela_times
+
 # Configuração da página
 st.set_page_config(page_title='Análise de Futebol', page_icon=':soccer:', layout='wide')
 
@@ -22,22 +31,57 @@ matches_df = pd.read_csv('matchess.csv', delimiter=';')
 players_df = pd.read_csv('playerss.csv')
 
 # Filtrar os dados de partidas
-matches_df = matches_df[(matches_df['status'] != 'incomplete') & (matches_df['status'] != 'suspended')]
-
-# Criar listas de times e jogadores únicos
-times = sorted(list(set(matches_df['home_team_name']).union(set(matches_df['away_team_name']))))
+matches_df = matches_df[(matches_df['status'] != 'incomplete') & (matches_df['status'] != 'suspended')].copy()
+
+# Ligar os nomes dos times aos ids canônicos uma única vez; os filtros abaixo comparam ids, não textos.
+# Times fora de times_canonicos.csv (o aviso sai no log) recebem um id provisório negativo e aparecem com o próprio
+# nome do CSV, como no app.py, em vez de sumirem da lista
+tabela = tabela_times()
+matches_df['id_time_casa'] = tabela.ids_da_coluna(matches_df['home_team_name'])
+matches_df['id_time_fora'] = tabela.ids_da_coluna(matches_df['away_team_name'])
+sem_id = sorted(set(matches_df.loc[matches_df['id_time_casa'].isna(), 'home_team_name'].dropna())
+                | set(matches_df.loc[matches_df['id_time_fora'].isna(), 'away_team_name'].dropna()))
+ids_provisorios = {nome: -posicao for posicao, nome in enumerate(sem_id, start=1)}
+matches_df['id_time_casa'] = matches_df['id_time_casa'].fillna(matches_df['home_team_name'].map(ids_provisorios)).astype('Int64')
+matches_df['id_time_fora'] = matches_df['id_time_fora'].fillna(matches_df['away_team_name'].map(ids_provisorios)).astype('Int64')
+nomes_times = {**tabela.nomes, **{id_time: nome for nome, id_time in ids_provisorios.items()}}
+
+# Criar listas de times (ids, ordenados pelo nome) e jogadores únicos
+times = sorted(set(matches_df['id_time_casa'].dropna()) | set(matches_df['id_time_fora'].dropna()), key=nomes_times.get)
 jogadores = sorted(list(set(players_df['full_name'])))
 
+# Últimos gols ao vivo, publicados pelo ao_vivo.py (atualizados a cada interação com a página).
+# O arquivo é lido linha a linha: uma linha ainda sendo escrita ou corrompida é ignorada, sem derrubar a página.
+def ultimos_gols_ao_vivo(caminho, quantidade=10):
+    gols = deque(maxlen=quantidade)
+    with open(caminho, 'r', encoding='utf-8', errors='replace') as f:
+        for linha in f:
+            try:
+                gols.append(json.loads(linha))
+            except json.JSONDecodeError:
+                continue
+    return list(gols)
+
+arquivo_gols_ao_vivo = os.environ.get('GOLS_AO_VIVO', os.path.join(DIRETORIO_RASPAGEM, 'gols_ao_vivo.jsonl'))
+if os.path.exists(arquivo_gols_ao_vivo):
+    gols_ao_vivo = ultimos_gols_ao_vivo(arquivo_gols_ao_vivo)
+    if gols_ao_vivo:
+        with st.sidebar.expander('Gols ao vivo', expanded=True):
+            for gol in reversed(gols_ao_vivo):
+                st.write(f"{gol.get('match_minute')} {gol.get('home_team')} {gol.get('score')} {gol.get('away_team')}: "
+                         f"{gol.get('player_name')} ({gol.get('team_name')})")
+
 # Caixa de seleção para alternar entre análise de times e jogadores
 opcao_analise = st.sidebar.selectbox('Escolha o tipo de análise', ['Time', 'Jogador'])
 
 if opcao_analise == 'Time':
     # Análise de Times
-    time_selecionado = st.sidebar.selectbox('Selecione um time para analisar', times)
+    id_time_selecionado = st.sidebar.selectbox('Selecione um time para analisar', times, format_func=nomes_times.get)
+    time_selecionado = nomes_times[id_time_selecionado]
 
     # Filtrar os dados para o time selecionado
-    dados_time_casa = matches_df[matches_df['home_team_name'] == time_selecionado]
-    dados_time_fora = matches_df[matches_df['away_team_name'] == time_selecionado]
+    dados_time_casa = matches_df[matches_df['id_time_casa'] == id_time_selecionado]
+    dados_time_fora = matches_df[matches_df['id_time_fora'] == id_time_selecionado]
 
     # Estatísticas do time
     gols_casa = dados_time_casa['home_team_goal_count'].sum()
@@ -0,0 +1,260 @@
+# Esse arquivo acompanha as partidas em andamento e publica cada gol novo poucos segundos depois de ele acontecer.
+# Todas as partidas da rodada são consultadas em paralelo a cada ciclo, com requisições condicionais (ETag):
+# enquanto nada muda na partida, a API responde 304, sem corpo. Quando a timeline muda, só os eventos com EventId
+# ainda não visto são tratados, então cada gol é publicado uma única vez, mesmo que o VAR remova um evento anterior.
+#
+# Os gols vão para os assinantes do publicador: um arquivo JSONL (lido pela rota /ao-vivo/gols do front e pelo
+# dashboard) e, opcionalmente, webhooks que recebem cada gol por POST.
+#
+# Uso: python ao_vivo.py                          -> partidas em andamento agora, segundo o calendário da API
+#      python ao_vivo.py --data 2024-04-13        -> todas as partidas do registro nessa data (ex.: replay local)
+#      python ao_vivo.py --webhook http://127.0.0.1:5000/ao-vivo/gols
+
+import argparse
+import json
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+import requests
+from armazem_eventos import DESCRICAO_GOL, extrair_eventos
+from competicoes import ARQUIVO_COMPETICOES, carregar_competicoes
+from extrair_primeiro_gol_partidas import API_BASE_URL, CONCORRENCIA_MAXIMA, get_shared_session
+from limitador_taxa import limitador_fifa
+from log_raspagem import adicionar_argumentos_log, configurar_log_dos_argumentos, obter_log
+from registro_partidas import ID_COMPETICAO_PADRAO, RegistroPartidas
+from tipos_partida import GoalEvent
+
+log = obter_log("ao_vivo")
+
+# Arquivo padrão onde os gols ao vivo são publicados, um JSON por linha. Fica ao lado deste arquivo, e não na pasta
+# de onde o script foi chamado, para que o front e o dashboard encontrem o mesmo arquivo sem configuração
+ARQUIVO_GOLS_AO_VIVO = os.environ.get("GOLS_AO_VIVO",
+                                      os.path.join(os.path.dirname(os.path.abspath(__file__)), "gols_ao_vivo.jsonl"))
+
+# Intervalo entre duas consultas à mesma partida, em segundos
+INTERVALO_CONSULTA = 5
+
+# Período usado pela API no evento de fim de jogo
+PERIODO_FIM_DE_JOGO = 10
+
+# Uma partida deixa de ser acompanhada depois desse tempo a partir do pontapé inicial, mesmo sem o evento de fim de jogo
+DURACAO_MAXIMA_PARTIDA = timedelta(minutes=150)
+
+# Chave de um evento da timeline: o EventId da API ou, na falta dele, a posição do evento
+def chave_evento(evento):
+    return evento["id_evento"] or f'sequencia-{evento["sequencia"]}'
+
+class AcompanhamentoPartida:
+    __slots__ = ("match_code", "id_competicao", "etag", "eventos_vistos", "encerrada", "pontape")
+
+    # `pontape` é o horário (em UTC) de início da partida, vindo do calendário. Quando não é conhecido
+    # (ex.: replay de uma data do registro), a duração máxima é contada a partir do início do acompanhamento.
+    def __init__(self, match_code, id_competicao=ID_COMPETICAO_PADRAO, pontape=None):
+        self.match_code = match_code
+        self.id_competicao = id_competicao
+        self.etag = None
+        self.eventos_vistos = set()  # Chaves dos eventos já tratados
+        self.encerrada = False
+        self.pontape = pontape or datetime.now(timezone.utc)
+
+    # Consulta a timeline e devolve só os eventos novos (no formato do armazém de eventos).
+    # Se a timeline não mudou desde a última consulta, a resposta é um 304 e nada é devolvido.
+    def consultar(self, session):
+        url = f"{API_BASE_URL}/timelines/{self.id_competicao}/{self.match_code}&language=pt"
+        headers = {"If-None-Match": self.etag} if self.etag else {}
+        response = limitador_fifa.get(session, url, headers=headers, timeout=10)
+        if response.status_code == 304:
+            return []
+        response.raise_for_status()
+        self.etag = response.headers.get("ETag")
+
+        # Compara pelo EventId e não pela posição: um evento anulado pelo VAR some da timeline e desloca os seguintes
+        novos = [evento for evento in extrair_eventos(self.match_code, response.json(), self.id_competicao)
+                 if chave_evento(evento) not in self.eventos_vistos]
+        self.eventos_vistos.update(chave_evento(evento) for evento in novos)
+        if any(evento["periodo"] == PERIODO_FIM_DE_JOGO for evento in novos):
+            self.encerrada = True
+        return novos
+
+    def expirada(self, agora=None):
+        return (agora or datetime.now(timezone.utc)) - self.pontape > DURACAO_MAXIMA_PARTIDA
+
+# Monta o gol publicado: a linha do goals_data_with_teams.csv, mais a competição, os ids canônicos dos times
+# e a sequência do evento. Nos eventos ao vivo o placar pode vir nulo, e conta como zero.
+def gol_do_evento(evento):
+    gol = GoalEvent(evento["event_id"], evento["home_team"], evento["away_team"], evento["jogador_nome"],
+                    evento["time_nome"], evento["minuto"], evento["placar_casa"] or 0,
+                    evento["placar_fora"] or 0).como_dict()
+    gol.update({
+        "id_competicao": evento["id_competicao"],
+        "id_time_casa": evento["id_time_casa"],
+        "id_time_fora": evento["id_time_fora"],
+        "sequencia": evento["sequencia"],
+        "publicado_em": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    })
+    return gol
+
+# Distribui cada gol para os assinantes. Um assinante com erro não impede a entrega aos demais.
+class PublicadorGols:
+    def __init__(self):
+        self.assinantes = []
+
+    def assinar(self, assinante):
+        self.assinantes.append(assinante)
+        return assinante
+
+    def publicar(self, gol):
+        for assinante in self.assinantes:
+            try:
+                assinante(gol)
+            except Exception as e:
+                log.warning("Erro ao publicar o gol da partida %s em %s: %s", gol["event_id"], assinante, e)
+
+    def fechar(self):
+        for assinante in self.assinantes:
+            if hasattr(assinante, "fechar"):
+                assinante.fechar()
+
+# Acrescenta cada gol a um arquivo JSONL. Quem consome lê o arquivo a partir da última posição lida.
+class AssinanteArquivoJSONL:
+    def __init__(self, caminho=ARQUIVO_GOLS_AO_VIVO):
+        self.caminho = caminho
+        self.lock = threading.Lock()
+
+    def __call__(self, gol):
+        linha = json.dumps(gol, ensure_ascii=False) + "\n"
+        with self.lock, open(self.caminho, "a", encoding="utf-8") as f:
+            f.write(linha)
+
+    def __repr__(self):
+        return f"AssinanteArquivoJSONL({self.caminho!r})"
+
+# Envia cada gol por POST para uma URL. O envio roda em uma thread própria,
+# então um consumidor lento não atrasa a consulta das partidas.
+class AssinanteWebhook:
+    def __init__(self, url, timeout=5):
+        self.url = url
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.pendentes = queue.Queue()
+        self.thread = threading.Thread(target=self._enviar, daemon=True)
+        self.thread.start()
+
+    def __call__(self, gol):
+        self.pendentes.put(gol)
+
+    def _enviar(self):
+        while True:
+            gol = self.pendentes.get()
+            if gol is None:
+                return
+            try:
+                self.session.post(self.url, json=gol, timeout=self.timeout).raise_for_status()
+            except requests.exceptions.RequestException as e:
+                log.warning("Erro ao enviar o gol da partida %s para %s: %s", gol["event_id"], self.url, e)
+
+    # Espera os envios pendentes terminarem
+    def fechar(self):
+        self.pendentes.put(None)
+        self.thread.join()
+
+    def __repr__(self):
+        return f"AssinanteWebhook({self.url!r})"
+
+# Partidas da competição em andamento agora, segundo o calendário da API: começaram há menos de
+# DURACAO_MAXIMA_PARTIDA e ainda não foram encerradas. Devolve [(match_code, pontapé em UTC)].
+def partidas_em_andamento(competicao, agora=None):
+    from calendario_fifa import buscar_partidas_calendario
+
+    agora = agora or datetime.now(timezone.utc)
+    # A data local pode cair um dia depois da data em UTC, então o calendário de ontem também é consultado
+    inicio = (agora - timedelta(days=1)).replace(tzinfo=None)
+    em_andamento = []
+    for partida in buscar_partidas_calendario(inicio, agora.replace(tzinfo=None), competicao.id_competicao):
+        pontape = datetime.strptime(partida["Date"][:19], "%Y-%m-%dT%H:%M:%S").replace(tzinfo=timezone.utc)
+        if pontape <= agora <= pontape + DURACAO_MAXIMA_PARTIDA and partida.get("MatchStatus") != 0:
+            data = (partida.get("LocalDate") or partida["Date"])[:10]
+            em_andamento.append((f'{partida["IdSeason"]}/{partida["IdStage"]}/{partida["IdMatch"]}?date={data}', pontape))
+    return em_andamento
+
+# Consulta as partidas em ciclos até todas terminarem, publicando os gols novos de cada ciclo.
+# As partidas da rodada são consultadas ao mesmo tempo, cada uma em uma thread do pool.
+def acompanhar(partidas, publicador, intervalo=INTERVALO_CONSULTA, concorrencia=CONCORRENCIA_MAXIMA):
+    session = get_shared_session()
+
+    def consultar(partida):
+        try:
+            return partida.consultar(session)
+        except requests.exceptions.RequestException as e:
+            log.warning("Erro ao consultar a partida %s: %s", partida.match_code, e)
+            return []
+
+    with ThreadPoolExecutor(max_workers=concorrencia) as executor:
+        ativas = list(partidas)
+        while ativas:
+            inicio = time.monotonic()
+            for partida, novos in zip(ativas, executor.map(consultar, ativas)):
+                for evento in novos:
+                    if evento["tipo_descricao"] == DESCRICAO_GOL and evento["jogador_nome"]:
+                        # Um evento com dados inesperados é descartado sem interromper o acompanhamento
+                        try:
+                            gol = gol_do_evento(evento)
+                        except (TypeError, ValueError) as e:
+                            log.warning("Gol ignorado na partida %s (evento %s): %s", partida.match_code,
+                                        evento["id_evento"], e)
+                            continue
+                        log.info("Gol ao vivo: %s %s %s - %s (%s) aos %s", gol["home_team"], gol["score"],
+                                 gol["away_team"], gol["player_name"], gol["team_name"], gol["match_minute"])
+                        publicador.publicar(gol)
+                if partida.encerrada:
+                    log.info("Partida %s encerrada", partida.match_code)
+                elif partida.expirada():
+                    log.warning("Partida %s deixou de ser acompanhada (sem fim de jogo %s após o início)",
+                                partida.match_code, DURACAO_MAXIMA_PARTIDA)
+            ativas = [partida for partida in ativas if not partida.encerrada and not partida.expirada()]
+            if ativas:
+                time.sleep(max(0, intervalo - (time.monotonic() - inicio)))
+
+def main():
+    parser = argparse.ArgumentParser(description="Acompanha as partidas em andamento e publica os gols ao vivo")
+    parser.add_argument("--config", default=ARQUIVO_COMPETICOES, help="Arquivo de configuração das competições")
+    parser.add_argument("--competicoes", nargs="+", help="Nomes das competições do arquivo de configuração")
+    parser.add_argument("--data", help="Acompanha todas as partidas do registro nessa data (YYYY-MM-DD), "
+                                       "em vez das partidas em andamento segundo o calendário")
+    parser.add_argument("--intervalo", type=float, default=INTERVALO_CONSULTA,
+                        help="Segundos entre duas consultas à mesma partida")
+    parser.add_argument("--saida", default=ARQUIVO_GOLS_AO_VIVO, help="Arquivo JSONL onde os gols são publicados")
+    parser.add_argument("--webhook", nargs="*", default=[], help="URLs que recebem cada gol por POST")
+    adicionar_argumentos_log(parser)
+    args = parser.parse_args()
+    configurar_log_dos_argumentos(args)
+
+    partidas = []
+    for competicao in carregar_competicoes(args.config, args.competicoes):
+        if args.data:
+            registro = RegistroPartidas()
+            # O registro não guarda o horário das partidas, então o tempo máximo conta a partir de agora
+            match_codes = [(match_code, None) for match_code
+                           in registro.codigos(**{**competicao.filtros_registro(), "inicio": args.data, "fim": args.data})]
+            registro.fechar()
+        else:
+            match_codes = partidas_em_andamento(competicao)
+        log.info("[%s] %d partidas para acompanhar", competicao.nome, len(match_codes))
+        partidas.extend(AcompanhamentoPartida(match_code, competicao.id_competicao, pontape)
+                        for match_code, pontape in match_codes)
+
+    publicador = PublicadorGols()
+    publicador.assinar(AssinanteArquivoJSONL(args.saida))
+    for url in args.webhook:
+        publicador.assinar(AssinanteWebhook(url))
+    try:
+        acompanhar(partidas, publicador, args.intervalo)
+    finally:
+        publicador.fechar()
+        log.info("Métricas do limitador de taxa: %s", limitador_fifa.metricas())
+
+if __name__ == "__main__":
+    main()
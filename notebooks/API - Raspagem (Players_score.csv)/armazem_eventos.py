@@ -0,0 +1,151 @@
+# Esse arquivo guarda todos os eventos das timelines das partidas (gols, cartões, substituições, etc.)
+# em um armazém colunar (Parquet), particionado por competição e temporada.
+# A partir dele os conjuntos de dados usados nos modelos (primeiro gol, gols no primeiro tempo, gols por minuto)
+# são gerados localmente com consultas vetorizadas do pandas, sem precisar baixar as timelines de novo.
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+from parser_timeline import DESCRICAO_GOL, padrao_jogador_time
+from registro_partidas import ID_COMPETICAO_PADRAO
+from times_canonicos import tabela_times
+
+# Pasta padrão do armazém
+DIRETORIO_EVENTOS = "eventos_partidas"
+
+# Período usado pela API nos eventos do primeiro tempo (inclusive os acréscimos, como 45'+2')
+PERIODO_PRIMEIRO_TEMPO = 3
+
+# Colunas usadas para particionar os arquivos em disco
+COLUNAS_PARTICAO = ["id_competicao", "id_temporada"]
+
+# Os ids são textos mesmo quando parecem números (ex.: competição 2000000078), então o tipo das partições é fixo
+particionamento = ds.partitioning(pa.schema([(coluna, pa.string()) for coluna in COLUNAS_PARTICAO]), flavor="hive")
+
+# Separa o código da partida (`temporada/fase/partida?date=YYYY-MM-DD`) em suas partes
+def partes_do_codigo(match_code):
+    caminho, _, consulta = match_code.partition("?")
+    id_temporada, id_fase, id_partida = caminho.split("/")[-3:]
+    data_partida = consulta.rsplit("date=", 1)[-1] if "date=" in consulta else None
+    return id_temporada, id_fase, id_partida, data_partida
+
+# Transforma a timeline de uma partida em uma linha por evento
+def extrair_eventos(match_code, data, id_competicao=ID_COMPETICAO_PADRAO):
+    id_temporada, id_fase, id_partida, data_partida = partes_do_codigo(match_code)
+
+    # Nomes dos times da casa e de fora, como no restante dos scripts
+    home_team = data.get("Home", {}).get("TeamName", [{"Description": "Desconhecido"}])[0].get("Description")
+    away_team = data.get("Away", {}).get("TeamName", [{"Description": "Desconhecido"}])[0].get("Description")
+    id_time_casa = data.get("Home", {}).get("IdTeam")
+    # Ids canônicos dos times (times_canonicos.csv), resolvidos uma vez por partida
+    tabela = tabela_times()
+    id_canonico_casa = tabela.id_time(home_team)
+    id_canonico_fora = tabela.id_time(away_team)
+
+    eventos = []
+    for sequencia, event in enumerate(data.get("Event", [])):
+        tipo_localizado = event.get("TypeLocalized") or [{}]
+        # Um evento é gol se qualquer uma das descrições localizadas for a de gol, e não só a primeira
+        tipo_descricao = (DESCRICAO_GOL if any(tipo.get("Description") == DESCRICAO_GOL for tipo in tipo_localizado)
+                          else tipo_localizado[0].get("Description"))
+        descricao = (event.get("EventDescription") or [{}])[0].get("Description", "")
+        jogador_time = padrao_jogador_time.search(descricao)
+        id_time = event.get("IdTeam")
+
+        eventos.append({
+            "id_competicao": id_competicao,
+            "id_temporada": id_temporada,
+            "id_fase": id_fase,
+            "id_partida": id_partida,
+            "event_id": match_code,
+            "data_partida": data_partida,
+            "home_team": home_team,
+            "away_team": away_team,
+            "id_time_casa": id_canonico_casa,
+            "id_time_fora": id_canonico_fora,
+            "sequencia": sequencia,
+            "id_evento": event.get("EventId"),
+            "tipo": event.get("Type"),
+            "tipo_descricao": tipo_descricao,
+            "periodo": event.get("Period"),
+            "minuto": str(event.get("Minute", 0)),
+            "id_time": id_time,
+            "lado": None if id_time is None else ("casa" if id_time == id_time_casa else "fora"),
+            "jogador_nome": jogador_time.group(1) if jogador_time else None,
+            "time_nome": jogador_time.group(2) if jogador_time else None,
+            "placar_casa": event.get("HomeGoals", 0),
+            "placar_fora": event.get("AwayGoals", 0),
+            "descricao": descricao,
+        })
+    return eventos
+
+class ArmazemEventos:
+    def __init__(self, diretorio=DIRETORIO_EVENTOS):
+        self.diretorio = diretorio
+
+    # Acrescenta eventos ao armazém. Cada chamada cria novos arquivos dentro das partições, sem reescrever os antigos.
+    def gravar(self, eventos):
+        if not eventos:
+            return
+        # Os ids canônicos são sempre gravados como inteiros, mesmo quando nenhum time do lote é conhecido
+        eventos = pd.DataFrame(eventos).astype({"id_time_casa": "Int64", "id_time_fora": "Int64"})
+        eventos.to_parquet(self.diretorio, partition_cols=COLUNAS_PARTICAO, index=False)
+
+    # Lê os eventos, opcionalmente filtrando partições, ex.: filtros=[("id_temporada", "==", "...")]
+    def ler(self, filtros=None):
+        eventos = pd.read_parquet(self.diretorio, filters=filtros, partitioning=particionamento)
+        # As colunas de partição podem voltar como categorias; convertemos para texto como nas demais colunas
+        for coluna in COLUNAS_PARTICAO:
+            eventos[coluna] = eventos[coluna].astype(str)
+        # Arquivos gravados antes dos ids canônicos não têm essas colunas: os ids são completados pelos nomes
+        tabela = tabela_times()
+        for coluna_id, coluna_nome in (("id_time_casa", "home_team"), ("id_time_fora", "away_team")):
+            if coluna_id in eventos:
+                ids = eventos[coluna_id].astype("Int64")
+            else:
+                ids = pd.Series(pd.NA, index=eventos.index, dtype="Int64")
+            eventos[coluna_id] = ids.fillna(tabela.ids_da_coluna(eventos[coluna_nome]))
+        # Uma partida gravada duas vezes (ex.: execução interrompida) não pode duplicar eventos
+        eventos = eventos.drop_duplicates(subset=["event_id", "sequencia"])
+        return eventos.sort_values(["data_partida", "event_id", "sequencia"], kind="stable").reset_index(drop=True)
+
+# Minuto "base" do evento como número (ex.: "45'+2'" -> 45), usado nas consultas por minuto
+def minuto_base(eventos):
+    return pd.to_numeric(eventos["minuto"].str.extract(r"(\d+)", expand=False), errors="coerce")
+
+def somente_gols(eventos):
+    return eventos[eventos["tipo_descricao"] == DESCRICAO_GOL]
+
+# Primeiro gol de cada partida, no mesmo formato do goals_data_with_teams.csv.
+# Assim como antes, só contam os gols cuja descrição identifica o jogador e o time.
+def primeiro_gol(eventos):
+    gols = somente_gols(eventos)
+    gols = gols[gols["jogador_nome"].notna()].sort_values(["event_id", "sequencia"], kind="stable")
+    primeiros = gols.groupby("event_id", sort=False).head(1)
+    return pd.DataFrame({
+        "event_id": primeiros["event_id"],
+        "home_team": primeiros["home_team"],
+        "away_team": primeiros["away_team"],
+        "player_name": primeiros["jogador_nome"],
+        "team_name": primeiros["time_nome"],
+        "match_minute": primeiros["minuto"],
+        "score": primeiros["placar_casa"].astype(str) + " - " + primeiros["placar_fora"].astype(str),
+    }).reset_index(drop=True)
+
+# Quantidade de gols de cada time no primeiro tempo de cada partida. O tempo vem do período do evento;
+# só eventos sem período são classificados pelo minuto
+def gols_primeiro_tempo(eventos):
+    gols = somente_gols(eventos)
+    periodo = pd.to_numeric(gols["periodo"], errors="coerce")
+    gols = gols[(periodo == PERIODO_PRIMEIRO_TEMPO) | (periodo.isna() & (minuto_base(gols) <= 45))]
+    contagem = pd.crosstab(gols["event_id"], gols["lado"]).reindex(columns=["casa", "fora"], fill_value=0)
+    partidas = eventos[["event_id", "home_team", "away_team", "id_time_casa", "id_time_fora"]]
+    partidas = partidas.drop_duplicates("event_id").set_index("event_id")
+    resultado = partidas.join(contagem).fillna({"casa": 0, "fora": 0})
+    resultado = resultado.rename(columns={"casa": "gols_casa_primeiro_tempo", "fora": "gols_fora_primeiro_tempo"})
+    return resultado.astype({"gols_casa_primeiro_tempo": int, "gols_fora_primeiro_tempo": int}).reset_index()
+
+# Quantidade de gols marcados em cada minuto, somando todas as partidas
+def gols_por_minuto(eventos):
+    minutos = minuto_base(somente_gols(eventos)).dropna().astype(int)
+    return minutos.value_counts().sort_index().rename_axis("minuto").reset_index(name="gols")
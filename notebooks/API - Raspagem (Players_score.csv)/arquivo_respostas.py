@@ -0,0 +1,272 @@
+# Esse arquivo guarda as respostas brutas da API (as timelines em JSON) em um único arquivo compactado,
+# só de acréscimo (append-only), com um índice em SQLite que aponta a posição de cada partida no arquivo.
+# Assim dá para ler uma partida qualquer com um único seek, e reprocessar a temporada inteira com regras novas
+# sem baixar nada de novo, lendo o arquivo em sequência com vários processos.
+#
+# Cada registro é compactado separadamente (zstd, se o pacote zstandard estiver instalado, ou zlib) e tem um
+# cabeçalho com a chave, então o índice pode ser reconstruído a partir do próprio arquivo se for perdido.
+#
+# Uso: python arquivo_respostas.py estatisticas
+#      python arquivo_respostas.py reprocessar --destino eventos_reprocessados --processos 4
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import struct
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from parser_timeline import carregar_json
+
+try:
+    import zstandard
+except ImportError:  # Sem o zstandard, os registros novos usam zlib
+    zstandard = None
+
+try:
+    import fcntl
+except ImportError:  # Windows: sem trava entre processos, apenas um processo gravando por arquivo
+    fcntl = None
+
+# Arquivo padrão das respostas
+ARQUIVO_PACOTE = "respostas_partidas.pack"
+
+# Cabeçalho de cada registro: assinatura, codec, tamanho da chave e tamanho dos dados compactados
+CABECALHO = struct.Struct(">4sBHI")
+ASSINATURA = b"RSP1"
+
+CODEC_ZLIB = 1
+CODEC_ZSTD = 2
+
+# Quantidade de partidas lidas por tarefa no reprocessamento em paralelo
+PARTIDAS_POR_TAREFA = 200
+
+# Chave de uma timeline no arquivo: a competição seguida do código da partida, como no caminho da API
+def chave_timeline(id_competicao, match_code):
+    return f"{id_competicao}/{match_code}"
+
+def compactar(dados):
+    if zstandard is not None:
+        return CODEC_ZSTD, zstandard.ZstdCompressor(level=10).compress(dados)
+    return CODEC_ZLIB, zlib.compress(dados, 9)
+
+def descompactar(codec, dados):
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise RuntimeError("Registro compactado com zstd: instale o pacote zstandard para lê-lo")
+        return zstandard.ZstdDecompressor().decompress(dados)
+    return zlib.decompress(dados)
+
+class ArquivoRespostas:
+    def __init__(self, caminho=ARQUIVO_PACOTE):
+        self.caminho = caminho
+        self.caminho_indice = f"{caminho}.idx"
+        self.caminho_trava = f"{caminho}.lock"
+        self.indice = sqlite3.connect(self.caminho_indice, timeout=60)
+        with self.indice:
+            self.indice.execute(
+                """CREATE TABLE IF NOT EXISTS respostas (
+                       chave TEXT PRIMARY KEY,
+                       deslocamento INTEGER NOT NULL,
+                       tamanho INTEGER NOT NULL,
+                       codec INTEGER NOT NULL,
+                       tamanho_original INTEGER NOT NULL,
+                       hash TEXT NOT NULL,
+                       gravado_em REAL NOT NULL
+                   )"""
+            )
+        with self._trava():
+            self._recuperar()
+        self.pacote = None  # Aberto para leitura só quando necessário
+
+    @contextmanager
+    def _trava(self):
+        with open(self.caminho_trava, "a") as trava:
+            if fcntl is not None:
+                fcntl.flock(trava, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(trava, fcntl.LOCK_UN)
+
+    # Descarta o final de um registro que foi gravado no pacote mas não chegou ao índice (processo interrompido).
+    # Se o índice tiver sido perdido, ele é reconstruído a partir do pacote.
+    def _recuperar(self):
+        fim = self.indice.execute("SELECT MAX(deslocamento + tamanho) FROM respostas").fetchone()[0]
+        tamanho_pacote = os.path.getsize(self.caminho) if os.path.exists(self.caminho) else 0
+        if fim is None and tamanho_pacote > 0:
+            self._reconstruir_indice()
+        elif fim is not None and tamanho_pacote > fim:
+            with open(self.caminho, "r+b") as f:
+                f.truncate(fim)
+
+    def __len__(self):
+        return self.indice.execute("SELECT COUNT(*) FROM respostas").fetchone()[0]
+
+    def __contains__(self, chave):
+        return self.indice.execute("SELECT 1 FROM respostas WHERE chave = ?", (chave,)).fetchone() is not None
+
+    # Chaves guardadas, na ordem em que estão no arquivo (a ordem mais rápida para ler tudo)
+    def chaves(self):
+        return [linha[0] for linha in self.indice.execute("SELECT chave FROM respostas ORDER BY deslocamento")]
+
+    # Guarda a resposta de uma chave. Se a resposta for igual à já guardada, nada é gravado.
+    # Devolve True se um registro novo foi acrescentado.
+    def gravar(self, chave, resposta):
+        dados = resposta if isinstance(resposta, bytes) else json.dumps(
+            resposta, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        resumo = hashlib.sha1(dados).hexdigest()
+        atual = self.indice.execute("SELECT hash FROM respostas WHERE chave = ?", (chave,)).fetchone()
+        if atual is not None and atual[0] == resumo:
+            return False
+
+        codec, compactados = compactar(dados)
+        chave_bytes = chave.encode("utf-8")
+        registro = CABECALHO.pack(ASSINATURA, codec, len(chave_bytes), len(compactados)) + chave_bytes + compactados
+        with self._trava():
+            with open(self.caminho, "ab") as f:
+                inicio = f.tell()
+                f.write(registro)
+                f.flush()
+                os.fsync(f.fileno())
+            # O índice aponta direto para os dados compactados, pulando o cabeçalho e a chave
+            deslocamento = inicio + CABECALHO.size + len(chave_bytes)
+            with self.indice:
+                self.indice.execute(
+                    "INSERT OR REPLACE INTO respostas VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (chave, deslocamento, len(compactados), codec, len(dados), resumo, time.time()),
+                )
+        return True
+
+    def ler_bruto(self, chave):
+        linha = self.indice.execute(
+            "SELECT deslocamento, tamanho, codec FROM respostas WHERE chave = ?", (chave,)).fetchone()
+        if linha is None:
+            return None
+        deslocamento, tamanho, codec = linha
+        if self.pacote is None:
+            self.pacote = open(self.caminho, "rb")
+        self.pacote.seek(deslocamento)
+        return descompactar(codec, self.pacote.read(tamanho))
+
+    # Lê a resposta (JSON) de uma chave, ou None se ela não estiver guardada
+    def ler(self, chave):
+        dados = self.ler_bruto(chave)
+        return None if dados is None else carregar_json(dados)
+
+    # Reconstrói o índice percorrendo os cabeçalhos do pacote; a última versão de cada chave é a que vale
+    def reconstruir_indice(self):
+        with self._trava():
+            self._reconstruir_indice()
+
+    def _reconstruir_indice(self):
+        if not os.path.exists(self.caminho):
+            with self.indice:
+                self.indice.execute("DELETE FROM respostas")
+            return
+        with self.indice, open(self.caminho, "r+b") as f:
+            self.indice.execute("DELETE FROM respostas")
+            while True:
+                inicio = f.tell()
+                cabecalho = f.read(CABECALHO.size)
+                if not cabecalho:
+                    break
+                if len(cabecalho) == CABECALHO.size:
+                    assinatura, codec, tamanho_chave, tamanho = CABECALHO.unpack(cabecalho)
+                    if assinatura != ASSINATURA:
+                        raise ValueError(f"Registro inválido na posição {inicio} de {self.caminho}")
+                    chave = f.read(tamanho_chave)
+                    deslocamento = f.tell()
+                    compactados = f.read(tamanho)
+                if len(cabecalho) < CABECALHO.size or len(chave) < tamanho_chave or len(compactados) < tamanho:
+                    # Registro incompleto no final do pacote: a gravação foi interrompida
+                    f.truncate(inicio)
+                    break
+                dados = descompactar(codec, compactados)
+                self.indice.execute(
+                    "INSERT OR REPLACE INTO respostas VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (chave.decode("utf-8"), deslocamento, tamanho, codec, len(dados),
+                     hashlib.sha1(dados).hexdigest(), time.time()),
+                )
+
+    def metricas(self):
+        partidas, compactado, original = self.indice.execute(
+            "SELECT COUNT(*), COALESCE(SUM(tamanho), 0), COALESCE(SUM(tamanho_original), 0) FROM respostas").fetchone()
+        return {
+            "partidas": partidas,
+            "bytes_arquivo": os.path.getsize(self.caminho) if os.path.exists(self.caminho) else 0,
+            "bytes_originais": original,
+            "taxa_compressao": round(original / compactado, 1) if compactado else 0,
+        }
+
+    def fechar(self):
+        if self.pacote is not None:
+            self.pacote.close()
+        self.indice.close()
+
+# Tarefa de um processo do reprocessamento: abre o pacote, lê as chaves em sequência e aplica a função
+def _reprocessar_chaves(caminho, chaves, funcao):
+    arquivo = ArquivoRespostas(caminho)
+    try:
+        return [funcao(chave, arquivo.ler(chave)) for chave in chaves]
+    finally:
+        arquivo.fechar()
+
+# Aplica `funcao(chave, resposta)` a todas as respostas guardadas (ou às `chaves` informadas) usando vários processos.
+# A função precisa estar definida no nível de um módulo, para poder ser enviada aos processos.
+# Os resultados voltam na ordem das chaves.
+def reprocessar(funcao, caminho=ARQUIVO_PACOTE, chaves=None, processos=None, partidas_por_tarefa=PARTIDAS_POR_TAREFA):
+    arquivo = ArquivoRespostas(caminho)
+    chaves = arquivo.chaves() if chaves is None else list(chaves)
+    arquivo.fechar()
+
+    # Cada tarefa pega um trecho contínuo do arquivo, para que a leitura seja sequencial
+    trechos = [chaves[posicao:posicao + partidas_por_tarefa] for posicao in range(0, len(chaves), partidas_por_tarefa)]
+    resultados = []
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        for parte in executor.map(_reprocessar_chaves, [caminho] * len(trechos), trechos, [funcao] * len(trechos)):
+            resultados.extend(parte)
+    return resultados
+
+# Extrai os eventos de uma timeline guardada, com as regras atuais de armazem_eventos.py
+def _eventos_da_resposta(chave, resposta):
+    from armazem_eventos import extrair_eventos
+
+    id_competicao, match_code = chave.split("/", 1)
+    return extrair_eventos(match_code, resposta, id_competicao)
+
+def main():
+    parser = argparse.ArgumentParser(description="Arquivo compactado das respostas brutas da API da FIFA")
+    parser.add_argument("comando", choices=["estatisticas", "reprocessar", "reconstruir-indice"])
+    parser.add_argument("--arquivo", default=ARQUIVO_PACOTE, help="Arquivo de respostas")
+    parser.add_argument("--destino", default="eventos_reprocessados",
+                        help="Pasta do armazém de eventos gerado pelo reprocessamento")
+    parser.add_argument("--processos", type=int, default=None, help="Quantidade de processos (padrão: um por CPU)")
+    args = parser.parse_args()
+
+    if args.comando == "reconstruir-indice":
+        arquivo = ArquivoRespostas(args.arquivo)
+        arquivo.reconstruir_indice()
+        print(f"Índice reconstruído: {arquivo.metricas()}")
+        arquivo.fechar()
+    elif args.comando == "estatisticas":
+        arquivo = ArquivoRespostas(args.arquivo)
+        print(arquivo.metricas())
+        arquivo.fechar()
+    else:
+        from armazem_eventos import ArmazemEventos
+
+        inicio = time.monotonic()
+        eventos_por_partida = reprocessar(_eventos_da_resposta, args.arquivo, processos=args.processos)
+        eventos = [evento for eventos_partida in eventos_por_partida for evento in eventos_partida]
+        ArmazemEventos(args.destino).gravar(eventos)
+        duracao = time.monotonic() - inicio
+        print(f"{len(eventos_por_partida)} partidas ({len(eventos)} eventos) reprocessadas em {duracao:.2f}s "
+              f"({len(eventos_por_partida) / duracao if duracao else 0:.0f} partidas/s), gravadas em {args.destino}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# Esse arquivo mede a vazão da ingestão completa (descoberta pelo calendário + download das timelines + extração dos eventos)
+# contra o servidor local da FIFA (servidor_fifa_local.py), sem acessar o site real.
+# Ao final mostra partidas por segundo, latência p95 das requisições e quantas vezes foi preciso repetir requisições.
+#
+# Uso: python benchmark_ingestao.py --fixtures fixtures --latencia 50 --taxa-429 0.02 --taxa-erro 0.01
+
+import argparse
+import os
+import statistics
+import threading
+import time
+from datetime import datetime, timedelta
+from servidor_fifa_local import DIRETORIO_FIXTURES, gerar_fixtures_sinteticas, iniciar_servidor
+
+# Percentil simples (sem interpolação) de uma lista de valores
+def percentil(valores, p):
+    if not valores:
+        return 0.0
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(round(p / 100 * (len(ordenados) - 1))))]
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark da ingestão contra o servidor local da FIFA")
+    parser.add_argument("--fixtures", default=DIRETORIO_FIXTURES, help="Pasta com as fixtures (gera sintéticas se não existir)")
+    parser.add_argument("--partidas-sinteticas", type=int, default=380, help="Partidas geradas quando não há fixtures")
+    parser.add_argument("--latencia", type=float, default=20, help="Latência fixa do servidor, em milissegundos")
+    parser.add_argument("--variacao", type=float, default=20, help="Latência aleatória extra, em milissegundos")
+    parser.add_argument("--taxa-erro", type=float, default=0, help="Probabilidade (0 a 1) de respostas 500")
+    parser.add_argument("--taxa-429", type=float, default=0, help="Probabilidade (0 a 1) de respostas 429")
+    parser.add_argument("--retry-after", type=int, default=1, help="Segundos informados no Retry-After dos 429")
+    parser.add_argument("--concorrencia", type=int, default=16, help="Requisições simultâneas de timelines")
+    args = parser.parse_args()
+
+    if not os.path.exists(os.path.join(args.fixtures, "calendario.json")):
+        gerar_fixtures_sinteticas(args.fixtures, args.partidas_sinteticas)
+
+    servidor, endereco = iniciar_servidor(args.fixtures, latencia=args.latencia / 1000, variacao=args.variacao / 1000,
+                                          taxa_erro=args.taxa_erro, taxa_429=args.taxa_429,
+                                          retry_after=args.retry_after, semente=1)
+    # Os scripts leem a URL base na importação, então a variável precisa existir antes de importá-los
+    os.environ["FIFA_API_BASE_URL"] = f"{endereco}/api/v3"
+    import asyncio
+    from calendario_fifa import buscar_links_partidas_calendario
+    from extrair_primeiro_gol_partidas import buscar_timelines, get_shared_session
+    from armazem_eventos import extrair_eventos
+    from limitador_taxa import limitador_fifa
+    from registro_partidas import chaves_dos_links, codigo_partida
+
+    # Registra a latência e as repetições (feitas pelo urllib3) de cada resposta recebida
+    latencias = []
+    repeticoes = [0]
+    lock = threading.Lock()
+
+    def medir(response, *args, **kwargs):
+        historico = response.raw.retries.history if getattr(response.raw, "retries", None) else ()
+        with lock:
+            latencias.append(response.elapsed.total_seconds())
+            repeticoes[0] += len(historico)
+
+    get_shared_session().hooks["response"].append(medir)
+
+    # Intervalo de datas coberto pelas fixtures
+    datas_fixtures = sorted((p.get("LocalDate") or p["Date"])[:10] for p in servidor.fixtures.calendario)
+    inicio_datas = datetime.strptime(datas_fixtures[0], "%Y-%m-%d")
+    dias = (datetime.strptime(datas_fixtures[-1], "%Y-%m-%d") - inicio_datas).days + 1
+    datas = [(inicio_datas + timedelta(days=dia)).strftime("%Y-%m-%d") for dia in range(dias)]
+
+    inicio = time.monotonic()
+    links = buscar_links_partidas_calendario(datas)
+    duracao_descoberta = time.monotonic() - inicio
+
+    # Os códigos saem do mesmo analisador de links usado pelo registro, valendo para qualquer competição
+    match_codes = [codigo_partida(chave) for chave in chaves_dos_links(links)]
+    inicio_timelines = time.monotonic()
+    timelines = asyncio.run(buscar_timelines(match_codes, concorrencia=args.concorrencia))
+    eventos = 0
+    for match_code, data in zip(match_codes, timelines):
+        if data is not None:
+            eventos += len(extrair_eventos(match_code, data))
+    duracao_timelines = time.monotonic() - inicio_timelines
+    duracao_total = time.monotonic() - inicio
+    servidor.shutdown()
+
+    metricas_limitador = limitador_fifa.metricas()
+    falhas = sum(1 for data in timelines if data is None)
+    print("\n===== Resultado do benchmark =====")
+    print(f"Partidas descobertas: {len(match_codes)} em {duracao_descoberta:.2f}s")
+    print(f"Timelines: {len(match_codes) - falhas} baixadas ({falhas} falhas), {eventos} eventos em {duracao_timelines:.2f}s")
+    print(f"Vazão: {len(match_codes) / duracao_total if duracao_total else 0:.1f} partidas/s (total {duracao_total:.2f}s)")
+    print(f"Latência das requisições: média {statistics.mean(latencias) * 1000 if latencias else 0:.1f} ms, "
+          f"p95 {percentil(latencias, 95) * 1000:.1f} ms")
+    print(f"Repetições: {repeticoes[0]} por erro 5xx, {metricas_limitador['respostas_sobrecarga']} por 429, "
+          f"{metricas_limitador['eventos_backoff']} recuos do limitador")
+    print(f"Servidor: {servidor.contadores}")
+    print(f"Limitador de taxa: {metricas_limitador}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+# Esse arquivo implementa um cache em disco para as respostas JSON da API da FIFA, indexado pela competição e pelo
+# código da partida. Partidas já encerradas nunca mudam, então a resposta delas fica guardada para sempre; as demais
+# (que podem estar em andamento) expiram rápido e são revalidadas com ETag/Last-Modified, sem baixar o corpo de novo
+# se nada mudou. Uma partida é dada como encerrada pela própria timeline (evento de fim de jogo ou situação da partida)
+# ou, na falta disso, quando já passou com folga de qualquer fuso horário a data dela.
+
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from limitador_taxa import limitador_fifa
+
+# Pasta padrão do cache
+DIRETORIO_CACHE = "cache_respostas"
+
+# Tempo (em segundos) que a resposta de uma partida que ainda pode estar acontecendo é considerada válida
+TTL_PARTIDA_AO_VIVO = 60
+
+# Tempo, contado do início (em UTC) da data local da partida, depois do qual ela com certeza terminou, qualquer que
+# seja o fuso horário do jogo e do computador: um dia da data local, mais o maior fuso (UTC-12), mais uma folga
+# para o jogo e eventuais atrasos
+PRAZO_PARA_FINALIZAR = timedelta(days=3)
+
+# Período usado pela API no evento de fim de jogo e situação (MatchStatus) de uma partida encerrada
+PERIODO_FIM_DE_JOGO = 10
+SITUACAO_PARTIDA_ENCERRADA = 0
+
+# Verifica, pela data presente no código da partida (`...?date=YYYY-MM-DD`), se ela com certeza já terminou.
+# Códigos sem data ou com data inválida (ex.: "?date=None") são tratados como partidas que ainda podem mudar.
+def partida_finalizada(match_code, agora=None):
+    if "date=" not in match_code:
+        return False
+    try:
+        data_partida = datetime.strptime(match_code.rsplit("date=", 1)[-1][:10], '%Y-%m-%d')
+    except ValueError:
+        return False
+    agora = agora or datetime.now(timezone.utc)
+    return data_partida.replace(tzinfo=timezone.utc) + PRAZO_PARA_FINALIZAR <= agora
+
+# Verifica, pelo conteúdo da timeline, se a partida terminou: evento de fim de jogo ou situação de partida encerrada
+def timeline_encerrada(dados):
+    if not isinstance(dados, dict):
+        return False
+    if dados.get("MatchStatus") == SITUACAO_PARTIDA_ENCERRADA:
+        return True
+    return any(evento.get("Period") == PERIODO_FIM_DE_JOGO for evento in dados.get("Event") or [])
+
+# Chave do cache de uma timeline: o mesmo código de partida pode existir em competições diferentes
+def chave_cache(id_competicao, match_code):
+    return f"{id_competicao}/{match_code}"
+
+class CacheRespostas:
+    def __init__(self, diretorio=DIRETORIO_CACHE, ttl_ao_vivo=TTL_PARTIDA_AO_VIVO):
+        self.diretorio = diretorio
+        self.ttl_ao_vivo = ttl_ao_vivo
+        self.lock = threading.Lock()
+        # Contadores de uso do cache
+        self.contadores = {"hits": 0, "misses": 0, "revalidados": 0, "atualizados": 0}
+        os.makedirs(diretorio, exist_ok=True)
+
+    # Caminho do arquivo de uma chave. O código da partida tem "/" e "?", então usamos um hash como nome.
+    def _caminho(self, chave):
+        nome = hashlib.sha1(chave.encode("utf-8")).hexdigest()
+        return os.path.join(self.diretorio, nome[:2], f"{nome}.json")
+
+    def _contar(self, contador):
+        with self.lock:
+            self.contadores[contador] += 1
+
+    def ler(self, chave):
+        caminho = self._caminho(chave)
+        if not os.path.exists(caminho):
+            return None
+        with open(caminho, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def gravar(self, chave, entrada):
+        caminho = self._caminho(chave)
+        os.makedirs(os.path.dirname(caminho), exist_ok=True)
+        # Grava em um arquivo temporário (um por thread) e troca, para nunca deixar uma entrada pela metade
+        temporario = f"{caminho}.{threading.get_ident()}.tmp"
+        with open(temporario, "w", encoding="utf-8") as f:
+            json.dump(entrada, f, ensure_ascii=False)
+        os.replace(temporario, caminho)
+
+    # Uma entrada é válida para sempre se a partida terminou, ou por `ttl_ao_vivo` segundos caso contrário
+    def valida(self, entrada):
+        return entrada["finalizada"] or time.time() - entrada["armazenado_em"] < self.ttl_ao_vivo
+
+    # Devolve o JSON da URL, usando o cache sempre que possível. Requisições de rede passam pelo limitador de taxa.
+    # A entrada fica guardada para sempre se `finalizada` for verdadeiro ou se a própria timeline indicar o fim do jogo.
+    def obter_json(self, session, url, chave, finalizada=False, timeout=10):
+        entrada = self.ler(chave)
+        if entrada is not None and self.valida(entrada):
+            self._contar("hits")
+            return entrada["dados"]
+
+        # Entrada expirada: pede ao servidor apenas se algo mudou desde a última versão
+        headers = {}
+        if entrada is not None:
+            if entrada.get("etag"):
+                headers["If-None-Match"] = entrada["etag"]
+            if entrada.get("last_modified"):
+                headers["If-Modified-Since"] = entrada["last_modified"]
+
+        response = limitador_fifa.get(session, url, headers=headers, timeout=timeout)
+        if response.status_code == 304 and entrada is not None:
+            # Nada mudou: só renova o horário da entrada
+            self._contar("revalidados")
+            entrada["armazenado_em"] = time.time()
+            entrada["finalizada"] = finalizada or timeline_encerrada(entrada["dados"])
+            self.gravar(chave, entrada)
+            return entrada["dados"]
+
+        response.raise_for_status()
+        dados = response.json()
+        self._contar("misses" if entrada is None else "atualizados")
+        self.gravar(chave, {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "armazenado_em": time.time(),
+            "finalizada": finalizada or timeline_encerrada(dados),
+            "dados": dados,
+        })
+        return dados
+
+    def metricas(self):
+        with self.lock:
+            return dict(self.contadores)
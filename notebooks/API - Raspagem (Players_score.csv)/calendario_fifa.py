@@ -0,0 +1,105 @@
+# Esse arquivo descobre as partidas de um intervalo de datas direto pelo calendário JSON da API da FIFA,
+# sem precisar abrir um navegador. Os links gerados têm o mesmo formato dos links coletados pelo Selenium.
+
+from datetime import datetime, timedelta
+from extrair_primeiro_gol_partidas import API_BASE_URL, get_shared_session
+from limitador_taxa import limitador_fifa
+from log_raspagem import obter_log
+from registro_partidas import ID_COMPETICAO_PADRAO, url_partida
+
+log = obter_log("calendario")
+
+# Quantidade de dias pedidos em cada requisição ao calendário
+DIAS_POR_REQUISICAO = 31
+
+# Quantidade máxima de partidas devolvidas por página do calendário
+PARTIDAS_POR_PAGINA = 500
+
+# Maior diferença entre a hora local de uma partida e a hora em UTC (UTC+14). O calendário é consultado em UTC,
+# mas as partidas são separadas pela data local, então a consulta é alargada nas duas pontas por essa margem
+# para não perder, por exemplo, um jogo noturno no Brasil que em UTC já cai no dia seguinte.
+MARGEM_FUSO_HORARIO = timedelta(hours=14)
+
+# Função que agrupa as datas em janelas contínuas de no máximo `dias` dias, para pedir várias datas por requisição
+def janelas_de_datas(datas, dias=DIAS_POR_REQUISICAO):
+    janelas = []
+    datas_ordenadas = sorted(datetime.strptime(data, '%Y-%m-%d') for data in datas)
+    for data in datas_ordenadas:
+        # Abre uma nova janela se a data não for o dia seguinte da janela atual ou se a janela já estiver cheia
+        if (not janelas
+                or data - janelas[-1][1] > timedelta(days=1)
+                or data - janelas[-1][0] >= timedelta(days=dias)):
+            janelas.append([data, data])
+        else:
+            janelas[-1][1] = data
+    return [(inicio, fim) for inicio, fim in janelas]
+
+# Função que busca no calendário todas as partidas da competição entre `inicio` e `fim` (inclusive).
+# A consulta cobre a margem de fuso horário, então também volta partidas de dias vizinhos; quem chama filtra pela data local.
+def buscar_partidas_calendario(inicio, fim, id_competicao=ID_COMPETICAO_PADRAO, base_url=None, session=None):
+    base_url = (base_url or API_BASE_URL).rstrip("/")
+    session = session or get_shared_session()
+    params = {
+        "from": (inicio - MARGEM_FUSO_HORARIO).strftime('%Y-%m-%dT%H:%M:%SZ'),
+        "to": (fim + timedelta(days=1) + MARGEM_FUSO_HORARIO - timedelta(seconds=1)).strftime('%Y-%m-%dT%H:%M:%SZ'),
+        "idCompetition": id_competicao,
+        "language": "pt",
+        "count": PARTIDAS_POR_PAGINA,
+    }
+
+    partidas = []
+    while True:
+        response = limitador_fifa.get(session, f"{base_url}/calendar/matches", params=params, timeout=10)
+        response.raise_for_status()
+        data = response.json()
+        partidas.extend(data.get("Results", []))
+
+        # O calendário é paginado: enquanto houver um token de continuação, pede a próxima página
+        token = data.get("ContinuationToken")
+        if not token or not data.get("Results"):
+            return partidas
+        params["continuationToken"] = token
+
+# Função que monta o link do match-centre a partir de uma partida do calendário
+def montar_link_partida(partida):
+    # Usa a data local da partida (a mesma exibida no site) e, na falta dela, a data em UTC
+    data = (partida.get("LocalDate") or partida.get("Date") or "")[:10]
+    return url_partida.format(
+        partida["IdCompetition"], partida["IdSeason"], partida["IdStage"], partida["IdMatch"], data
+    )
+
+# Função que devolve os links de todas as partidas das datas informadas, em ordem de data.
+# Se um estado de raspagem for informado, cada janela consultada é registrada nele assim que termina.
+# Os links são agrupados pela data local da partida, que é a chave usada no estado.
+def buscar_links_partidas_calendario(datas, id_competicao=ID_COMPETICAO_PADRAO, base_url=None, estado=None):
+    session = get_shared_session()
+    datas_pedidas = set(datas)
+
+    links_por_partida = {}
+    links_por_data = {}
+    for inicio, fim in janelas_de_datas(datas):
+        log.debug("Consultando o calendário de %s a %s", f"{inicio:%Y-%m-%d}", f"{fim:%Y-%m-%d}")
+        dias_da_janela = (f"{inicio:%Y-%m-%d}", f"{fim:%Y-%m-%d}")
+        for partida in buscar_partidas_calendario(inicio, fim, id_competicao, base_url, session):
+            link = montar_link_partida(partida)
+            data = link.rsplit("date=", 1)[-1]
+            # Ignora partidas cuja data local está fora da janela ou das datas pedidas (a consulta em UTC tem margem de fuso)
+            if (dias_da_janela[0] <= data <= dias_da_janela[1] and data in datas_pedidas
+                    and partida["IdMatch"] not in links_por_partida):
+                links_por_partida[partida["IdMatch"]] = link
+                links_por_data.setdefault(data, []).append(link)
+
+        # Com a margem de fuso a consulta já trouxe todas as partidas cuja data local cai na janela,
+        # inclusive os jogos noturnos do último dia, então os dias da janela podem ser registrados como completos
+        if estado is not None:
+            data_atual = inicio
+            while data_atual <= fim:
+                data = data_atual.strftime('%Y-%m-%d')
+                links_do_dia = links_por_data.get(data, [])
+                estado.registrar(data, links_do_dia, "ok" if links_do_dia else "vazio")
+                data_atual += timedelta(days=1)
+
+    # Ordena pela data da partida; partidas do mesmo dia mantêm a ordem do calendário
+    links = [link for data in sorted(links_por_data) for link in links_por_data[data]]
+    log.info("%d partidas encontradas no calendário", len(links))
+    return links
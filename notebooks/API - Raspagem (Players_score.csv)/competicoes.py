@@ -0,0 +1,71 @@
+# Esse arquivo lê a configuração das competições e temporadas coletadas (competicoes.json).
+# Cada competição informa o id da FIFA, a temporada, o intervalo de datas e onde gravar seus arquivos,
+# então uma nova liga ou temporada é só mais uma entrada no arquivo, sem mudar os scripts.
+
+import json
+import os
+from datetime import datetime, timedelta
+from urllib.parse import quote_plus
+
+# Arquivo padrão de configuração, ao lado dos scripts
+ARQUIVO_COMPETICOES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "competicoes.json")
+
+# Página do match-centre com as partidas de uma data, filtrada pela competição
+url_match_centre = "/pt/match-centre?date={}&sortBy=Popular&term={}&idCompetition={}"
+
+# Função que gera todas as datas entre `inicio` e `fim` (inclusive), no formato 'YYYY-MM-DD'
+def gerar_datas(inicio, fim):
+    data_atual = datetime.strptime(inicio, '%Y-%m-%d')
+    data_final = datetime.strptime(fim, '%Y-%m-%d')
+    datas = []
+    while data_atual <= data_final:
+        datas.append(data_atual.strftime('%Y-%m-%d'))
+        data_atual += timedelta(days=1)
+    return datas
+
+class Competicao:
+    def __init__(self, nome, id_competicao, inicio, fim, id_temporada=None, termo_busca="", diretorio_saida=None):
+        self.nome = nome
+        self.id_competicao = str(id_competicao)
+        self.id_temporada = id_temporada
+        self.inicio = inicio
+        self.fim = fim
+        self.termo_busca = termo_busca
+        # Sem diretório informado, cada competição grava seus arquivos em dados/<nome>
+        self.diretorio_saida = diretorio_saida or os.path.join("dados", nome)
+
+    def __repr__(self):
+        return f"Competicao({self.nome!r}, {self.id_competicao!r}, {self.inicio} a {self.fim})"
+
+    # Datas da temporada, usadas na busca dos links
+    def datas(self):
+        return gerar_datas(self.inicio, self.fim)
+
+    # URL (sem o endereço do site) da página do match-centre de uma data
+    def url_match_centre(self, data):
+        return url_match_centre.format(data, quote_plus(self.termo_busca), self.id_competicao)
+
+    # Caminho de um arquivo de saída da competição, criando a pasta se necessário
+    def caminho_saida(self, arquivo):
+        os.makedirs(self.diretorio_saida, exist_ok=True)
+        return os.path.join(self.diretorio_saida, arquivo)
+
+    # Filtros para consultar as partidas da competição no registro de partidas
+    def filtros_registro(self):
+        return {"id_competicao": self.id_competicao, "id_temporada": self.id_temporada,
+                "inicio": self.inicio, "fim": self.fim}
+
+# Carrega as competições do arquivo de configuração. Se `nomes` for informado, devolve só essas, na ordem pedida.
+def carregar_competicoes(caminho=ARQUIVO_COMPETICOES, nomes=None):
+    with open(caminho, "r", encoding="utf-8") as f:
+        competicoes = {item["nome"]: Competicao(**item) for item in json.load(f)["competicoes"]}
+    if not nomes:
+        return list(competicoes.values())
+    desconhecidas = [nome for nome in nomes if nome not in competicoes]
+    if desconhecidas:
+        raise ValueError(f"Competições não encontradas em {caminho}: {', '.join(desconhecidas)}")
+    return [competicoes[nome] for nome in nomes]
+
+# Primeira competição do arquivo, usada pelos scripts que tratam de uma competição só
+def competicao_padrao(caminho=ARQUIVO_COMPETICOES):
+    return carregar_competicoes(caminho)[0]
@@ -0,0 +1,118 @@
+# Esse arquivo contém um escritor de CSV que só acrescenta linhas (append-only), em lotes, e que pode ser retomado.
+# Junto do CSV ele mantém um diário (`<arquivo>.concluidos`) com os ids já processados em cada lote confirmado,
+# inclusive os que não geraram linha (ex.: partidas sem gol). Em uma nova execução esses ids são pulados.
+#
+# Cada confirmação (commit) grava as linhas no CSV e só depois registra no diário o tamanho final do arquivo
+# e os ids do lote. Se o processo cair no meio, o que passou do último tamanho registrado é descartado
+# ao reabrir, então um lote nunca fica pela metade. Vários processos podem escrever no mesmo arquivo:
+# as confirmações são serializadas por uma trava de arquivo.
+
+import csv
+import io
+import json
+import os
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: sem trava entre processos, apenas um processo por arquivo
+    fcntl = None
+
+class EscritorCSVResumivel:
+    def __init__(self, caminho, fieldnames, chave="event_id"):
+        self.caminho = caminho
+        self.caminho_diario = f"{caminho}.concluidos"
+        self.caminho_trava = f"{caminho}.lock"
+        self.fieldnames = fieldnames
+        self.chave = chave
+        self.concluidos = set()
+        self.posicao_diario = 0  # Até onde o diário já foi lido
+        self.tamanho_confirmado = 0  # Tamanho do CSV registrado na última confirmação lida ou feita
+        with self._trava():
+            self._recuperar()
+
+    @contextmanager
+    def _trava(self):
+        with open(self.caminho_trava, "a") as trava:
+            if fcntl is not None:
+                fcntl.flock(trava, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(trava, fcntl.LOCK_UN)
+
+    # Lê as confirmações do diário que ainda não foram vistas (inclusive as de outros processos).
+    # Devolve o tamanho do CSV registrado na última confirmação, ou None se o diário estiver vazio.
+    def _ler_diario(self):
+        ultimo_tamanho = None
+        if not os.path.exists(self.caminho_diario):
+            return ultimo_tamanho
+        with open(self.caminho_diario, "r", encoding="utf-8") as diario:
+            diario.seek(self.posicao_diario)
+            for linha in diario:
+                if not linha.endswith("\n"):
+                    break  # Linha incompleta: a confirmação não terminou
+                registro = json.loads(linha)
+                self.concluidos.update(registro["ids"])
+                ultimo_tamanho = registro["tamanho"]
+                self.tamanho_confirmado = ultimo_tamanho
+                self.posicao_diario += len(linha.encode("utf-8"))
+        return ultimo_tamanho
+
+    def _recuperar(self):
+        ultimo_tamanho = self._ler_diario()
+        if ultimo_tamanho is not None and not os.path.exists(self.caminho):
+            # O CSV foi apagado: o diário antigo não vale mais e tudo recomeça do zero
+            os.remove(self.caminho_diario)
+            self.concluidos.clear()
+            self.posicao_diario = 0
+            self.tamanho_confirmado = 0
+            ultimo_tamanho = None
+        if ultimo_tamanho is None:
+            # Arquivo novo: escreve o cabeçalho e o confirma como primeira entrada do diário
+            with open(self.caminho, "w", newline="", encoding="utf-8") as f:
+                csv.DictWriter(f, fieldnames=self.fieldnames).writeheader()
+            self._registrar([], os.path.getsize(self.caminho))
+        elif os.path.getsize(self.caminho) > ultimo_tamanho:
+            # Descarta linhas de um lote que não chegou a ser confirmado
+            with open(self.caminho, "r+b") as f:
+                f.truncate(ultimo_tamanho)
+
+    def _registrar(self, ids, tamanho):
+        # Reposiciona o fim do diário caso uma linha incompleta tenha ficado de uma queda anterior
+        with open(self.caminho_diario, "a+b") as diario:
+            diario.truncate(self.posicao_diario)
+            linha = (json.dumps({"tamanho": tamanho, "ids": list(ids)}) + "\n").encode("utf-8")
+            diario.write(linha)
+            diario.flush()
+            os.fsync(diario.fileno())
+        self.posicao_diario += len(linha)
+        self.tamanho_confirmado = tamanho
+        self.concluidos.update(ids)
+
+    def concluido(self, id_item):
+        return id_item in self.concluidos
+
+    # Confirma um lote: `linhas` são os dicionários a gravar e `ids` todos os ids processados no lote
+    def confirmar(self, linhas, ids):
+        with self._trava():
+            self._ler_diario()
+            # Outro processo pode ter confirmado os mesmos ids enquanto este lote era processado
+            novos_ids = [id_item for id_item in dict.fromkeys(ids) if id_item not in self.concluidos]
+            ids_do_lote = set(novos_ids)
+            novas_linhas = [linha for linha in linhas if linha[self.chave] in ids_do_lote]
+
+            buffer = io.StringIO()
+            csv.DictWriter(buffer, fieldnames=self.fieldnames).writerows(novas_linhas)
+            with open(self.caminho, "r+b") as f:
+                # Descarta linhas órfãs de outro processo que caiu antes de confirmar o lote dele,
+                # como em _recuperar, para que elas não entrem no tamanho desta confirmação
+                f.truncate(self.tamanho_confirmado)
+                f.seek(self.tamanho_confirmado)
+                f.write(buffer.getvalue().encode("utf-8"))
+                f.flush()
+                os.fsync(f.fileno())
+                tamanho = f.tell()
+            self._registrar(novos_ids, tamanho)
+        return len(novas_linhas)
@@ -0,0 +1,64 @@
+# Esse arquivo guarda o estado da raspagem em disco (situação de cada data, horário da última coleta e links encontrados).
+# Com ele, uma nova execução só visita as datas que ainda não foram coletadas ou que ainda podem mudar,
+# e uma raspagem interrompida continua de onde parou.
+
+import json
+import os
+import threading
+from datetime import datetime, timedelta
+
+# Arquivo padrão onde o estado é salvo
+ARQUIVO_ESTADO = "estado_raspagem.json"
+
+# Uma data só é considerada definitiva se foi coletada pelo menos esse tempo depois dela.
+# Antes disso os jogos do dia podem ainda não ter acontecido ou ter sido remarcados.
+MARGEM_DATA_DEFINITIVA = timedelta(days=2)
+
+class EstadoRaspagem:
+    def __init__(self, caminho=ARQUIVO_ESTADO):
+        self.caminho = caminho
+        self.lock = threading.Lock()
+        self.datas = {}
+        # Carrega o estado da execução anterior, se existir
+        if os.path.exists(caminho):
+            with open(caminho, "r", encoding="utf-8") as f:
+                self.datas = json.load(f).get("datas", {})
+
+    # Verifica se a data precisa ser (re)coletada
+    def precisa_coletar(self, data, agora=None):
+        registro = self.datas.get(data)
+        if registro is None or registro["status"] == "erro":
+            return True
+        agora = agora or datetime.now()
+        ultima_raspagem = datetime.fromisoformat(registro["ultima_raspagem"])
+        # Datas coletadas cedo demais são visitadas de novo, pois os jogos ainda podiam mudar
+        return ultima_raspagem < datetime.strptime(data, '%Y-%m-%d') + MARGEM_DATA_DEFINITIVA
+
+    # Filtra a lista de datas, mantendo a ordem, apenas com as que precisam ser coletadas
+    def datas_pendentes(self, datas):
+        agora = datetime.now()
+        return [data for data in datas if self.precisa_coletar(data, agora)]
+
+    # Registra o resultado de uma data e grava o estado em disco imediatamente (checkpoint)
+    def registrar(self, data, links, status):
+        with self.lock:
+            self.datas[data] = {
+                "status": status,  # "ok", "vazio" ou "erro"
+                "ultima_raspagem": datetime.now().isoformat(timespec="seconds"),
+                "links": list(links),
+            }
+            self.salvar()
+
+    # Devolve todos os links conhecidos das datas informadas, na ordem das datas
+    def links(self, datas):
+        todos_links = []
+        for data in datas:
+            todos_links.extend(self.datas.get(data, {}).get("links", []))
+        return todos_links
+
+    def salvar(self):
+        # Escreve em um arquivo temporário e depois troca, para que uma interrupção nunca deixe o estado corrompido
+        temporario = f"{self.caminho}.tmp"
+        with open(temporario, "w", encoding="utf-8") as f:
+            json.dump({"datas": self.datas}, f, ensure_ascii=False, indent=1, sort_keys=True)
+        os.replace(temporario, self.caminho)
@@ -0,0 +1,240 @@
+# Esse arquivo contém uma fila de trabalho em SQLite, para dividir uma raspagem entre vários processos
+# (na mesma máquina ou em várias máquinas que enxergam o mesmo volume).
+# Cada trabalhador pega um lote de tarefas (datas ou códigos de partidas) com um "aluguel" (lease) por tempo limitado
+# e o renova enquanto trabalha (batimento). Se o trabalhador morrer, o aluguel vence e as tarefas voltam para a fila.
+# Ao terminar, o trabalhador confirma as tarefas junto com o resultado em uma única transação, e a confirmação só vale
+# se o aluguel ainda for dele: uma tarefa que foi repassada a outro trabalhador nunca é confirmada duas vezes.
+#
+# Observação: o SQLite depende das travas de arquivo do sistema. Em volumes de rede o compartilhamento precisa
+# suportar travas POSIX (ex.: NFSv4 com lock habilitado).
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from log_raspagem import obter_log
+
+log = obter_log("fila_trabalho")
+
+# Arquivo padrão da fila
+ARQUIVO_FILA = "fila_trabalho.db"
+
+# Duração padrão do aluguel, em segundos. O batimento renova o aluguel a cada terço desse tempo.
+DURACAO_ALUGUEL = 120
+
+# Depois de tantas tentativas sem sucesso a tarefa é marcada como "erro" e sai da fila
+MAXIMO_TENTATIVAS = 5
+
+# Nome padrão do trabalhador: máquina e processo
+def nome_trabalhador():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+class FilaTrabalho:
+    def __init__(self, caminho=ARQUIVO_FILA, fila="padrao", trabalhador=None, duracao_aluguel=DURACAO_ALUGUEL,
+                 maximo_tentativas=MAXIMO_TENTATIVAS):
+        self.caminho = caminho
+        self.fila = fila
+        self.trabalhador = trabalhador or nome_trabalhador()
+        self.duracao_aluguel = duracao_aluguel
+        self.maximo_tentativas = maximo_tentativas
+        self.lock = threading.Lock()  # A conexão é usada também pela thread do batimento
+        # isolation_level=None: as transações são abertas explicitamente com BEGIN IMMEDIATE
+        self.conexao = sqlite3.connect(caminho, timeout=60, isolation_level=None, check_same_thread=False)
+        with self._transacao():
+            self.conexao.execute(
+                """CREATE TABLE IF NOT EXISTS tarefas (
+                       fila TEXT NOT NULL,
+                       chave TEXT NOT NULL,
+                       estado TEXT NOT NULL DEFAULT 'pendente',
+                       trabalhador TEXT,
+                       aluguel TEXT,
+                       aluguel_ate REAL,
+                       tentativas INTEGER NOT NULL DEFAULT 0,
+                       resultado TEXT,
+                       concluida_em REAL,
+                       PRIMARY KEY (fila, chave)
+                   )"""
+            )
+            self.conexao.execute("CREATE INDEX IF NOT EXISTS idx_tarefas_estado ON tarefas (fila, estado, aluguel_ate)")
+
+    # Transação com trava de escrita desde o início, para que dois trabalhadores nunca peguem a mesma tarefa
+    @contextmanager
+    def _transacao(self):
+        with self.lock:
+            self.conexao.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self.conexao.execute("ROLLBACK")
+                raise
+            self.conexao.execute("COMMIT")
+
+    # Coloca tarefas na fila. Tarefas que já existem (em qualquer estado) são mantidas como estão,
+    # então todos os trabalhadores podem enfileirar a mesma lista ao iniciar.
+    def enfileirar(self, chaves):
+        with self._transacao():
+            antes = self.conexao.total_changes
+            self.conexao.executemany(
+                "INSERT OR IGNORE INTO tarefas (fila, chave) VALUES (?, ?)", ((self.fila, chave) for chave in chaves)
+            )
+            return self.conexao.total_changes - antes
+
+    # Volta tarefas já concluídas (ou com erro) para a fila, para serem refeitas
+    def reabrir(self, chaves):
+        with self._transacao():
+            self.conexao.executemany(
+                "UPDATE tarefas SET estado = 'pendente', tentativas = 0, aluguel = NULL, aluguel_ate = NULL "
+                "WHERE fila = ? AND chave = ? AND estado != 'em_andamento'",
+                ((self.fila, chave) for chave in chaves),
+            )
+
+    # Pega até `quantidade` tarefas livres (pendentes ou com aluguel vencido), na ordem em que foram enfileiradas.
+    # Um aluguel vencido que já esgotou as tentativas (o trabalhador morreu todas as vezes, sem chegar a liberar
+    # a tarefa) vira "erro" em vez de ser repassado de novo.
+    def reivindicar(self, quantidade):
+        agora = time.time()
+        aluguel = uuid.uuid4().hex
+        with self._transacao():
+            self.conexao.execute(
+                "UPDATE tarefas SET estado = 'erro', aluguel = NULL, aluguel_ate = NULL "
+                "WHERE fila = ? AND estado = 'em_andamento' AND aluguel_ate < ? AND tentativas >= ?",
+                (self.fila, agora, self.maximo_tentativas),
+            )
+            chaves = [linha[0] for linha in self.conexao.execute(
+                "SELECT chave FROM tarefas WHERE fila = ? AND "
+                "(estado = 'pendente' OR (estado = 'em_andamento' AND aluguel_ate < ?)) "
+                "ORDER BY rowid LIMIT ?",
+                (self.fila, agora, quantidade),
+            )]
+            self.conexao.executemany(
+                "UPDATE tarefas SET estado = 'em_andamento', trabalhador = ?, aluguel = ?, aluguel_ate = ?, "
+                "tentativas = tentativas + 1 WHERE fila = ? AND chave = ?",
+                ((self.trabalhador, aluguel, agora + self.duracao_aluguel, self.fila, chave) for chave in chaves),
+            )
+        return Lote(self, aluguel, chaves)
+
+    # Estende o aluguel das tarefas do lote que ainda pertencem a ele
+    def renovar(self, lote):
+        with self._transacao():
+            self.conexao.execute(
+                "UPDATE tarefas SET aluguel_ate = ? WHERE fila = ? AND aluguel = ? AND estado = 'em_andamento'",
+                (time.time() + self.duracao_aluguel, self.fila, lote.aluguel),
+            )
+
+    # Confirma tarefas do lote com seus resultados (qualquer valor serializável em JSON).
+    # Devolve as chaves efetivamente confirmadas: as que já tinham sido repassadas a outro trabalhador ficam de fora.
+    def concluir(self, lote, resultados):
+        confirmadas = []
+        agora = time.time()
+        with self._transacao():
+            for chave, resultado in resultados.items():
+                cursor = self.conexao.execute(
+                    "UPDATE tarefas SET estado = 'concluida', resultado = ?, concluida_em = ?, aluguel_ate = NULL "
+                    "WHERE fila = ? AND chave = ? AND aluguel = ? AND estado = 'em_andamento'",
+                    (json.dumps(resultado, ensure_ascii=False), agora, self.fila, chave, lote.aluguel),
+                )
+                if cursor.rowcount == 1:
+                    confirmadas.append(chave)
+        return confirmadas
+
+    # Devolve tarefas do lote para a fila (ex.: após um erro); quem passou do limite de tentativas vira "erro"
+    def liberar(self, lote, chaves):
+        with self._transacao():
+            self.conexao.executemany(
+                "UPDATE tarefas SET estado = CASE WHEN tentativas >= ? THEN 'erro' ELSE 'pendente' END, "
+                "aluguel = NULL, aluguel_ate = NULL WHERE fila = ? AND chave = ? AND aluguel = ? AND estado = 'em_andamento'",
+                ((self.maximo_tentativas, self.fila, chave, lote.aluguel) for chave in chaves),
+            )
+
+    # Resultados das tarefas concluídas, na ordem em que foram enfileiradas
+    def resultados(self, chaves=None):
+        with self.lock:
+            linhas = self.conexao.execute(
+                "SELECT chave, resultado FROM tarefas WHERE fila = ? AND estado = 'concluida' ORDER BY rowid",
+                (self.fila,),
+            ).fetchall()
+        filtro = None if chaves is None else set(chaves)
+        return {chave: json.loads(resultado) for chave, resultado in linhas if filtro is None or chave in filtro}
+
+    # Quantidade de tarefas em cada estado
+    def situacao(self):
+        with self.lock:
+            contagem = dict(self.conexao.execute(
+                "SELECT estado, COUNT(*) FROM tarefas WHERE fila = ? GROUP BY estado", (self.fila,)
+            ).fetchall())
+        return {estado: contagem.get(estado, 0) for estado in ("pendente", "em_andamento", "concluida", "erro")}
+
+    # A fila terminou quando não há nada pendente nem em andamento
+    def terminada(self):
+        situacao = self.situacao()
+        return situacao["pendente"] == 0 and situacao["em_andamento"] == 0
+
+    def fechar(self):
+        self.conexao.close()
+
+# Tarefas reivindicadas juntas, sob o mesmo aluguel
+class Lote:
+    def __init__(self, fila, aluguel, chaves):
+        self.fila = fila
+        self.aluguel = aluguel
+        self.chaves = chaves
+
+    def __len__(self):
+        return len(self.chaves)
+
+    # Mantém o aluguel vivo enquanto o bloco `with` estiver rodando
+    @contextmanager
+    def batimento(self):
+        parar = threading.Event()
+
+        def renovar_periodicamente():
+            while not parar.wait(self.fila.duracao_aluguel / 3):
+                # Uma falha (ex.: "database is locked") não pode encerrar o batimento: tenta de novo no próximo ciclo
+                try:
+                    self.fila.renovar(self)
+                except Exception as e:
+                    log.warning("[%s] Erro ao renovar o aluguel do lote: %s", self.fila.trabalhador, e)
+
+        thread = threading.Thread(target=renovar_periodicamente, daemon=True)
+        thread.start()
+        try:
+            yield self
+        finally:
+            parar.set()
+            thread.join()
+
+    def concluir(self, resultados):
+        return self.fila.concluir(self, resultados)
+
+    def liberar(self, chaves=None):
+        self.fila.liberar(self, self.chaves if chaves is None else chaves)
+
+# Laço de um trabalhador: pega lotes de `tamanho_lote` tarefas e chama `processar(chaves)`, que devolve
+# {chave: resultado} das tarefas bem-sucedidas. As demais voltam para a fila. Termina quando a fila acaba.
+def trabalhar(fila, processar, tamanho_lote, espera=5):
+    while True:
+        lote = fila.reivindicar(tamanho_lote)
+        if not lote:
+            if fila.terminada():
+                return
+            # Outros trabalhadores ainda estão com tarefas; se algum morrer, o aluguel vence e elas voltam
+            time.sleep(espera)
+            continue
+        with lote.batimento():
+            try:
+                resultados = processar(lote.chaves)
+            except BaseException:
+                lote.liberar()
+                raise
+            confirmadas = set(lote.concluir(resultados))
+        falhas = [chave for chave in lote.chaves if chave not in resultados]
+        if falhas:
+            lote.liberar(falhas)
+        perdidas = len(resultados) - len(confirmadas)
+        log.info("[%s] %d tarefas confirmadas, %d devolvidas à fila%s | fila: %s", fila.trabalhador, len(confirmadas),
+                 len(falhas), f", {perdidas} já confirmadas por outro trabalhador" if perdidas else "", fila.situacao(),
+                 extra={"amostra": "lote_fila"} if not falhas and not perdidas else None)
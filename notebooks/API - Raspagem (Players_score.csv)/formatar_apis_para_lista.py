@@ -1,8 +1,12 @@
-# Abre o arquivo 'unique_urls777.txt' que contém os links das APIs, uma por linha
-with open('unique_urls777.txt', 'r') as file:
-    apis = file.readlines()  # Lê todas as linhas do arquivo, cada linha contendo uma URL
+from competicoes import competicao_padrao
+from registro_partidas import RegistroPartidas
 
-# Processa cada linha para remover caracteres como quebras de linha e adiciona aspas em volta de cada URL
+# Busca no registro os códigos das partidas (as APIs) da competição padrão, um por partida
+registro = RegistroPartidas()
+apis = registro.codigos(**competicao_padrao().filtros_registro())
+registro.fechar()
+
+# Adiciona aspas em volta de cada código
 formatted_apis = ['"' + api.strip() + '"' for api in apis]
 
 # Junta todos os links formatados em uma única string, separando-os por vírgulas e espaços
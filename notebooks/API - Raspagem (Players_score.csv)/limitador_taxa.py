@@ -0,0 +1,147 @@
+# Esse arquivo contém o limitador de taxa adaptativo usado por todos os scripts que acessam a FIFA.
+# Ele combina um balde de fichas (token bucket), que controla quantas requisições por segundo saem,
+# com um controle AIMD (aumento aditivo, redução multiplicativa) da taxa e da concorrência:
+# enquanto o servidor responde bem e rápido, o limite sobe aos poucos; ao receber um 429 (ou uma resposta lenta), cai pela metade.
+# Como no TCP, até o primeiro recuo o limite cresce exponencialmente ("partida lenta"), para achar logo o ritmo que o servidor aguenta.
+
+import threading
+import time
+
+# Códigos HTTP que indicam que estamos sobrecarregando o servidor
+STATUS_SOBRECARGA = {429, 503}
+
+class LimitadorAdaptativo:
+    def __init__(self, taxa_inicial=2.0, taxa_minima=0.1, taxa_maxima=20.0,
+                 concorrencia_inicial=2, concorrencia_maxima=16,
+                 latencia_alvo=2.0, incremento_taxa=0.5, fator_reducao=0.5):
+        self.taxa = taxa_inicial                # Requisições por segundo liberadas pelo balde
+        self.taxa_minima = taxa_minima
+        self.taxa_maxima = taxa_maxima
+        self.limite_concorrencia = float(concorrencia_inicial)  # Requisições simultâneas permitidas
+        self.concorrencia_maxima = concorrencia_maxima
+        self.latencia_alvo = latencia_alvo      # Respostas mais lentas que isso contam como sinal de sobrecarga
+        self.incremento_taxa = incremento_taxa  # Quanto a taxa sobe (req/s) a cada segundo de respostas boas
+        self.fator_reducao = fator_reducao      # Fator aplicado à taxa e à concorrência em cada recuo
+
+        self.lock = threading.Lock()
+        self.fichas = 1.0
+        self.ultimo_reabastecimento = time.monotonic()
+        self.pausado_ate = 0.0      # Instante até o qual nenhuma requisição sai (Retry-After)
+        self.limiar_partida_lenta = taxa_maxima  # Abaixo dessa taxa o crescimento é exponencial
+        self.ultimo_recuo = 0.0
+        self.em_andamento = 0
+        self.aguardando = 0         # Tamanho da fila de requisições esperando a vez
+
+        # Contadores expostos em metricas()
+        self.requisicoes = 0
+        self.respostas_sobrecarga = 0
+        self.eventos_backoff = 0
+
+    # Tenta reservar uma vaga. Devolve 0 se conseguiu ou quantos segundos esperar antes de tentar de novo.
+    def _tentar_adquirir(self):
+        with self.lock:
+            agora = time.monotonic()
+            # Reabastece o balde de acordo com o tempo passado, sem passar da capacidade (rajada de 1 segundo)
+            capacidade = max(1.0, self.taxa)
+            self.fichas = min(capacidade, self.fichas + (agora - self.ultimo_reabastecimento) * self.taxa)
+            self.ultimo_reabastecimento = agora
+
+            if agora < self.pausado_ate:
+                return self.pausado_ate - agora
+            if self.em_andamento >= int(self.limite_concorrencia):
+                return 0.05  # Espera alguma requisição em andamento terminar
+            if self.fichas < 1.0:
+                return (1.0 - self.fichas) / self.taxa
+
+            self.fichas -= 1.0
+            self.em_andamento += 1
+            self.requisicoes += 1
+            return 0.0
+
+    # Bloqueia a thread atual até que a requisição possa sair
+    def adquirir(self):
+        with self.lock:
+            self.aguardando += 1
+        try:
+            while True:
+                espera = self._tentar_adquirir()
+                if espera == 0:
+                    return
+                time.sleep(espera)
+        finally:
+            with self.lock:
+                self.aguardando -= 1
+
+    # Libera a vaga e ajusta os limites de acordo com a resposta recebida
+    def liberar(self, status=None, latencia=None, retry_after=None):
+        with self.lock:
+            agora = time.monotonic()
+            self.em_andamento -= 1
+
+            sobrecarga = status in STATUS_SOBRECARGA
+            lenta = latencia is not None and latencia > self.latencia_alvo
+            if sobrecarga:
+                self.respostas_sobrecarga += 1
+                if retry_after:
+                    self.pausado_ate = max(self.pausado_ate, agora + retry_after)
+
+            if sobrecarga or lenta:
+                # Redução multiplicativa. Respostas de requisições que já estavam em voo quando recuamos
+                # não reduzem de novo: só um recuo por intervalo de latência alvo.
+                if agora - self.ultimo_recuo >= self.latencia_alvo:
+                    self.taxa = max(self.taxa_minima, self.taxa * self.fator_reducao)
+                    self.limite_concorrencia = max(1.0, self.limite_concorrencia * self.fator_reducao)
+                    self.limiar_partida_lenta = self.taxa
+                    self.ultimo_recuo = agora
+                    self.eventos_backoff += 1
+            elif status is not None and status < 400:
+                if self.taxa < self.limiar_partida_lenta:
+                    # Partida lenta: cada resposta boa soma 1, então taxa e concorrência dobram a cada "janela"
+                    self.taxa = min(self.taxa_maxima, self.taxa + 1.0)
+                    self.limite_concorrencia = min(self.concorrencia_maxima, self.limite_concorrencia + 1.0)
+                else:
+                    # Aumento aditivo: com `taxa` respostas por segundo, a taxa sobe `incremento_taxa` a cada segundo
+                    # e a concorrência sobe 1 a cada "janela" completa de respostas boas (como no TCP)
+                    self.taxa = min(self.taxa_maxima, self.taxa + self.incremento_taxa / max(self.taxa, 1.0))
+                    self.limite_concorrencia = min(self.concorrencia_maxima,
+                                                   self.limite_concorrencia + 1.0 / self.limite_concorrencia)
+
+    # Faz um GET respeitando o limitador. Respostas 429/503 são repetidas após o recuo, até `tentativas` vezes.
+    def get(self, session, url, tentativas=5, **kwargs):
+        for tentativa in range(tentativas):
+            self.adquirir()
+            inicio = time.monotonic()
+            status = None
+            retry_after = None
+            try:
+                response = session.get(url, **kwargs)
+                status = response.status_code
+                retry_after = ler_retry_after(response.headers.get("Retry-After"))
+            finally:
+                self.liberar(status, time.monotonic() - inicio, retry_after)
+
+            if status not in STATUS_SOBRECARGA or tentativa == tentativas - 1:
+                return response
+
+    # Retrato do estado atual do limitador
+    def metricas(self):
+        with self.lock:
+            return {
+                "taxa_atual": round(self.taxa, 3),
+                "limite_concorrencia": int(self.limite_concorrencia),
+                "em_andamento": self.em_andamento,
+                "fila": self.aguardando,
+                "requisicoes": self.requisicoes,
+                "respostas_sobrecarga": self.respostas_sobrecarga,
+                "eventos_backoff": self.eventos_backoff,
+            }
+
+# Converte o cabeçalho Retry-After (em segundos) para número; datas HTTP são ignoradas
+def ler_retry_after(valor):
+    try:
+        return float(valor) if valor is not None else None
+    except ValueError:
+        return None
+
+# Limitador compartilhado por todo o tráfego HTTP com a API da FIFA (calendário e timelines)
+limitador_fifa = LimitadorAdaptativo()
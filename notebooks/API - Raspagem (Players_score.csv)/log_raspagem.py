@@ -0,0 +1,140 @@
+# Esse arquivo configura os logs dos scripts de raspagem, no lugar dos print() espalhados pelos laços de ingestão.
+# Todos os scripts usam loggers abaixo de "raspagem" (ex.: "raspagem.webscrapping"), com níveis:
+#   DEBUG   -> um registro por item (cada gol, cada página); desligado por padrão e sem custo quando desligado
+#   INFO    -> resumos de progresso (itens/s, ETA, erros) e o início/fim de cada etapa
+#   WARNING -> erros de requisição e itens que serão tentados de novo
+# Mensagens por item em nível INFO são amostradas (uma a cada N), para não inundar o terminal em coletas grandes.
+# Com --log-formato json cada linha é um objeto JSON, com os campos extras de cada registro.
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+
+# Logger raiz dos scripts de raspagem
+LOGGER_RAIZ = "raspagem"
+
+# Nível padrão, que pode ser trocado pela variável de ambiente LOG_NIVEL
+NIVEL_PADRAO = os.environ.get("LOG_NIVEL", "INFO")
+
+# Das mensagens por item marcadas para amostragem, só uma a cada AMOSTRAGEM_PADRAO é exibida
+AMOSTRAGEM_PADRAO = 50
+
+# Intervalo mínimo, em segundos, entre dois resumos de progresso da mesma etapa
+INTERVALO_PROGRESSO = 10
+
+# Atributos que todo LogRecord tem; o que sobrar são os campos extras do registro
+_CAMPOS_PADRAO = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+def obter_log(nome):
+    return logging.getLogger(f"{LOGGER_RAIZ}.{nome}")
+
+class FormatadorJSON(logging.Formatter):
+    def format(self, record):
+        dados = {
+            "momento": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "nivel": record.levelname,
+            "logger": record.name,
+            "mensagem": record.getMessage(),
+        }
+        dados.update({chave: valor for chave, valor in vars(record).items() if chave not in _CAMPOS_PADRAO})
+        if record.exc_info:
+            dados["excecao"] = self.formatException(record.exc_info)
+        return json.dumps(dados, ensure_ascii=False, default=str)
+
+# Deixa passar só uma a cada `a_cada` mensagens de cada tipo marcado com extra={"amostra": "<tipo>"}.
+# Avisos e erros nunca são descartados.
+class FiltroAmostragem(logging.Filter):
+    def __init__(self, a_cada=AMOSTRAGEM_PADRAO):
+        super().__init__()
+        self.a_cada = a_cada
+        self.contagens = {}
+        self.lock = threading.Lock()
+
+    def filter(self, record):
+        tipo = getattr(record, "amostra", None)
+        if tipo is None or record.levelno >= logging.WARNING or self.a_cada <= 1:
+            return True
+        with self.lock:
+            contagem = self.contagens[tipo] = self.contagens.get(tipo, 0) + 1
+        return (contagem - 1) % self.a_cada == 0
+
+def configurar_log(nivel=NIVEL_PADRAO, formato="texto", arquivo=None, amostragem=AMOSTRAGEM_PADRAO):
+    raiz = logging.getLogger(LOGGER_RAIZ)
+    raiz.setLevel(nivel.upper() if isinstance(nivel, str) else nivel)
+    raiz.propagate = False
+    for handler in list(raiz.handlers):
+        raiz.removeHandler(handler)
+        handler.close()
+
+    handler = logging.FileHandler(arquivo, encoding="utf-8") if arquivo else logging.StreamHandler(sys.stderr)
+    if formato == "json":
+        handler.setFormatter(FormatadorJSON())
+    else:
+        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)-7s %(name)s: %(message)s", "%H:%M:%S"))
+    handler.addFilter(FiltroAmostragem(amostragem))
+    raiz.addHandler(handler)
+    return raiz
+
+# Opções de linha de comando comuns a todos os scripts
+def adicionar_argumentos_log(parser):
+    grupo = parser.add_argument_group("logs")
+    grupo.add_argument("--log-nivel", default=NIVEL_PADRAO, choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+                       type=str.upper, help="Nível mínimo das mensagens (DEBUG mostra cada item)")
+    grupo.add_argument("--log-formato", default="texto", choices=["texto", "json"], help="Formato das linhas de log")
+    grupo.add_argument("--log-arquivo", help="Grava os logs nesse arquivo em vez de exibi-los no terminal")
+    grupo.add_argument("--log-amostragem", type=int, default=AMOSTRAGEM_PADRAO,
+                       help="Exibe só uma a cada N mensagens por item em nível INFO")
+
+def configurar_log_dos_argumentos(args):
+    return configurar_log(args.log_nivel, args.log_formato, args.log_arquivo, args.log_amostragem)
+
+def formatar_duracao(segundos):
+    segundos = int(segundos)
+    return f"{segundos // 3600:d}:{segundos // 60 % 60:02d}:{segundos % 60:02d}"
+
+# Acompanha o andamento de uma etapa e registra, no máximo a cada `intervalo` segundos,
+# um resumo com itens feitos, itens por segundo, tempo restante estimado e erros.
+class Progresso:
+    def __init__(self, log, etapa, total=None, unidade="itens", intervalo=INTERVALO_PROGRESSO):
+        self.log = log
+        self.etapa = etapa
+        self.total = total
+        self.unidade = unidade
+        self.intervalo = intervalo
+        self.feitos = 0
+        self.erros = 0
+        self.inicio = time.monotonic()
+        self.ultimo_resumo = self.inicio
+        self.lock = threading.Lock()
+
+    def avancar(self, quantidade=1, erros=0):
+        with self.lock:
+            self.feitos += quantidade
+            self.erros += erros
+            agora = time.monotonic()
+            if agora - self.ultimo_resumo < self.intervalo:
+                return
+            self.ultimo_resumo = agora
+        self._resumir()
+
+    def concluir(self):
+        self._resumir(final=True)
+
+    def _resumir(self, final=False):
+        decorrido = time.monotonic() - self.inicio
+        taxa = self.feitos / decorrido if decorrido else 0.0
+        campos = {"etapa": self.etapa, "feitos": self.feitos, "total": self.total, "erros": self.erros,
+                  "por_segundo": round(taxa, 2), "decorrido_s": round(decorrido, 1)}
+        andamento = f"{self.feitos}"
+        if self.total:
+            andamento += f"/{self.total} ({self.feitos / self.total:.0%})"
+        mensagem = f"{self.etapa}: {andamento} {self.unidade} | {taxa:.1f} {self.unidade}/s | {self.erros} erros"
+        if final:
+            mensagem += f" | concluído em {formatar_duracao(decorrido)}"
+        elif self.total and taxa:
+            campos["eta_s"] = round((self.total - self.feitos) / taxa, 1)
+            mensagem += f" | ETA {formatar_duracao(campos['eta_s'])}"
+        self.log.info(mensagem, extra={"progresso": campos})
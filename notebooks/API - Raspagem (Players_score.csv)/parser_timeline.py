@@ -0,0 +1,169 @@
+# Esse arquivo extrai os gols das timelines da API da FIFA de forma rápida, para lotes grandes de respostas
+# (ex.: a temporada inteira guardada no arquivo de respostas ou nas fixtures).
+# As respostas são decodificadas com o orjson, quando instalado, a expressão regular do jogador/time é compilada
+# uma única vez e os gols vão direto para as colunas de um LoteGols, sem criar um objeto por gol.
+#
+# Benchmark: python parser_timeline.py --fixtures fixtures
+#            python parser_timeline.py --arquivo respostas_partidas.pack
+
+import argparse
+import glob
+import json
+import logging
+import os
+import re
+import time
+from log_raspagem import obter_log
+from tipos_partida import GoalEvent, LoteGols
+
+try:
+    import orjson
+    carregar_json = orjson.loads
+except ImportError:  # Sem o orjson, usa o decodificador da biblioteca padrão
+    carregar_json = json.loads
+
+log = obter_log("parser_timeline")
+
+# Descrição usada pela API para os eventos de gol
+DESCRICAO_GOL = "Gol!"
+
+# Padrão das descrições dos eventos: "Nome do Jogador (Time)"
+padrao_jogador_time = re.compile(r"(.*?)\s*\((.*?)\)")
+
+# Nome usado quando a timeline não informa o time
+TIME_DESCONHECIDO = "Desconhecido"
+
+def nome_time(data, lado):
+    return data.get(lado, {}).get("TeamName", [{"Description": TIME_DESCONHECIDO}])[0].get("Description")
+
+# Percorre os gols de uma timeline (JSON já decodificado, ou bytes/texto da resposta) e devolve
+# (time da casa, time de fora, quantidade de eventos, gols), com cada gol como uma tupla na ordem do GoalEvent
+def _gols(match_code, data):
+    if isinstance(data, (bytes, str)):
+        data = carregar_json(data)
+    home_team = nome_time(data, "Home")
+    away_team = nome_time(data, "Away")
+    eventos = data.get("Event") or ()
+    buscar_jogador_time = padrao_jogador_time.search
+    # O nível é consultado uma vez por timeline: com DEBUG desligado, os gols não geram nenhuma mensagem
+    depurar = log.isEnabledFor(logging.DEBUG)
+
+    gols = []
+    for event in eventos:
+        for tipo in event.get("TypeLocalized") or ():
+            if tipo.get("Description") == DESCRICAO_GOL:
+                break
+        else:
+            continue
+        description = (event.get("EventDescription") or ({},))[0].get("Description", "")
+        jogador_time = buscar_jogador_time(description)
+        if jogador_time:
+            gol = (match_code, home_team, away_team, jogador_time.group(1), jogador_time.group(2),
+                   event.get("Minute", 0), event.get("HomeGoals", 0), event.get("AwayGoals", 0))
+            gols.append(gol)
+            if depurar:
+                log.debug("Gol encontrado: Jogador=%s, Time=%s, Minuto=%s, Placar=(%s, %s)", *gol[3:])
+    return home_team, away_team, len(eventos), gols
+
+# Gols de uma timeline como GoalEvent: devolve (time da casa, time de fora, gols)
+def gols_da_timeline(match_code, data):
+    home_team, away_team, _, gols = _gols(match_code, data)
+    return home_team, away_team, [GoalEvent(*gol) for gol in gols]
+
+# Extrai os gols de várias respostas de uma vez. `respostas` é uma sequência de (código da partida, resposta).
+# Os gols são acrescentados a `lote` (um LoteGols novo, se não for informado), que é devolvido junto
+# com a quantidade de eventos percorridos.
+def analisar_lote(respostas, lote=None):
+    lote = LoteGols() if lote is None else lote
+    adicionar = lote.adicionar_valores
+    total_eventos = 0
+    for match_code, data in respostas:
+        _, _, quantidade_eventos, gols = _gols(match_code, data)
+        total_eventos += quantidade_eventos
+        for gol in gols:
+            adicionar(*gol)
+    return lote, total_eventos
+
+# Implementação anterior (a do get_match_details), mantida só para comparação no benchmark
+def _gols_referencia(match_code, resposta):
+    data = json.loads(resposta)
+    home_team = data.get("Home", {}).get("TeamName", [{"Description": "Desconhecido"}])[0].get("Description")
+    away_team = data.get("Away", {}).get("TeamName", [{"Description": "Desconhecido"}])[0].get("Description")
+    goals = []
+    for event in data.get("Event", []):
+        if any(type_loc.get("Description") == "Gol!" for type_loc in event.get("TypeLocalized", [])):
+            description = event.get("EventDescription", [{}])[0].get("Description", "")
+            player_name_match = re.search(r"(.*?)\s*\((.*?)\)", description)
+            if player_name_match:
+                score = (event.get("HomeGoals", 0), event.get("AwayGoals", 0))
+                goals.append({
+                    "event_id": match_code, "home_team": home_team, "away_team": away_team,
+                    "player_name": player_name_match.group(1), "team_name": player_name_match.group(2),
+                    "match_minute": event.get("Minute", 0), "score": f"{score[0]} - {score[1]}",
+                })
+    return goals, len(data.get("Event", []))
+
+# Respostas gravadas, em memória, para que o benchmark meça só a extração (e não a leitura do disco)
+def carregar_respostas(fixtures=None, arquivo=None):
+    if arquivo:
+        from arquivo_respostas import ArquivoRespostas
+
+        pacote = ArquivoRespostas(arquivo)
+        respostas = [(chave.split("/", 1)[1], pacote.ler_bruto(chave)) for chave in pacote.chaves()]
+        pacote.fechar()
+        return respostas
+    respostas = []
+    for caminho in sorted(glob.glob(os.path.join(fixtures, "timelines", "*", "*", "*", "*.json"))):
+        *_, id_temporada, id_fase, nome = caminho.split(os.sep)
+        with open(caminho, "rb") as f:
+            respostas.append((f"{id_temporada}/{id_fase}/{nome[:-5]}", f.read()))
+    return respostas
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark da extração de gols das timelines gravadas")
+    parser.add_argument("--fixtures", default="fixtures", help="Pasta de fixtures do servidor local")
+    parser.add_argument("--arquivo", help="Arquivo de respostas (arquivo_respostas.py), no lugar das fixtures")
+    parser.add_argument("--repeticoes", type=int, default=5, help="Quantidade de repetições; vale a mais rápida")
+    args = parser.parse_args()
+
+    respostas = carregar_respostas(args.fixtures, args.arquivo)
+    if not respostas:
+        print("Nenhuma resposta gravada encontrada")
+        return
+    print(f"{len(respostas)} respostas carregadas, decodificador JSON: {carregar_json.__module__}")
+
+    def medir(funcao):
+        melhor = None
+        for _ in range(args.repeticoes):
+            inicio = time.perf_counter()
+            resultado = funcao()
+            duracao = time.perf_counter() - inicio
+            melhor = duracao if melhor is None else min(melhor, duracao)
+        return resultado, melhor
+
+    def referencia():
+        gols, eventos = [], 0
+        for match_code, resposta in respostas:
+            gols_partida, eventos_partida = _gols_referencia(match_code, resposta)
+            gols.extend(gols_partida)
+            eventos += eventos_partida
+        return gols, eventos
+
+    (gols_antes, eventos), duracao_antes = medir(referencia)
+    (lote, _), duracao_depois = medir(lambda: analisar_lote(respostas))
+
+    # Os dois caminhos precisam chegar exatamente às mesmas linhas do CSV
+    linhas_depois = list(lote.linhas())
+    for linha in gols_antes:
+        linha["match_minute"] = str(linha["match_minute"])
+    if linhas_depois != gols_antes:
+        raise SystemExit("As extrações divergem: o parser não reproduz a implementação anterior")
+
+    print(f"{eventos} eventos, {len(lote)} gols")
+    for nome, duracao in (("anterior", duracao_antes), ("parser_timeline", duracao_depois)):
+        print(f"{nome:>16}: {duracao * 1000:8.1f} ms | {eventos / duracao:12,.0f} eventos/s | "
+              f"{len(respostas) / duracao:10,.0f} partidas/s")
+    print(f"Ganho: {duracao_antes / duracao_depois:.1f}x")
+
+if __name__ == "__main__":
+    main()
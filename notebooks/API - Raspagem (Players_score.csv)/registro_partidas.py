@@ -0,0 +1,141 @@
+# Esse arquivo mantém o registro das partidas conhecidas em um banco SQLite indexado.
+# Cada partida aparece uma única vez, identificada pela sua chave canônica: competição, temporada, fase, partida e data.
+# O webscrapping.py grava no registro os links que encontra e os demais scripts (extrair_codigos_partidas.py,
+# urls_unicas.py, formatar_apis_para_lista.py e extrair_primeiro_gol_partidas.py) consultam o registro,
+# no lugar das listas de URLs que antes eram copiadas e coladas no código.
+
+import csv
+import os
+import re
+import sqlite3
+
+# Banco padrão do registro
+ARQUIVO_REGISTRO = "partidas.db"
+
+# Partidas já conhecidas (Brasileirão 2024), importadas quando o registro é criado
+ARQUIVO_SEMENTE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "partidas_semente.csv")
+
+# Competição usada quando o link ou código não informa uma (Brasileirão Série A)
+ID_COMPETICAO_PADRAO = "2000000078"
+
+# Formato dos links das partidas no match-centre (competição/temporada/fase/partida?date=...)
+url_partida = "https://www.fifa.com/pt/match-centre/match/{}/{}/{}/{}?date={}"
+
+# Aceita tanto o caminho do link completo do match-centre quanto o do código usado na API (temporada/fase/partida)
+padrao_partida = re.compile(r"(?:match/(\d+)/)?([0-9a-z]+)/([0-9a-z]+)/([0-9a-z]+)/?$")
+
+# A data pode vir em qualquer posição da query string (ex.: "?language=pt&date=2024-04-13")
+padrao_data = re.compile(r"(?:^|&)date=(\d{4}-\d{2}-\d{2})")
+
+COLUNAS = ["id_competicao", "id_temporada", "id_fase", "id_partida", "data_partida"]
+
+# Converte um link ou código de partida na chave canônica (competição, temporada, fase, partida, data).
+# Parâmetros extras da query string, fragmentos e maiúsculas não mudam a chave.
+# Devolve None se o texto não tiver temporada, fase e partida.
+def chave_partida(link, id_competicao=ID_COMPETICAO_PADRAO):
+    caminho, _, consulta = link.strip().split("#", 1)[0].partition("?")
+    encontrado = padrao_partida.search(caminho.lower())
+    if not encontrado:
+        return None
+    competicao, temporada, fase, partida = encontrado.groups()
+    data = padrao_data.search(consulta)
+    return (competicao or id_competicao, temporada, fase, partida, data.group(1) if data else None)
+
+# Mesma análise de chave_partida, mas para vários links de uma vez: os links são juntados em um único texto
+# e percorridos por uma só expressão regular, sem chamadas de função por link.
+padrao_links = re.compile(
+    r"^[^\S\n]*(?:\S*?match/(\d+)/|\S*/)?([0-9a-z]+)/([0-9a-z]+)/([0-9a-z]+)/?"
+    r"(?:\?(?:(?:[^#\s&]*&)*?date=(\d{4}-\d{2}-\d{2}))?[^#\s]*)?(?:#\S*)?[^\S\n]*$",
+    re.MULTILINE | re.IGNORECASE,
+)
+
+# Devolve as chaves dos links válidos, na ordem dos links; textos que não são de partidas são ignorados
+def chaves_dos_links(links, id_competicao=ID_COMPETICAO_PADRAO):
+    texto = "\n".join(links).lower()
+    return [(competicao or id_competicao, temporada, fase, partida, data or None)
+            for competicao, temporada, fase, partida, data in padrao_links.findall(texto)]
+
+# Código usado pela API de timelines (temporada/fase/partida?date=...)
+def codigo_partida(chave):
+    return f"{chave[1]}/{chave[2]}/{chave[3]}?date={chave[4]}"
+
+def link_partida(chave):
+    return url_partida.format(*chave)
+
+class RegistroPartidas:
+    def __init__(self, caminho=ARQUIVO_REGISTRO, semente=ARQUIVO_SEMENTE):
+        self.caminho = caminho
+        self.conexao = sqlite3.connect(caminho)
+        with self.conexao:
+            self.conexao.execute(
+                """CREATE TABLE IF NOT EXISTS partidas (
+                       id_partida TEXT PRIMARY KEY,
+                       id_competicao TEXT NOT NULL,
+                       id_temporada TEXT NOT NULL,
+                       id_fase TEXT NOT NULL,
+                       data_partida TEXT
+                   )"""
+            )
+            self.conexao.execute(
+                "CREATE INDEX IF NOT EXISTS idx_partidas_temporada "
+                "ON partidas (id_competicao, id_temporada, data_partida)"
+            )
+            self.conexao.execute("CREATE INDEX IF NOT EXISTS idx_partidas_data ON partidas (data_partida)")
+        # Um registro novo começa com as partidas já conhecidas
+        if len(self) == 0 and semente and os.path.exists(semente):
+            self.importar_csv(semente)
+
+    def __len__(self):
+        return self.conexao.execute("SELECT COUNT(*) FROM partidas").fetchone()[0]
+
+    # Grava as chaves no registro, ignorando partidas que já existem. Devolve quantas partidas eram novas.
+    def registrar(self, chaves):
+        antes = self.conexao.total_changes
+        with self.conexao:
+            self.conexao.executemany(
+                "INSERT OR IGNORE INTO partidas "
+                "(id_competicao, id_temporada, id_fase, id_partida, data_partida) VALUES (?, ?, ?, ?, ?)",
+                chaves,
+            )
+        return self.conexao.total_changes - antes
+
+    # Grava links do match-centre (ou códigos da API) no registro; textos que não são de partidas são ignorados
+    def registrar_links(self, links, id_competicao=ID_COMPETICAO_PADRAO):
+        return self.registrar(chaves_dos_links(links, id_competicao))
+
+    # Chaves das partidas, em ordem de data, opcionalmente filtradas por competição, temporada e intervalo de datas
+    def chaves(self, id_competicao=None, id_temporada=None, inicio=None, fim=None):
+        filtros = []
+        parametros = []
+        for condicao, valor in (("id_competicao = ?", id_competicao), ("id_temporada = ?", id_temporada),
+                                ("data_partida >= ?", inicio), ("data_partida <= ?", fim)):
+            if valor is not None:
+                filtros.append(condicao)
+                parametros.append(valor)
+        consulta = f"SELECT {', '.join(COLUNAS)} FROM partidas"
+        if filtros:
+            consulta += " WHERE " + " AND ".join(filtros)
+        # Partidas do mesmo dia ficam na ordem em que foram descobertas
+        consulta += " ORDER BY data_partida, rowid"
+        return self.conexao.execute(consulta, parametros).fetchall()
+
+    # Códigos das partidas no formato usado pela API de timelines
+    def codigos(self, **filtros):
+        return [codigo_partida(chave) for chave in self.chaves(**filtros)]
+
+    # Links das partidas no match-centre
+    def links(self, **filtros):
+        return [link_partida(chave) for chave in self.chaves(**filtros)]
+
+    def importar_csv(self, caminho):
+        with open(caminho, "r", newline="", encoding="utf-8") as f:
+            return self.registrar(tuple(linha[coluna] for coluna in COLUNAS) for linha in csv.DictReader(f))
+
+    def exportar_csv(self, caminho, **filtros):
+        with open(caminho, "w", newline="", encoding="utf-8") as f:
+            escritor = csv.writer(f)
+            escritor.writerow(COLUNAS)
+            escritor.writerows(self.chaves(**filtros))
+
+    def fechar(self):
+        self.conexao.close()
@@ -0,0 +1,241 @@
+# Esse arquivo liga os autores dos gols da FIFA (player_name/team_name do goals_data_with_teams.csv)
+# aos jogadores do players_score.csv (full_name/Current Club), usados no modelo do primeiro gol.
+# Os nomes da FIFA vêm com acentos e em forma curta ("G. Arrascaeta", "Pedro"), então a comparação direta não funciona,
+# e comparar cada gol com cada jogador de forma aproximada seria lento demais para uma temporada inteira.
+#
+# Por isso a busca é feita em blocos:
+#   1. nomes e clubes são normalizados (sem acentos, minúsculos, sem partículas como "de"/"da");
+#   2. o clube da FIFA é ligado a um clube do players_score.csv uma única vez (pelo id de times_canonicos.py ou,
+#      na falta dele, pelos nomes), e só os jogadores desse clube são candidatos;
+#   3. os candidatos saem de um índice invertido de trigramas montado uma vez por clube, e só os mais parecidos
+#      são pontuados (cobertura dos tokens, aceitando iniciais e abreviações, e semelhança dos trigramas).
+# Cada decisão (nome, clube) fica guardada em um CSV de cache, que também pode ser corrigido à mão
+# (linhas com metodo "manual" nunca são recalculadas). As colunas jogador_fifa e time_fifa do cache guardam os nomes
+# já normalizados (como devolvidos por normalizar), então uma correção manual precisa usar essa mesma forma.
+#
+# Uso: python resolucao_jogadores.py --gols goals_data_with_teams.csv --jogadores players_score.csv
+
+import argparse
+import csv
+import hashlib
+import os
+import time
+from collections import Counter
+import pandas as pd
+from times_canonicos import normalizar, tabela_times
+
+# Arquivo padrão com as decisões já tomadas
+ARQUIVO_CACHE = "resolucoes_jogadores.csv"
+
+# Pontuação mínima para aceitar um jogador (de 0 a 1)
+PONTUACAO_MINIMA = 0.55
+
+# Se o segundo colocado ficar a menos disso do primeiro, a decisão é considerada ambígua e nenhum jogador é escolhido
+MARGEM_AMBIGUIDADE = 0.05
+
+# Quantidade de candidatos, vindos do índice de trigramas, que são pontuados por completo
+CANDIDATOS_POR_NOME = 10
+
+# Partículas e sufixos que não ajudam a distinguir jogadores
+PALAVRAS_IGNORADAS = {"de", "da", "do", "das", "dos", "e", "jr", "junior", "filho", "neto"}
+
+CAMPOS_CACHE = ["jogador_fifa", "time_fifa", "id_jogador", "full_name", "current_club", "pontuacao", "metodo"]
+
+# Id estável de um jogador: hash do nome completo e do clube normalizados. Não depende da posição do jogador no
+# players_score.csv, então o cache continua válido se o arquivo mudar de ordem ou ganhar jogadores.
+def id_do_jogador(nome, clube):
+    chave = f"{normalizar(nome)}|{normalizar(clube)}".encode("utf-8")
+    return int(hashlib.sha1(chave).hexdigest()[:15], 16)
+
+def tokens(texto):
+    return [token for token in normalizar(texto).split() if token not in PALAVRAS_IGNORADAS]
+
+def trigramas(texto):
+    texto = f"  {' '.join(tokens(texto))} "
+    return {texto[posicao:posicao + 3] for posicao in range(len(texto) - 2)}
+
+# Parte dos tokens da FIFA encontrada no nome completo. Um token bate com outro igual, com uma inicial
+# ("g" -> "gabriel") ou com um prefixo de pelo menos 4 letras ("arrasca" -> "arrascaeta").
+def cobertura_tokens(tokens_fifa, tokens_completos):
+    if not tokens_fifa:
+        return 0.0
+    encontrados = 0
+    for token in tokens_fifa:
+        if len(token) == 1:
+            encontrado = any(completo[0] == token for completo in tokens_completos)
+        elif len(token) >= 4:
+            encontrado = any(completo.startswith(token) or token.startswith(completo) and len(completo) >= 4
+                             for completo in tokens_completos)
+        else:
+            encontrado = token in tokens_completos
+        encontrados += encontrado
+    return encontrados / len(tokens_fifa)
+
+def dice(trigramas_a, trigramas_b):
+    if not trigramas_a or not trigramas_b:
+        return 0.0
+    return 2 * len(trigramas_a & trigramas_b) / (len(trigramas_a) + len(trigramas_b))
+
+# Jogadores de um clube com o índice invertido de trigramas: trigrama -> ids dos jogadores que o contêm
+class BlocoClube:
+    def __init__(self):
+        self.jogadores = {}  # id -> (tokens, trigramas)
+        self.indice = {}
+
+    def adicionar(self, id_jogador, nome):
+        trigramas_nome = trigramas(nome)
+        self.jogadores[id_jogador] = (tokens(nome), trigramas_nome)
+        for trigrama in trigramas_nome:
+            self.indice.setdefault(trigrama, []).append(id_jogador)
+
+    # Devolve [(pontuação, id)] dos melhores candidatos para um nome, do mais provável para o menos provável
+    def candidatos(self, nome, quantidade=CANDIDATOS_POR_NOME):
+        tokens_fifa = tokens(nome)
+        trigramas_fifa = trigramas(nome)
+        # Conta trigramas em comum percorrendo só as listas do índice, sem comparar com todos os jogadores
+        comuns = Counter()
+        for trigrama in trigramas_fifa:
+            comuns.update(self.indice.get(trigrama, ()))
+        pontuados = []
+        for id_jogador, _ in comuns.most_common(quantidade):
+            tokens_completos, trigramas_completos = self.jogadores[id_jogador]
+            cobertura = cobertura_tokens(tokens_fifa, tokens_completos)
+            if cobertura:
+                pontuados.append(((cobertura + dice(trigramas_fifa, trigramas_completos)) / 2, id_jogador))
+        return sorted(pontuados, reverse=True)
+
+class ResolvedorJogadores:
+    # `jogadores` é o DataFrame do players_score.csv. O id de cada jogador é o hash de id_do_jogador sobre o par
+    # (full_name, Current Club), então é o mesmo em qualquer execução.
+    def __init__(self, jogadores, caminho_cache=ARQUIVO_CACHE, coluna_nome="full_name", coluna_clube="Current Club"):
+        distintos = jogadores[[coluna_nome, coluna_clube]].dropna(subset=[coluna_nome]).drop_duplicates()
+        distintos = distintos.rename(columns={coluna_nome: "full_name", coluna_clube: "current_club"})
+        distintos.index = pd.Index([id_do_jogador(nome, clube) for nome, clube
+                                    in zip(distintos["full_name"], distintos["current_club"])], name="id_jogador")
+        # Nomes que só diferem por acentos ou maiúsculas viram o mesmo jogador
+        self.tabela = distintos[~distintos.index.duplicated()]
+
+        self.blocos = {}
+        self.todos = BlocoClube()  # Usado quando o clube da FIFA não corresponde a nenhum clube conhecido
+        for id_jogador, nome, clube in zip(self.tabela.index, self.tabela["full_name"], self.tabela["current_club"]):
+            self.blocos.setdefault(normalizar(clube), BlocoClube()).adicionar(id_jogador, nome)
+            self.todos.adicionar(id_jogador, nome)
+        self.clubes = {}  # Clube da FIFA normalizado -> clube do players_score.csv normalizado (ou None)
+        # Clubes do players_score.csv pelo id canônico, para ligar "Flamengo" a "CR Flamengo" sem comparar textos
+        self.tabela_times = tabela_times()
+        self.clube_por_id = {}
+        for clube in self.blocos:
+            id_time = self.tabela_times.ids.get(clube)
+            if id_time is not None:
+                self.clube_por_id.setdefault(id_time, clube)
+
+        self.caminho_cache = caminho_cache
+        self.decisoes = {}
+        if caminho_cache and os.path.exists(caminho_cache):
+            with open(caminho_cache, "r", newline="", encoding="utf-8") as f:
+                for linha in csv.DictReader(f):
+                    # O id é recalculado a partir do nome e do clube gravados, o que também corrige caches antigos
+                    if linha.get("full_name"):
+                        linha["id_jogador"] = str(id_do_jogador(linha["full_name"], linha.get("current_club", "")))
+                    self.decisoes[(linha["jogador_fifa"], linha["time_fifa"])] = linha
+        self.novas_decisoes = 0
+
+    # Clube do players_score.csv correspondente ao time da FIFA: igual depois de normalizado, com o mesmo id canônico
+    # ou, para clubes fora da tabela de times, o clube com mais tokens em comum ("Flamengo" -> "cr flamengo")
+    def clube(self, time_fifa):
+        chave = normalizar(time_fifa)
+        if chave not in self.clubes:
+            id_time = self.tabela_times.ids.get(chave)
+            if chave in self.blocos:
+                self.clubes[chave] = chave
+            elif id_time in self.clube_por_id:
+                self.clubes[chave] = self.clube_por_id[id_time]
+            else:
+                tokens_time = set(tokens(time_fifa))
+                melhores = sorted(((len(tokens_time & set(clube.split())) / len(tokens_time or {""}),
+                                    dice(trigramas(chave), trigramas(clube)), clube) for clube in self.blocos), reverse=True)
+                self.clubes[chave] = melhores[0][2] if melhores and melhores[0][0] >= 0.5 else None
+        return self.clubes[chave]
+
+    # Decide o jogador de um (nome, time) da FIFA. Devolve a linha de decisão (com id_jogador vazio se não houver)
+    def resolver(self, jogador_fifa, time_fifa):
+        chave = (normalizar(jogador_fifa), normalizar(time_fifa))
+        if chave in self.decisoes:
+            return self.decisoes[chave]
+
+        clube = self.clube(time_fifa)
+        metodo = "clube"
+        candidatos = self.blocos[clube].candidatos(jogador_fifa) if clube is not None else []
+        if not candidatos or candidatos[0][0] < PONTUACAO_MINIMA:
+            # O jogador pode ter trocado de clube: procura em todos, exigindo uma pontuação maior
+            metodo = "todos"
+            candidatos = [(pontuacao, id_jogador) for pontuacao, id_jogador in self.todos.candidatos(jogador_fifa)
+                          if pontuacao >= PONTUACAO_MINIMA + 0.2]
+
+        decisao = {"jogador_fifa": chave[0], "time_fifa": chave[1], "id_jogador": "", "full_name": "",
+                   "current_club": "", "pontuacao": "", "metodo": "sem_candidato"}
+        if candidatos and candidatos[0][0] >= PONTUACAO_MINIMA:
+            pontuacao, id_jogador = candidatos[0]
+            decisao["pontuacao"] = f"{pontuacao:.3f}"
+            if len(candidatos) > 1 and pontuacao - candidatos[1][0] < MARGEM_AMBIGUIDADE:
+                decisao["metodo"] = "ambiguo"
+            else:
+                jogador = self.tabela.loc[id_jogador]
+                decisao.update({"id_jogador": str(id_jogador), "full_name": jogador["full_name"],
+                                "current_club": jogador["current_club"], "metodo": metodo})
+        self.decisoes[chave] = decisao
+        self.novas_decisoes += 1
+        return decisao
+
+    # Acrescenta id_jogador, full_name, Current Club, pontuação e método a cada gol.
+    # Cada par (nome, time) distinto é resolvido uma única vez.
+    def vincular(self, gols, coluna_jogador="player_name", coluna_time="team_name"):
+        pares = gols[[coluna_jogador, coluna_time]].drop_duplicates()
+        decisoes = pd.DataFrame(
+            [{coluna_jogador: jogador, coluna_time: time_fifa, **self.resolver(jogador, time_fifa)}
+             for jogador, time_fifa in zip(pares[coluna_jogador], pares[coluna_time])],
+            columns=[coluna_jogador, coluna_time] + CAMPOS_CACHE,
+        )
+        decisoes["id_jogador"] = pd.to_numeric(decisoes["id_jogador"], errors="coerce").astype("Int64")
+        decisoes["pontuacao_vinculo"] = pd.to_numeric(decisoes["pontuacao"], errors="coerce")
+        decisoes = decisoes.rename(columns={"current_club": "Current Club", "metodo": "metodo_vinculo"})
+        colunas = [coluna_jogador, coluna_time, "id_jogador", "full_name", "Current Club", "pontuacao_vinculo",
+                   "metodo_vinculo"]
+        return gols.merge(decisoes[colunas], on=[coluna_jogador, coluna_time], how="left")
+
+    # Grava as decisões no CSV de cache (de forma atômica)
+    def salvar_cache(self):
+        if not self.caminho_cache:
+            return
+        temporario = f"{self.caminho_cache}.{os.getpid()}.tmp"
+        with open(temporario, "w", newline="", encoding="utf-8") as f:
+            escritor = csv.DictWriter(f, fieldnames=CAMPOS_CACHE, extrasaction="ignore")
+            escritor.writeheader()
+            escritor.writerows(self.decisoes.values())
+        os.replace(temporario, self.caminho_cache)
+
+def main():
+    parser = argparse.ArgumentParser(description="Liga os autores dos gols da FIFA aos jogadores do players_score.csv")
+    parser.add_argument("--gols", default="goals_data_with_teams.csv", help="CSV de gols (player_name, team_name)")
+    parser.add_argument("--jogadores", default="players_score.csv", help="CSV de jogadores (full_name, Current Club)")
+    parser.add_argument("--cache", default=ARQUIVO_CACHE, help="CSV com as decisões já tomadas")
+    parser.add_argument("--saida", default="gols_com_jogadores.csv", help="CSV de gols com o id do jogador")
+    args = parser.parse_args()
+
+    inicio = time.monotonic()
+    resolvedor = ResolvedorJogadores(pd.read_csv(args.jogadores), args.cache)
+    gols = pd.read_csv(args.gols)
+    vinculados = resolvedor.vincular(gols)
+    resolvedor.salvar_cache()
+    vinculados.to_csv(args.saida, index=False, encoding="utf-8")
+
+    duracao = time.monotonic() - inicio
+    encontrados = vinculados["id_jogador"].notna().sum()
+    print(f"{encontrados} de {len(vinculados)} gols ligados a um jogador ({encontrados / max(len(vinculados), 1):.1%}) "
+          f"em {duracao:.2f}s; {resolvedor.novas_decisoes} decisões novas, "
+          f"{len(resolvedor.decisoes) - resolvedor.novas_decisoes} vindas do cache")
+    print(vinculados["metodo_vinculo"].value_counts().to_string())
+    print(f"Gols gravados em {args.saida}")
+
+if __name__ == "__main__":
+    main()
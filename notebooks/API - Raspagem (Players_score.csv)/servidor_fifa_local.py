@@ -0,0 +1,319 @@
+# Esse arquivo sobe um servidor HTTP local que imita a API e o match-centre da FIFA a partir de dados gravados (fixtures).
+# Com ele os scripts de ingestão podem ser testados e medidos sem acessar o site real,
+# inclusive com latência, erros 500 e respostas 429 injetados de propósito.
+#
+# Estrutura da pasta de fixtures:
+#   calendario.json                                      -> lista de partidas no formato do calendário da API ("Results")
+#   timelines/<competicao>/<temporada>/<fase>/<partida>.json -> timeline de cada partida
+#   match-centre/<YYYY-MM-DD>.html                       -> (opcional) página gravada do match-centre daquele dia
+#
+# Com --replay o servidor simula uma rodada ao vivo: todas as partidas começam quando o servidor sobe e as timelines
+# só mostram os eventos até o minuto atual do jogo, avançando um minuto a cada `--replay` segundos.
+#
+# Uso: python servidor_fifa_local.py --fixtures fixtures --porta 8000 --latencia 50 --taxa-429 0.05
+# e depois aponte os scripts para ele com FIFA_API_BASE_URL=http://localhost:8000/api/v3
+# e FIFA_SITE_BASE_URL=http://localhost:8000
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+from registro_partidas import ID_COMPETICAO_PADRAO
+
+# Diretório padrão das fixtures
+DIRETORIO_FIXTURES = "fixtures"
+
+# No replay, a partida termina (com um evento de fim de jogo) depois do último evento ou do minuto 90
+MINUTO_FINAL_REPLAY = 90
+
+# Período e tipo usados pela API no evento de fim de jogo
+PERIODO_FIM_DE_JOGO = 10
+TIPO_FIM_DE_JOGO = 26
+
+# Converte o minuto de um evento ("45'", "90'+3'") em um número de minutos de jogo
+def minuto_do_evento(minuto):
+    return sum(int(parte) for parte in re.findall(r"\d+", str(minuto)))
+
+# Times usados nas fixtures sintéticas
+TIMES_SINTETICOS = [
+    "Palmeiras", "Flamengo", "Botafogo", "Fortaleza", "Internacional", "São Paulo", "Corinthians",
+    "Bahia", "Cruzeiro", "Vasco da Gama", "Vitória", "Atlético Mineiro", "Fluminense", "Grêmio",
+    "Juventude", "Red Bull Bragantino", "Athletico Paranaense", "Criciúma", "Atlético Goianiense", "Cuiabá",
+]
+
+class Fixtures:
+    def __init__(self, diretorio):
+        self.diretorio = diretorio
+        caminho_calendario = os.path.join(diretorio, "calendario.json")
+        self.calendario = []
+        if os.path.exists(caminho_calendario):
+            with open(caminho_calendario, "r", encoding="utf-8") as f:
+                self.calendario = json.load(f)
+        # Ordena pela data para que a paginação seja estável
+        self.calendario.sort(key=lambda partida: (partida["Date"], partida["IdMatch"]))
+
+    def caminho_timeline(self, id_competicao, id_temporada, id_fase, id_partida):
+        return os.path.join(self.diretorio, "timelines", id_competicao, id_temporada, id_fase, f"{id_partida}.json")
+
+    def pagina_match_centre(self, data):
+        caminho = os.path.join(self.diretorio, "match-centre", f"{data}.html")
+        if os.path.exists(caminho):
+            with open(caminho, "rb") as f:
+                return f.read()
+        # Sem página gravada: monta uma página mínima com os links das partidas do dia, como o site faz
+        links = "".join(
+            f'<a href="/pt/match-centre/match/{p["IdCompetition"]}/{p["IdSeason"]}/{p["IdStage"]}/{p["IdMatch"]}?date={data}">'
+            f'{p["IdMatch"]}</a>\n'
+            for p in self.calendario if (p.get("LocalDate") or p["Date"])[:10] == data
+        )
+        return f"<html><body>\n{links}</body></html>".encode("utf-8")
+
+class ServidorFifaLocal(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, endereco, fixtures, latencia=0.0, variacao=0.0, taxa_erro=0.0, taxa_429=0.0, retry_after=1, semente=None,
+                 replay=None):
+        super().__init__(endereco, ManipuladorFifa)
+        self.fixtures = fixtures
+        self.latencia = latencia        # Atraso fixo de cada resposta (segundos)
+        self.variacao = variacao        # Atraso aleatório extra, entre 0 e `variacao` segundos
+        self.taxa_erro = taxa_erro      # Probabilidade de responder 500
+        self.taxa_429 = taxa_429        # Probabilidade de responder 429
+        self.retry_after = retry_after  # Valor do cabeçalho Retry-After nas respostas 429
+        self.replay = replay            # Segundos por minuto de jogo no replay ao vivo (None: timelines completas)
+        self.inicio_replay = time.monotonic()
+        self.aleatorio = random.Random(semente)
+        self.lock = threading.Lock()
+        self.contadores = {"requisicoes": 0, "respostas_200": 0, "respostas_304": 0,
+                           "respostas_404": 0, "respostas_429": 0, "respostas_500": 0}
+
+    def contar(self, chave):
+        with self.lock:
+            self.contadores[chave] += 1
+
+    # Minuto de jogo atual do replay
+    def minuto_replay(self):
+        return (time.monotonic() - self.inicio_replay) / self.replay
+
+    def sortear(self):
+        with self.lock:
+            return self.aleatorio.random(), self.aleatorio.random(), self.aleatorio.random()
+
+class ManipuladorFifa(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Mantém as conexões abertas (keep-alive), como o servidor real
+
+    def log_message(self, formato, *args):
+        pass  # Não imprime uma linha por requisição
+
+    def responder(self, status, corpo=b"", tipo="application/json", cabecalhos=None):
+        self.server.contar(f"respostas_{status}")
+        self.send_response(status)
+        self.send_header("Content-Type", f"{tipo}; charset=utf-8")
+        self.send_header("Content-Length", str(len(corpo)))
+        for nome, valor in (cabecalhos or {}).items():
+            self.send_header(nome, valor)
+        self.end_headers()
+        self.wfile.write(corpo)
+
+    def do_GET(self):
+        servidor = self.server
+        servidor.contar("requisicoes")
+        sorteio_latencia, sorteio_429, sorteio_erro = servidor.sortear()
+
+        # Latência injetada
+        atraso = servidor.latencia + sorteio_latencia * servidor.variacao
+        if atraso > 0:
+            time.sleep(atraso)
+
+        # Falhas injetadas
+        if sorteio_429 < servidor.taxa_429:
+            return self.responder(429, b'{"Message": "Too Many Requests"}',
+                                  cabecalhos={"Retry-After": str(servidor.retry_after)})
+        if sorteio_erro < servidor.taxa_erro:
+            return self.responder(500, b'{"Message": "Internal Server Error"}')
+
+        url = urlparse(self.path)
+        consulta = {chave: valores[0] for chave, valores in parse_qs(url.query).items()}
+        partes = [parte for parte in url.path.split("/") if parte]
+
+        if partes[:3] == ["api", "v3", "calendar"]:
+            return self.calendario(consulta)
+        if partes[:3] == ["api", "v3", "timelines"] and len(partes) == 7:
+            return self.timeline(*partes[3:])
+        if partes == ["pt", "match-centre"]:
+            corpo = servidor.fixtures.pagina_match_centre(consulta.get("date", ""))
+            return self.responder(200, corpo, tipo="text/html")
+        return self.responder(404, b'{"Message": "Not Found"}')
+
+    def calendario(self, consulta):
+        inicio = consulta.get("from", "")
+        fim = consulta.get("to", "9999")
+        competicao = consulta.get("idCompetition")
+        partidas = [
+            partida for partida in self.server.fixtures.calendario
+            if inicio <= partida["Date"] <= fim and (competicao is None or partida["IdCompetition"] == competicao)
+        ]
+        # Paginação: o token de continuação é simplesmente a posição da próxima página
+        posicao = int(consulta.get("continuationToken", 0))
+        quantidade = int(consulta.get("count", 100))
+        pagina = partidas[posicao:posicao + quantidade]
+        token = str(posicao + quantidade) if posicao + quantidade < len(partidas) else None
+        corpo = json.dumps({"Results": pagina, "ContinuationToken": token}).encode("utf-8")
+        return self.responder(200, corpo)
+
+    def timeline(self, id_competicao, id_temporada, id_fase, id_partida):
+        caminho = self.server.fixtures.caminho_timeline(id_competicao, id_temporada, id_fase, id_partida)
+        if not os.path.exists(caminho):
+            return self.responder(404, b'{"Message": "Not Found"}')
+        with open(caminho, "rb") as f:
+            corpo = f.read()
+        if self.server.replay:
+            corpo = self.timeline_ao_vivo(corpo)
+        # ETag para permitir requisições condicionais, como a API real
+        etag = '"' + hashlib.sha1(corpo).hexdigest() + '"'
+        if self.headers.get("If-None-Match") == etag:
+            return self.responder(304, cabecalhos={"ETag": etag})
+        return self.responder(200, corpo, cabecalhos={"ETag": etag})
+
+    # Corta a timeline no minuto atual do replay; depois do fim da partida acrescenta o evento de fim de jogo
+    def timeline_ao_vivo(self, corpo):
+        timeline = json.loads(corpo)
+        minuto = self.server.minuto_replay()
+        eventos = timeline.get("Event", [])
+        timeline["Event"] = [evento for evento in eventos if minuto_do_evento(evento.get("Minute", 0)) <= minuto]
+        final = max([MINUTO_FINAL_REPLAY] + [minuto_do_evento(evento.get("Minute", 0)) for evento in eventos])
+        encerrada = any(evento.get("Period") == PERIODO_FIM_DE_JOGO for evento in timeline["Event"])
+        if minuto > final and not encerrada:
+            ultimo = eventos[-1] if eventos else {}
+            timeline["Event"].append({
+                "EventId": f"fim-{final}", "Type": TIPO_FIM_DE_JOGO, "Period": PERIODO_FIM_DE_JOGO, "Minute": f"{final}'",
+                "TypeLocalized": [{"Locale": "pt-BR", "Description": "Fim de jogo"}],
+                "HomeGoals": ultimo.get("HomeGoals", 0), "AwayGoals": ultimo.get("AwayGoals", 0),
+            })
+        return json.dumps(timeline, ensure_ascii=False).encode("utf-8")
+
+# Sobe o servidor em uma thread e devolve (servidor, URL base). Porta 0 escolhe uma porta livre.
+def iniciar_servidor(diretorio=DIRETORIO_FIXTURES, porta=0, **opcoes):
+    servidor = ServidorFifaLocal(("127.0.0.1", porta), Fixtures(diretorio), **opcoes)
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    return servidor, f"http://127.0.0.1:{servidor.server_address[1]}"
+
+# Gera fixtures sintéticas (calendário e timelines) para rodar benchmarks sem dados gravados
+def gerar_fixtures_sinteticas(destino=DIRETORIO_FIXTURES, partidas=380, inicio="2024-04-13",
+                              id_competicao=ID_COMPETICAO_PADRAO, semente=42):
+    aleatorio = random.Random(semente)
+    id_temporada, id_fase = "temporadasintetica", "fasesintetica"
+    data_inicio = datetime.strptime(inicio, "%Y-%m-%d")
+    calendario = []
+    for numero in range(partidas):
+        id_partida = f"partida{numero:05d}"
+        # 10 jogos por rodada, uma rodada por semana
+        data = data_inicio + timedelta(days=7 * (numero // 10) + aleatorio.randint(0, 2), hours=19)
+        casa, fora = aleatorio.sample(TIMES_SINTETICOS, 2)
+        calendario.append({
+            "IdCompetition": id_competicao, "IdSeason": id_temporada, "IdStage": id_fase, "IdMatch": id_partida,
+            "Date": data.strftime("%Y-%m-%dT%H:%M:%SZ"), "LocalDate": data.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        })
+
+        eventos, gols_casa, gols_fora = [], 0, 0
+        for minuto in sorted(aleatorio.sample(range(1, 95), aleatorio.randint(4, 14))):
+            lado = aleatorio.choice(["casa", "fora"])
+            time_evento = casa if lado == "casa" else fora
+            jogador = f"Jogador {aleatorio.randint(1, 25)} {time_evento}"
+            if aleatorio.random() < 0.3:
+                gols_casa += lado == "casa"
+                gols_fora += lado == "fora"
+                tipo, descricao_tipo = 0, "Gol!"
+            else:
+                tipo, descricao_tipo = aleatorio.choice([(2, "Cartão amarelo"), (5, "Substituição"), (16, "Escanteio")])
+            eventos.append({
+                "EventId": f"{id_partida}-{minuto}", "Type": tipo, "Period": 3 if minuto <= 45 else 5,
+                "Minute": f"{minuto}'", "IdTeam": f"time-{lado}",
+                "TypeLocalized": [{"Locale": "pt-BR", "Description": descricao_tipo}],
+                "EventDescription": [{"Locale": "pt-BR", "Description": f"{jogador} ({time_evento})"}],
+                "HomeGoals": gols_casa, "AwayGoals": gols_fora,
+            })
+        timeline = {
+            "Home": {"IdTeam": "time-casa", "TeamName": [{"Locale": "pt-BR", "Description": casa}]},
+            "Away": {"IdTeam": "time-fora", "TeamName": [{"Locale": "pt-BR", "Description": fora}]},
+            "Event": eventos,
+        }
+        caminho = os.path.join(destino, "timelines", id_competicao, id_temporada, id_fase, f"{id_partida}.json")
+        os.makedirs(os.path.dirname(caminho), exist_ok=True)
+        with open(caminho, "w", encoding="utf-8") as f:
+            json.dump(timeline, f, ensure_ascii=False)
+
+    with open(os.path.join(destino, "calendario.json"), "w", encoding="utf-8") as f:
+        json.dump(calendario, f, ensure_ascii=False, indent=1)
+    print(f"{partidas} partidas sintéticas gravadas em {destino}")
+
+# Grava fixtures reais: consulta o calendário e as timelines na API da FIFA e salva no formato do servidor local
+def gravar_fixtures(datas, destino=DIRETORIO_FIXTURES, id_competicao=ID_COMPETICAO_PADRAO):
+    from calendario_fifa import buscar_partidas_calendario, janelas_de_datas
+    from extrair_primeiro_gol_partidas import get_match_timeline, get_shared_session
+
+    session = get_shared_session()
+    calendario = []
+    for inicio, fim in janelas_de_datas(datas):
+        calendario.extend(buscar_partidas_calendario(inicio, fim, id_competicao, session=session))
+
+    for partida in calendario:
+        data = (partida.get("LocalDate") or partida["Date"])[:10]
+        match_code = f'{partida["IdSeason"]}/{partida["IdStage"]}/{partida["IdMatch"]}?date={data}'
+        timeline = get_match_timeline(match_code, session)
+        if timeline is None:
+            continue
+        caminho = os.path.join(destino, "timelines", partida["IdCompetition"], partida["IdSeason"],
+                               partida["IdStage"], f'{partida["IdMatch"]}.json')
+        os.makedirs(os.path.dirname(caminho), exist_ok=True)
+        with open(caminho, "w", encoding="utf-8") as f:
+            json.dump(timeline, f, ensure_ascii=False)
+
+    os.makedirs(destino, exist_ok=True)
+    with open(os.path.join(destino, "calendario.json"), "w", encoding="utf-8") as f:
+        json.dump(calendario, f, ensure_ascii=False, indent=1)
+    print(f"{len(calendario)} partidas gravadas em {destino}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor local que imita a API da FIFA a partir de fixtures gravadas")
+    parser.add_argument("--fixtures", default=DIRETORIO_FIXTURES, help="Pasta com as fixtures")
+    parser.add_argument("--porta", type=int, default=8000)
+    parser.add_argument("--latencia", type=float, default=0, help="Latência fixa de cada resposta, em milissegundos")
+    parser.add_argument("--variacao", type=float, default=0, help="Latência aleatória extra, em milissegundos")
+    parser.add_argument("--taxa-erro", type=float, default=0, help="Probabilidade (0 a 1) de responder 500")
+    parser.add_argument("--taxa-429", type=float, default=0, help="Probabilidade (0 a 1) de responder 429")
+    parser.add_argument("--retry-after", type=int, default=1, help="Segundos informados no Retry-After dos 429")
+    parser.add_argument("--replay", type=float, metavar="SEGUNDOS",
+                        help="Simula uma rodada ao vivo, avançando um minuto de jogo a cada SEGUNDOS segundos")
+    parser.add_argument("--gerar-sinteticas", type=int, metavar="PARTIDAS",
+                        help="Gera essa quantidade de partidas sintéticas na pasta de fixtures e sai")
+    parser.add_argument("--gravar", nargs=2, metavar=("INICIO", "FIM"),
+                        help="Grava fixtures reais da API da FIFA entre duas datas (YYYY-MM-DD) e sai")
+    args = parser.parse_args()
+
+    if args.gerar_sinteticas:
+        return gerar_fixtures_sinteticas(args.fixtures, args.gerar_sinteticas)
+    if args.gravar:
+        inicio, fim = (datetime.strptime(data, "%Y-%m-%d") for data in args.gravar)
+        datas = [(inicio + timedelta(days=dia)).strftime("%Y-%m-%d") for dia in range((fim - inicio).days + 1)]
+        return gravar_fixtures(datas, args.fixtures)
+
+    servidor = ServidorFifaLocal(("127.0.0.1", args.porta), Fixtures(args.fixtures),
+                                 latencia=args.latencia / 1000, variacao=args.variacao / 1000,
+                                 taxa_erro=args.taxa_erro, taxa_429=args.taxa_429, retry_after=args.retry_after,
+                                 replay=args.replay)
+    print(f"Servidor local da FIFA em http://127.0.0.1:{args.porta} (API em /api/v3)")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        print(f"Requisições atendidas: {servidor.contadores}")
+
+if __name__ == "__main__":
+    main()
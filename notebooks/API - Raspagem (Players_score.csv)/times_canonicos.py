@@ -0,0 +1,68 @@
+# Esse arquivo mantém a tabela canônica dos times: cada clube tem um id inteiro e uma lista de apelidos,
+# cobrindo os nomes da FIFA (timelines), do matchess.csv (home_team_name/away_team_name) e do
+# players_score.csv (home_team/Current Club). Os nomes são ligados ao id uma única vez, na ingestão ou ao carregar
+# um CSV, e a partir daí filtros e junções usam o id em vez de comparar textos livres.
+#
+# Para incluir um clube ou um apelido novo basta editar o times_canonicos.csv (apelidos separados por "|").
+
+import csv
+import os
+import unicodedata
+from log_raspagem import obter_log
+
+log = obter_log("times")
+
+# Tabela padrão, ao lado deste arquivo
+ARQUIVO_TIMES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "times_canonicos.csv")
+
+# Texto sem acentos, em minúsculas e só com letras, números e espaços simples
+def normalizar(texto):
+    if not isinstance(texto, str):
+        return ""
+    sem_acentos = unicodedata.normalize("NFKD", texto).encode("ascii", "ignore").decode("ascii")
+    return " ".join("".join(c if c.isalnum() else " " for c in sem_acentos.lower()).split())
+
+class TabelaTimes:
+    def __init__(self, caminho=ARQUIVO_TIMES):
+        self.caminho = caminho
+        self.nomes = {}  # id -> nome canônico
+        self.ids = {}    # apelido normalizado -> id
+        self.desconhecidos = set()
+        with open(caminho, "r", newline="", encoding="utf-8") as f:
+            for linha in csv.DictReader(f):
+                id_time = int(linha["id_time"])
+                self.nomes[id_time] = linha["nome"]
+                for apelido in [linha["nome"]] + linha["apelidos"].split("|"):
+                    chave = normalizar(apelido)
+                    if chave and self.ids.setdefault(chave, id_time) != id_time:
+                        raise ValueError(f"Apelido '{apelido}' usado por dois times em {caminho}")
+
+    def __len__(self):
+        return len(self.nomes)
+
+    # Id canônico de um nome de time, ou None se o nome não estiver na tabela
+    def id_time(self, nome):
+        id_time = self.ids.get(normalizar(nome))
+        if id_time is None and isinstance(nome, str) and nome not in self.desconhecidos:
+            # Cada nome desconhecido é avisado uma única vez
+            self.desconhecidos.add(nome)
+            log.warning("Time sem id canônico: %r (inclua-o em %s)", nome, self.caminho)
+        return id_time
+
+    def nome(self, id_time):
+        return self.nomes.get(id_time)
+
+    # Ids de uma coluna inteira do pandas. Cada nome distinto é procurado uma única vez
+    # e o resultado é uma coluna de inteiros (Int64, com <NA> para os desconhecidos).
+    def ids_da_coluna(self, nomes):
+        mapa = {nome: self.id_time(nome) for nome in nomes.dropna().unique()}
+        return nomes.map(mapa).astype("Int64")
+
+_tabela_padrao = None
+
+# Tabela padrão, carregada na primeira vez que for usada
+def tabela_times():
+    global _tabela_padrao
+    if _tabela_padrao is None:
+        _tabela_padrao = TabelaTimes()
+    return _tabela_padrao
@@ -0,0 +1,174 @@
+# Esse arquivo contém tipos compactos para os dados que circulam entre os scripts de raspagem:
+# a chave de uma partida (MatchKey), um gol (GoalEvent) e um lote de gols guardado em colunas (LoteGols).
+# Os objetos usam __slots__ (sem __dict__ por instância) e os textos que se repetem muito
+# (ids de competição, temporada e fase, nomes de times e de jogadores) são internados, então
+# cada texto fica uma única vez na memória, não importa em quantas partidas ou gols apareça.
+
+import csv
+import sys
+from array import array
+from registro_partidas import ID_COMPETICAO_PADRAO, chaves_dos_links, codigo_partida, link_partida
+
+class MatchKey:
+    __slots__ = ("id_competicao", "id_temporada", "id_fase", "id_partida", "data")
+
+    def __init__(self, id_competicao, id_temporada, id_fase, id_partida, data=None):
+        self.id_competicao = sys.intern(id_competicao)
+        self.id_temporada = sys.intern(id_temporada)
+        self.id_fase = sys.intern(id_fase)
+        self.id_partida = id_partida
+        self.data = sys.intern(data) if data else None
+
+    # O id da partida é único na FIFA, então é ele que identifica a chave
+    def __eq__(self, outra):
+        return isinstance(outra, MatchKey) and self.id_partida == outra.id_partida
+
+    def __hash__(self):
+        return hash(self.id_partida)
+
+    def __repr__(self):
+        return f"MatchKey({self.codigo!r})"
+
+    def __reduce__(self):
+        return MatchKey, self.como_tupla()
+
+    def como_tupla(self):
+        return (self.id_competicao, self.id_temporada, self.id_fase, self.id_partida, self.data)
+
+    # Código usado pela API de timelines (temporada/fase/partida?date=...)
+    @property
+    def codigo(self):
+        return codigo_partida(self.como_tupla())
+
+    # Link da partida no match-centre
+    @property
+    def link(self):
+        return link_partida(self.como_tupla())
+
+# Converte vários links do match-centre (ou códigos da API) em MatchKeys de uma só vez.
+# Textos que não são de partidas são ignorados.
+def analisar_links(links, id_competicao=ID_COMPETICAO_PADRAO):
+    return [MatchKey(*chave) for chave in chaves_dos_links(links, id_competicao)]
+
+class GoalEvent:
+    __slots__ = ("partida", "home_team", "away_team", "player_name", "team_name",
+                 "match_minute", "placar_casa", "placar_fora")
+
+    def __init__(self, partida, home_team, away_team, player_name, team_name, match_minute,
+                 placar_casa, placar_fora):
+        self.partida = partida
+        self.home_team = sys.intern(home_team)
+        self.away_team = sys.intern(away_team)
+        self.player_name = sys.intern(player_name)
+        self.team_name = sys.intern(team_name)
+        self.match_minute = sys.intern(str(match_minute))
+        self.placar_casa = int(placar_casa)
+        self.placar_fora = int(placar_fora)
+
+    def __repr__(self):
+        return f"GoalEvent({self.partida!r}, {self.player_name!r}, {self.match_minute!r}, {self.score!r})"
+
+    def __reduce__(self):
+        return GoalEvent, tuple(getattr(self, campo) for campo in GoalEvent.__slots__)
+
+    # Placar no momento do gol no formato "casa - fora"; o texto só é montado quando for pedido
+    @property
+    def score(self):
+        return f"{self.placar_casa} - {self.placar_fora}"
+
+    # Linha no formato do goals_data_with_teams.csv
+    def como_dict(self):
+        return {
+            "event_id": self.partida,
+            "home_team": self.home_team,
+            "away_team": self.away_team,
+            "player_name": self.player_name,
+            "team_name": self.team_name,
+            "match_minute": self.match_minute,
+            "score": self.score,
+        }
+
+# Tabela de textos distintos: cada texto recebe um número, e as colunas do lote guardam só os números
+class TabelaNomes:
+    __slots__ = ("nomes", "indices")
+
+    def __init__(self):
+        self.nomes = []
+        self.indices = {}
+
+    def indice(self, nome):
+        indice = self.indices.get(nome)
+        if indice is None:
+            indice = self.indices[nome] = len(self.nomes)
+            self.nomes.append(sys.intern(nome))
+        return indice
+
+    def __len__(self):
+        return len(self.nomes)
+
+# Lote de gols guardado em colunas: os textos viram índices em arrays de inteiros (4 bytes por valor)
+# e os placares ficam em arrays de 2 bytes, em vez de um dicionário com textos formatados por gol.
+class LoteGols:
+    COLUNAS_TEXTO = ("event_id", "home_team", "away_team", "player_name", "team_name", "match_minute")
+    CAMPOS_CSV = COLUNAS_TEXTO + ("score",)
+
+    def __init__(self):
+        # Partidas e minutos também se repetem bastante, então usam a mesma ideia de tabela
+        self.tabelas = {coluna: TabelaNomes() for coluna in self.COLUNAS_TEXTO}
+        self.colunas = {coluna: array("I") for coluna in self.COLUNAS_TEXTO}
+        self.placar_casa = array("H")
+        self.placar_fora = array("H")
+        # Pares (coluna, tabela) na ordem de COLUNAS_TEXTO, para o laço de inserção não consultar dicionários
+        self._destinos = [(self.colunas[coluna], self.tabelas[coluna]) for coluna in self.COLUNAS_TEXTO]
+
+    def __len__(self):
+        return len(self.placar_casa)
+
+    def adicionar(self, gol):
+        self.adicionar_valores(gol.partida, gol.home_team, gol.away_team, gol.player_name, gol.team_name,
+                               gol.match_minute, gol.placar_casa, gol.placar_fora)
+
+    # Acrescenta um gol a partir dos valores, na ordem do GoalEvent, sem criar o objeto
+    def adicionar_valores(self, partida, home_team, away_team, player_name, team_name, match_minute,
+                          placar_casa, placar_fora):
+        for (coluna, tabela), valor in zip(self._destinos, (partida, home_team, away_team, player_name, team_name,
+                                                            str(match_minute))):
+            coluna.append(tabela.indice(valor))
+        self.placar_casa.append(int(placar_casa))
+        self.placar_fora.append(int(placar_fora))
+
+    def estender(self, gols):
+        for gol in gols:
+            self.adicionar(gol)
+
+    def __getitem__(self, posicao):
+        textos = [self.tabelas[coluna].nomes[self.colunas[coluna][posicao]] for coluna in self.COLUNAS_TEXTO]
+        return GoalEvent(*textos, self.placar_casa[posicao], self.placar_fora[posicao])
+
+    def __iter__(self):
+        for posicao in range(len(self)):
+            yield self[posicao]
+
+    # Linhas no formato do goals_data_with_teams.csv
+    def linhas(self):
+        for gol in self:
+            yield gol.como_dict()
+
+    def gravar_csv(self, caminho):
+        with open(caminho, "w", newline="", encoding="utf-8") as f:
+            escritor = csv.DictWriter(f, fieldnames=self.CAMPOS_CSV)
+            escritor.writeheader()
+            escritor.writerows(self.linhas())
+
+    # DataFrame com as colunas de texto como categorias, montadas direto dos índices (sem copiar os textos)
+    def para_dataframe(self):
+        import numpy as np
+        import pandas as pd
+
+        dados = {}
+        for coluna in self.COLUNAS_TEXTO:
+            codigos = np.frombuffer(self.colunas[coluna], dtype=np.uint32).astype(np.int32) if len(self) else []
+            dados[coluna] = pd.Categorical.from_codes(codigos, categories=pd.Index(self.tabelas[coluna].nomes))
+        dados["placar_casa"] = np.frombuffer(self.placar_casa, dtype=np.uint16) if len(self) else []
+        dados["placar_fora"] = np.frombuffer(self.placar_fora, dtype=np.uint16) if len(self) else []
+        return pd.DataFrame(dados)
@@ -1,1679 +1,133 @@
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+from competicoes import competicao_padrao
+from registro_partidas import RegistroPartidas, chave_partida
+
+# Quantidade de chaves guardadas na memória antes de o índice de URLs vistas passar para o disco
+LIMITE_CHAVES_MEMORIA = 500_000
+
+
+def chave_deduplicacao(url):
+    """
+    Função que devolve a chave usada para comparar duas URLs: o id da partida, que é único na FIFA.
+    Assim a mesma partida com outra query string, outra data no final ou um fragmento conta como repetida.
+    """
+    chave = chave_partida(url)
+    if chave is not None:
+        return chave[3]
+    # Códigos incompletos (ex.: "temporada/partida?"): a partida é o último trecho do caminho
+    caminho = url.split("#", 1)[0].partition("?")[0].rstrip("/")
+    return caminho.rsplit("/", 1)[-1].lower() or url
+
+
+class IndiceVistos:
+    """
+    Conjunto das chaves já vistas. Fica na memória até `limite_memoria` chaves e depois
+    transborda para um índice SQLite temporário em disco, para que o uso de memória fique limitado
+    mesmo com milhões de links.
+    """
+
+    def __init__(self, limite_memoria=LIMITE_CHAVES_MEMORIA, diretorio=None):
+        self.memoria = set()
+        self.limite_memoria = limite_memoria
+        self.diretorio = diretorio
+        self.caminho = None
+        self.conexao = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *erro):
+        self.fechar()
+
+    def _transbordar(self):
+        descritor, self.caminho = tempfile.mkstemp(prefix="urls_vistas_", suffix=".db", dir=self.diretorio)
+        os.close(descritor)
+        self.conexao = sqlite3.connect(self.caminho)
+        # O índice é descartável: sem diário e sem fsync
+        self.conexao.execute("PRAGMA journal_mode = OFF")
+        self.conexao.execute("PRAGMA synchronous = OFF")
+        self.conexao.execute("CREATE TABLE vistas (chave TEXT PRIMARY KEY) WITHOUT ROWID")
+        self.conexao.executemany("INSERT INTO vistas VALUES (?)", ((chave,) for chave in self.memoria))
+        self.memoria.clear()
+
+    def adicionar(self, chave):
+        """
+        Função que marca a chave como vista e devolve True se ela ainda não tinha aparecido
+        """
+        if self.conexao is not None:
+            return self.conexao.execute("INSERT OR IGNORE INTO vistas VALUES (?)", (chave,)).rowcount == 1
+        if chave in self.memoria:
+            return False
+        self.memoria.add(chave)
+        if len(self.memoria) > self.limite_memoria:
+            self._transbordar()
+        return True
+
+    def fechar(self):
+        self.memoria.clear()
+        if self.conexao is not None:
+            self.conexao.close()
+            os.remove(self.caminho)
+            self.conexao = None
+
+
+def remover_duplicados_stream(urls, limite_memoria=LIMITE_CHAVES_MEMORIA, diretorio=None):
+    """
+    Função que percorre as URLs uma a uma e devolve (como gerador) apenas a primeira ocorrência de cada partida,
+    na ordem em que apareceram. Não precisa da lista inteira na memória: aceita um arquivo aberto, por exemplo.
+    """
+    with IndiceVistos(limite_memoria, diretorio) as vistas:
+        for url in urls:
+            url = url.strip()
+            if url and vistas.adicionar(chave_deduplicacao(url)):
+                yield url
+
+
 def remove_duplicates(urls_list):
     """
-    Função que remove URLs duplicados de uma lista
+    Função que remove URLs duplicados de uma lista, mantendo a ordem original
     """
-    # Converte a lista em um conjunto (sets não permitem duplicatas)
-    unique_urls = list(set(urls_list))
-    
-    # Retorna a lista de URLs sem duplicatas
-    return unique_urls
+    return list(remover_duplicados_stream(urls_list))
 
 
 def save_unique_urls_to_file(filename, urls):
     """
-    Função para salvar a lista de URLs únicas em um arquivo
+    Função para salvar a lista de URLs únicas em um arquivo. Devolve quantas URLs foram salvas.
     """
+    quantidade = 0
     with open(filename, 'w') as f:
         for url in urls:
             f.write(f"{url}\n")
+            quantidade += 1
+    return quantidade
 
 
 def main():
-    # Exemplo de URLs duplicadas
-    team_urls = [
-        "a2yu8vfo8wha3vza31s2o8zkk/8cwut9j8as00ru27loulqie50?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8cwut9j8as00ru27loulqie50?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8cwut9j8as00ru27loulqie50?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8gzu8y64jsu69qutnk3lt8a38?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8gzu8y64jsu69qutnk3lt8a38?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8gzu8y64jsu69qutnk3lt8a38?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8ebuftj9peb1kowus7ihnyh3o?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8ebuftj9peb1kowus7ihnyh3o?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8ebuftj9peb1kowus7ihnyh3o?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8fnszpcd2tn8tljwwyohrfbbo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8fnszpcd2tn8tljwwyohrfbbo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8fnszpcd2tn8tljwwyohrfbbo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8g3sajsin8zmwh34t0cn2xr84?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8g3sajsin8zmwh34t0cn2xr84?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8g3sajsin8zmwh34t0cn2xr84?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8f7tn3iv2x7c2rkcvvp1hpgr8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8f7tn3iv2x7c2rkcvvp1hpgr8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8f7tn3iv2x7c2rkcvvp1hpgr8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8err16hg434tl6fsnvkd5zjf8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8err16hg434tl6fsnvkd5zjf8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8err16hg434tl6fsnvkd5zjf8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8gjuy0ir2yg5fh7vbzgcawdg4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8gjuy0ir2yg5fh7vbzgcawdg4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8gjuy0ir2yg5fh7vbzgcawdg4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8dfywqjbud86zjynvhrn7807o?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8dfywqjbud86zjynvhrn7807o?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8dfywqjbud86zjynvhrn7807o?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8dvvbzxg9zjllrkmyswjb3rpw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8dvvbzxg9zjllrkmyswjb3rpw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8dvvbzxg9zjllrkmyswjb3rpw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8g3sajsin8zmwh34t0cn2xr84?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8g3sajsin8zmwh34t0cn2xr84?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8g3sajsin8zmwh34t0cn2xr84?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8f7tn3iv2x7c2rkcvvp1hpgr8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8f7tn3iv2x7c2rkcvvp1hpgr8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8f7tn3iv2x7c2rkcvvp1hpgr8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8err16hg434tl6fsnvkd5zjf8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8err16hg434tl6fsnvkd5zjf8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8err16hg434tl6fsnvkd5zjf8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8gjuy0ir2yg5fh7vbzgcawdg4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8gjuy0ir2yg5fh7vbzgcawdg4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8gjuy0ir2yg5fh7vbzgcawdg4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8dfywqjbud86zjynvhrn7807o?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8dfywqjbud86zjynvhrn7807o?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8dfywqjbud86zjynvhrn7807o?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8dvvbzxg9zjllrkmyswjb3rpw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8dvvbzxg9zjllrkmyswjb3rpw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8dvvbzxg9zjllrkmyswjb3rpw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8i41gsko2dorr0179s9x25ct0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8i41gsko2dorr0179s9x25ct0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8i41gsko2dorr0179s9x25ct0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8jk48bdq56crkidub853gwz6c?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8jk48bdq56crkidub853gwz6c?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8jk48bdq56crkidub853gwz6c?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8he2cmqed8gwjbq9acnb0zitw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8he2cmqed8gwjbq9acnb0zitw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8he2cmqed8gwjbq9acnb0zitw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8ko5fgsczi3bo9j9uwqrgw0es?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8ko5fgsczi3bo9j9uwqrgw0es?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8ko5fgsczi3bo9j9uwqrgw0es?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8j70te2itnc3j8dc9ixdq3k0k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8j70te2itnc3j8dc9ixdq3k0k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8j70te2itnc3j8dc9ixdq3k0k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8jxlxgtygy822ewf7hg8zu1hw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8jxlxgtygy822ewf7hg8zu1hw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8jxlxgtygy822ewf7hg8zu1hw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8hqz32dabb8mv8mahf6w5s3kk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8hqz32dabb8mv8mahf6w5s3kk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8hqz32dabb8mv8mahf6w5s3kk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8igxdzvebucmawf11y38pttzo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8igxdzvebucmawf11y38pttzo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8igxdzvebucmawf11y38pttzo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8iu0eu05olzfhw9dtiq6ky13o?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8iu0eu05olzfhw9dtiq6ky13o?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8iu0eu05olzfhw9dtiq6ky13o?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8iu0eu05olzfhw9dtiq6ky13o?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8iu0eu05olzfhw9dtiq6ky13o?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8iu0eu05olzfhw9dtiq6ky13o?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8m61jm0695di3t1zh1m42ipzo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8m61jm0695di3t1zh1m42ipzo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8m61jm0695di3t1zh1m42ipzo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8l1abyj4mb89webculp9gv384?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8l1abyj4mb89webculp9gv384?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8l1abyj4mb89webculp9gv384?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8n9ox4x3djbtyoxu6e9ql87pw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8n9ox4x3djbtyoxu6e9ql87pw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8n9ox4x3djbtyoxu6e9ql87pw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8le8pwlx5qy8d5u9kb7qzjjtg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8le8pwlx5qy8d5u9kb7qzjjtg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8le8pwlx5qy8d5u9kb7qzjjtg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8lr7b5k2ldlg9ay9ywuglg2l0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8lr7b5k2ldlg9ay9ywuglg2l0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8lr7b5k2ldlg9ay9ywuglg2l0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8nmn1xca5xdo23s4gtb8lls0k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8nmn1xca5xdo23s4gtb8lls0k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8nmn1xca5xdo23s4gtb8lls0k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8mwvsz54aizvwupnnp3cbrpqs?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8mwvsz54aizvwupnnp3cbrpqs?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8mwvsz54aizvwupnnp3cbrpqs?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8nzoxw2teakhbe2jh9i0gfx90?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8nzoxw2teakhbe2jh9i0gfx90?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8nzoxw2teakhbe2jh9i0gfx90?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8mjg66mfxwnem85kb3nitf6z8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8mjg66mfxwnem85kb3nitf6z8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8mjg66mfxwnem85kb3nitf6z8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8lr7b5k2ldlg9ay9ywuglg2l0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8lr7b5k2ldlg9ay9ywuglg2l0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8lr7b5k2ldlg9ay9ywuglg2l0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8nmn1xca5xdo23s4gtb8lls0k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8nmn1xca5xdo23s4gtb8lls0k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8nmn1xca5xdo23s4gtb8lls0k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8mwvsz54aizvwupnnp3cbrpqs?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8mwvsz54aizvwupnnp3cbrpqs?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8mwvsz54aizvwupnnp3cbrpqs?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8nzoxw2teakhbe2jh9i0gfx90?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8nzoxw2teakhbe2jh9i0gfx90?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8nzoxw2teakhbe2jh9i0gfx90?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8mjg66mfxwnem85kb3nitf6z8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8mjg66mfxwnem85kb3nitf6z8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8mjg66mfxwnem85kb3nitf6z8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8lr7b5k2ldlg9ay9ywuglg2l0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8lr7b5k2ldlg9ay9ywuglg2l0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8lr7b5k2ldlg9ay9ywuglg2l0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8nmn1xca5xdo23s4gtb8lls0k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8nmn1xca5xdo23s4gtb8lls0k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8nmn1xca5xdo23s4gtb8lls0k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8mwvsz54aizvwupnnp3cbrpqs?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8mwvsz54aizvwupnnp3cbrpqs?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8mwvsz54aizvwupnnp3cbrpqs?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8nzoxw2teakhbe2jh9i0gfx90?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8nzoxw2teakhbe2jh9i0gfx90?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8nzoxw2teakhbe2jh9i0gfx90?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8mjg66mfxwnem85kb3nitf6z8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8mjg66mfxwnem85kb3nitf6z8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8mjg66mfxwnem85kb3nitf6z8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8lr7b5k2ldlg9ay9ywuglg2l0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8lr7b5k2ldlg9ay9ywuglg2l0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8lr7b5k2ldlg9ay9ywuglg2l0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8nmn1xca5xdo23s4gtb8lls0k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8nmn1xca5xdo23s4gtb8lls0k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8nmn1xca5xdo23s4gtb8lls0k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8mwvsz54aizvwupnnp3cbrpqs?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8mwvsz54aizvwupnnp3cbrpqs?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8mwvsz54aizvwupnnp3cbrpqs?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8nzoxw2teakhbe2jh9i0gfx90?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8nzoxw2teakhbe2jh9i0gfx90?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8nzoxw2teakhbe2jh9i0gfx90?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8mjg66mfxwnem85kb3nitf6z8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8mjg66mfxwnem85kb3nitf6z8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8mjg66mfxwnem85kb3nitf6z8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8q5yf62i5yl0ot4ym0uxd515g?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8q5yf62i5yl0ot4ym0uxd515g?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8q5yf62i5yl0ot4ym0uxd515g?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8rnejfgr61rr87y76n4gp14ic?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8rnejfgr61rr87y76n4gp14ic?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8rnejfgr61rr87y76n4gp14ic?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8pfzlhw4q4pr9d2nisc1ok2l0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8pfzlhw4q4pr9d2nisc1ok2l0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8pfzlhw4q4pr9d2nisc1ok2l0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8q5yf62i5yl0ot4ym0uxd515g?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8q5yf62i5yl0ot4ym0uxd515g?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8q5yf62i5yl0ot4ym0uxd515g?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8rnejfgr61rr87y76n4gp14ic?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8rnejfgr61rr87y76n4gp14ic?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8rnejfgr61rr87y76n4gp14ic?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8pfzlhw4q4pr9d2nisc1ok2l0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8pfzlhw4q4pr9d2nisc1ok2l0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8pfzlhw4q4pr9d2nisc1ok2l0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8q5yf62i5yl0ot4ym0uxd515g?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8q5yf62i5yl0ot4ym0uxd515g?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8q5yf62i5yl0ot4ym0uxd515g?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8rnejfgr61rr87y76n4gp14ic?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8rnejfgr61rr87y76n4gp14ic?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8rnejfgr61rr87y76n4gp14ic?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8pfzlhw4q4pr9d2nisc1ok2l0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8pfzlhw4q4pr9d2nisc1ok2l0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8pfzlhw4q4pr9d2nisc1ok2l0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8pt0nxerev1jcpayuqh5thxqs?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8pt0nxerev1jcpayuqh5thxqs?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8pt0nxerev1jcpayuqh5thxqs?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8qiwhuqtz4k83y6vcytc85990?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8qiwhuqtz4k83y6vcytc85990?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8qiwhuqtz4k83y6vcytc85990?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8p2ygrl5ogeyf385asyl6g1lg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8p2ygrl5ogeyf385asyl6g1lg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8p2ygrl5ogeyf385asyl6g1lg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8raj02t7swdetk4k77a9qvaqc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8raj02t7swdetk4k77a9qvaqc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8raj02t7swdetk4k77a9qvaqc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8s0i2h2gjlw1unfpvrj8jrrbo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8s0i2h2gjlw1unfpvrj8jrrbo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8s0i2h2gjlw1unfpvrj8jrrbo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8opyrlt5g50keo2xedeyt3oyc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8opyrlt5g50keo2xedeyt3oyc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8opyrlt5g50keo2xedeyt3oyc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8qvr8lofhjrtkyrw40tfaz7dg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8qvr8lofhjrtkyrw40tfaz7dg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8qvr8lofhjrtkyrw40tfaz7dg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8qvr8lofhjrtkyrw40tfaz7dg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8qvr8lofhjrtkyrw40tfaz7dg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8qvr8lofhjrtkyrw40tfaz7dg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8qvr8lofhjrtkyrw40tfaz7dg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8qvr8lofhjrtkyrw40tfaz7dg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8qvr8lofhjrtkyrw40tfaz7dg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8tglqz9xpgdlyi9qxral86wic?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8tglqz9xpgdlyi9qxral86wic?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8tglqz9xpgdlyi9qxral86wic?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8uk41vn1mje6eth78y65vlclw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8uk41vn1mje6eth78y65vlclw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8uk41vn1mje6eth78y65vlclw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8u6zlr0c7l79pebns2rf09st0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8u6zlr0c7l79pebns2rf09st0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8u6zlr0c7l79pebns2rf09st0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8tglqz9xpgdlyi9qxral86wic?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8tglqz9xpgdlyi9qxral86wic?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8tglqz9xpgdlyi9qxral86wic?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8uk41vn1mje6eth78y65vlclw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8uk41vn1mje6eth78y65vlclw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8uk41vn1mje6eth78y65vlclw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8u6zlr0c7l79pebns2rf09st0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8u6zlr0c7l79pebns2rf09st0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8u6zlr0c7l79pebns2rf09st0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8tglqz9xpgdlyi9qxral86wic?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8tglqz9xpgdlyi9qxral86wic?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8tglqz9xpgdlyi9qxral86wic?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8uk41vn1mje6eth78y65vlclw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8uk41vn1mje6eth78y65vlclw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8uk41vn1mje6eth78y65vlclw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8u6zlr0c7l79pebns2rf09st0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8u6zlr0c7l79pebns2rf09st0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8u6zlr0c7l79pebns2rf09st0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8uxa18nrcv5jp17h7hljhej9w?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8uxa18nrcv5jp17h7hljhej9w?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8uxa18nrcv5jp17h7hljhej9w?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8t3hfx2qmbrqmf121xhh5iuxg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8t3hfx2qmbrqmf121xhh5iuxg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8t3hfx2qmbrqmf121xhh5iuxg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8ttrhrz6curqlzcaoir395mhg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8ttrhrz6curqlzcaoir395mhg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8ttrhrz6curqlzcaoir395mhg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8va96zv76899rjkufo8fg3nkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8va96zv76899rjkufo8fg3nkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8va96zv76899rjkufo8fg3nkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8uxa18nrcv5jp17h7hljhej9w?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8uxa18nrcv5jp17h7hljhej9w?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8uxa18nrcv5jp17h7hljhej9w?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8t3hfx2qmbrqmf121xhh5iuxg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8t3hfx2qmbrqmf121xhh5iuxg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8t3hfx2qmbrqmf121xhh5iuxg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8ttrhrz6curqlzcaoir395mhg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8ttrhrz6curqlzcaoir395mhg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8ttrhrz6curqlzcaoir395mhg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8va96zv76899rjkufo8fg3nkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8va96zv76899rjkufo8fg3nkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8va96zv76899rjkufo8fg3nkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8uxa18nrcv5jp17h7hljhej9w?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8uxa18nrcv5jp17h7hljhej9w?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8uxa18nrcv5jp17h7hljhej9w?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8t3hfx2qmbrqmf121xhh5iuxg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8t3hfx2qmbrqmf121xhh5iuxg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8t3hfx2qmbrqmf121xhh5iuxg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8ttrhrz6curqlzcaoir395mhg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8ttrhrz6curqlzcaoir395mhg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8ttrhrz6curqlzcaoir395mhg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8va96zv76899rjkufo8fg3nkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8va96zv76899rjkufo8fg3nkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8va96zv76899rjkufo8fg3nkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8uxa18nrcv5jp17h7hljhej9w?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8uxa18nrcv5jp17h7hljhej9w?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8uxa18nrcv5jp17h7hljhej9w?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8t3hfx2qmbrqmf121xhh5iuxg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8t3hfx2qmbrqmf121xhh5iuxg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8t3hfx2qmbrqmf121xhh5iuxg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8ttrhrz6curqlzcaoir395mhg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8ttrhrz6curqlzcaoir395mhg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8ttrhrz6curqlzcaoir395mhg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8va96zv76899rjkufo8fg3nkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8va96zv76899rjkufo8fg3nkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8va96zv76899rjkufo8fg3nkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8x5kyms2xx1kjlemiy7uiioes?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8x5kyms2xx1kjlemiy7uiioes?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8x5kyms2xx1kjlemiy7uiioes?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8wfe6k62b7wvovgb23aqt94wk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8wfe6k62b7wvovgb23aqt94wk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8wfe6k62b7wvovgb23aqt94wk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8x5kyms2xx1kjlemiy7uiioes?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8x5kyms2xx1kjlemiy7uiioes?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8x5kyms2xx1kjlemiy7uiioes?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8wfe6k62b7wvovgb23aqt94wk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8wfe6k62b7wvovgb23aqt94wk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8wfe6k62b7wvovgb23aqt94wk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8x5kyms2xx1kjlemiy7uiioes?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8x5kyms2xx1kjlemiy7uiioes?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8x5kyms2xx1kjlemiy7uiioes?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8wfe6k62b7wvovgb23aqt94wk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8wfe6k62b7wvovgb23aqt94wk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8wfe6k62b7wvovgb23aqt94wk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8xwf3hbvmv5u3je77855y6uj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8xwf3hbvmv5u3je77855y6uj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8xwf3hbvmv5u3je77855y6uj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8z07kznmko58udo9ezgyap7v8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8z07kznmko58udo9ezgyap7v8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8z07kznmko58udo9ezgyap7v8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8yn16jebv538a2gys6h5lyu50?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8yn16jebv538a2gys6h5lyu50?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8yn16jebv538a2gys6h5lyu50?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8xixiuoh6heddd35z6g9iwkk4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8xixiuoh6heddd35z6g9iwkk4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8xixiuoh6heddd35z6g9iwkk4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8wsf8u4zayk8bxmy6bqzorxg4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8wsf8u4zayk8bxmy6bqzorxg4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8wsf8u4zayk8bxmy6bqzorxg4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8y9r18ru7gnxiy2oi3z6ptvkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8y9r18ru7gnxiy2oi3z6ptvkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8y9r18ru7gnxiy2oi3z6ptvkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8y9r18ru7gnxiy2oi3z6ptvkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8y9r18ru7gnxiy2oi3z6ptvkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8y9r18ru7gnxiy2oi3z6ptvkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8y9r18ru7gnxiy2oi3z6ptvkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8y9r18ru7gnxiy2oi3z6ptvkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8y9r18ru7gnxiy2oi3z6ptvkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8y9r18ru7gnxiy2oi3z6ptvkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8y9r18ru7gnxiy2oi3z6ptvkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8y9r18ru7gnxiy2oi3z6ptvkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8y9r18ru7gnxiy2oi3z6ptvkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8y9r18ru7gnxiy2oi3z6ptvkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8y9r18ru7gnxiy2oi3z6ptvkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8y9r18ru7gnxiy2oi3z6ptvkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8y9r18ru7gnxiy2oi3z6ptvkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8y9r18ru7gnxiy2oi3z6ptvkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8y9r18ru7gnxiy2oi3z6ptvkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8y9r18ru7gnxiy2oi3z6ptvkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8y9r18ru7gnxiy2oi3z6ptvkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8y9r18ru7gnxiy2oi3z6ptvkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8y9r18ru7gnxiy2oi3z6ptvkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8y9r18ru7gnxiy2oi3z6ptvkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8y9r18ru7gnxiy2oi3z6ptvkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8y9r18ru7gnxiy2oi3z6ptvkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8y9r18ru7gnxiy2oi3z6ptvkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8y9r18ru7gnxiy2oi3z6ptvkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8y9r18ru7gnxiy2oi3z6ptvkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8y9r18ru7gnxiy2oi3z6ptvkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8zqsskipi1f45lho5ifemomj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8zqsskipi1f45lho5ifemomj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8zqsskipi1f45lho5ifemomj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90h6rndewyn31oaytz67gflec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90h6rndewyn31oaytz67gflec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90h6rndewyn31oaytz67gflec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/92q8adrl635z5blt4jqz32xp0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/92q8adrl635z5blt4jqz32xp0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/92q8adrl635z5blt4jqz32xp0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90uqc37ev6mkhw9fwkrrstr10?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90uqc37ev6mkhw9fwkrrstr10?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90uqc37ev6mkhw9fwkrrstr10?",
-        "a2yu8vfo8wha3vza31s2o8zkk/91mhc8y76q81eav9ai006dces?",
-        "a2yu8vfo8wha3vza31s2o8zkk/91mhc8y76q81eav9ai006dces?",
-        "a2yu8vfo8wha3vza31s2o8zkk/91mhc8y76q81eav9ai006dces?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8zqsskipi1f45lho5ifemomj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8zqsskipi1f45lho5ifemomj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8zqsskipi1f45lho5ifemomj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90h6rndewyn31oaytz67gflec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90h6rndewyn31oaytz67gflec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90h6rndewyn31oaytz67gflec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/92q8adrl635z5blt4jqz32xp0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/92q8adrl635z5blt4jqz32xp0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/92q8adrl635z5blt4jqz32xp0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90uqc37ev6mkhw9fwkrrstr10?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90uqc37ev6mkhw9fwkrrstr10?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90uqc37ev6mkhw9fwkrrstr10?",
-        "a2yu8vfo8wha3vza31s2o8zkk/91mhc8y76q81eav9ai006dces?",
-        "a2yu8vfo8wha3vza31s2o8zkk/91mhc8y76q81eav9ai006dces?",
-        "a2yu8vfo8wha3vza31s2o8zkk/91mhc8y76q81eav9ai006dces?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8zqsskipi1f45lho5ifemomj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8zqsskipi1f45lho5ifemomj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8zqsskipi1f45lho5ifemomj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90h6rndewyn31oaytz67gflec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90h6rndewyn31oaytz67gflec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90h6rndewyn31oaytz67gflec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/92q8adrl635z5blt4jqz32xp0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/92q8adrl635z5blt4jqz32xp0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/92q8adrl635z5blt4jqz32xp0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90uqc37ev6mkhw9fwkrrstr10?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90uqc37ev6mkhw9fwkrrstr10?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90uqc37ev6mkhw9fwkrrstr10?",
-        "a2yu8vfo8wha3vza31s2o8zkk/91mhc8y76q81eav9ai006dces?",
-        "a2yu8vfo8wha3vza31s2o8zkk/91mhc8y76q81eav9ai006dces?",
-        "a2yu8vfo8wha3vza31s2o8zkk/91mhc8y76q81eav9ai006dces?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8zqsskipi1f45lho5ifemomj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8zqsskipi1f45lho5ifemomj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8zqsskipi1f45lho5ifemomj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90h6rndewyn31oaytz67gflec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90h6rndewyn31oaytz67gflec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90h6rndewyn31oaytz67gflec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/92q8adrl635z5blt4jqz32xp0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/92q8adrl635z5blt4jqz32xp0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/92q8adrl635z5blt4jqz32xp0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90uqc37ev6mkhw9fwkrrstr10?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90uqc37ev6mkhw9fwkrrstr10?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90uqc37ev6mkhw9fwkrrstr10?",
-        "a2yu8vfo8wha3vza31s2o8zkk/91mhc8y76q81eav9ai006dces?",
-        "a2yu8vfo8wha3vza31s2o8zkk/91mhc8y76q81eav9ai006dces?",
-        "a2yu8vfo8wha3vza31s2o8zkk/91mhc8y76q81eav9ai006dces?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8zqsskipi1f45lho5ifemomj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8zqsskipi1f45lho5ifemomj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8zqsskipi1f45lho5ifemomj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90h6rndewyn31oaytz67gflec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90h6rndewyn31oaytz67gflec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90h6rndewyn31oaytz67gflec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/92q8adrl635z5blt4jqz32xp0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/92q8adrl635z5blt4jqz32xp0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/92q8adrl635z5blt4jqz32xp0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90uqc37ev6mkhw9fwkrrstr10?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90uqc37ev6mkhw9fwkrrstr10?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90uqc37ev6mkhw9fwkrrstr10?",
-        "a2yu8vfo8wha3vza31s2o8zkk/91mhc8y76q81eav9ai006dces?",
-        "a2yu8vfo8wha3vza31s2o8zkk/91mhc8y76q81eav9ai006dces?",
-        "a2yu8vfo8wha3vza31s2o8zkk/91mhc8y76q81eav9ai006dces?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8zqsskipi1f45lho5ifemomj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8zqsskipi1f45lho5ifemomj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8zqsskipi1f45lho5ifemomj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90h6rndewyn31oaytz67gflec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90h6rndewyn31oaytz67gflec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90h6rndewyn31oaytz67gflec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/92q8adrl635z5blt4jqz32xp0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/92q8adrl635z5blt4jqz32xp0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/92q8adrl635z5blt4jqz32xp0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90uqc37ev6mkhw9fwkrrstr10?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90uqc37ev6mkhw9fwkrrstr10?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90uqc37ev6mkhw9fwkrrstr10?",
-        "a2yu8vfo8wha3vza31s2o8zkk/91mhc8y76q81eav9ai006dces?",
-        "a2yu8vfo8wha3vza31s2o8zkk/91mhc8y76q81eav9ai006dces?",
-        "a2yu8vfo8wha3vza31s2o8zkk/91mhc8y76q81eav9ai006dces?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8zqsskipi1f45lho5ifemomj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8zqsskipi1f45lho5ifemomj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8zqsskipi1f45lho5ifemomj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90h6rndewyn31oaytz67gflec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90h6rndewyn31oaytz67gflec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90h6rndewyn31oaytz67gflec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/92q8adrl635z5blt4jqz32xp0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/92q8adrl635z5blt4jqz32xp0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/92q8adrl635z5blt4jqz32xp0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90uqc37ev6mkhw9fwkrrstr10?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90uqc37ev6mkhw9fwkrrstr10?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90uqc37ev6mkhw9fwkrrstr10?",
-        "a2yu8vfo8wha3vza31s2o8zkk/91mhc8y76q81eav9ai006dces?",
-        "a2yu8vfo8wha3vza31s2o8zkk/91mhc8y76q81eav9ai006dces?",
-        "a2yu8vfo8wha3vza31s2o8zkk/91mhc8y76q81eav9ai006dces?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8zqsskipi1f45lho5ifemomj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8zqsskipi1f45lho5ifemomj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8zqsskipi1f45lho5ifemomj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90h6rndewyn31oaytz67gflec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90h6rndewyn31oaytz67gflec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90h6rndewyn31oaytz67gflec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/92q8adrl635z5blt4jqz32xp0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/92q8adrl635z5blt4jqz32xp0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/92q8adrl635z5blt4jqz32xp0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90uqc37ev6mkhw9fwkrrstr10?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90uqc37ev6mkhw9fwkrrstr10?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90uqc37ev6mkhw9fwkrrstr10?",
-        "a2yu8vfo8wha3vza31s2o8zkk/91mhc8y76q81eav9ai006dces?",
-        "a2yu8vfo8wha3vza31s2o8zkk/91mhc8y76q81eav9ai006dces?",
-        "a2yu8vfo8wha3vza31s2o8zkk/91mhc8y76q81eav9ai006dces?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8zqsskipi1f45lho5ifemomj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8zqsskipi1f45lho5ifemomj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8zqsskipi1f45lho5ifemomj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90h6rndewyn31oaytz67gflec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90h6rndewyn31oaytz67gflec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90h6rndewyn31oaytz67gflec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/92q8adrl635z5blt4jqz32xp0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/92q8adrl635z5blt4jqz32xp0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/92q8adrl635z5blt4jqz32xp0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90uqc37ev6mkhw9fwkrrstr10?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90uqc37ev6mkhw9fwkrrstr10?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90uqc37ev6mkhw9fwkrrstr10?",
-        "a2yu8vfo8wha3vza31s2o8zkk/91mhc8y76q81eav9ai006dces?",
-        "a2yu8vfo8wha3vza31s2o8zkk/91mhc8y76q81eav9ai006dces?",
-        "a2yu8vfo8wha3vza31s2o8zkk/91mhc8y76q81eav9ai006dces?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8zqsskipi1f45lho5ifemomj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8zqsskipi1f45lho5ifemomj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8zqsskipi1f45lho5ifemomj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90h6rndewyn31oaytz67gflec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90h6rndewyn31oaytz67gflec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90h6rndewyn31oaytz67gflec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/92q8adrl635z5blt4jqz32xp0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/92q8adrl635z5blt4jqz32xp0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/92q8adrl635z5blt4jqz32xp0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90uqc37ev6mkhw9fwkrrstr10?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90uqc37ev6mkhw9fwkrrstr10?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90uqc37ev6mkhw9fwkrrstr10?",
-        "a2yu8vfo8wha3vza31s2o8zkk/91mhc8y76q81eav9ai006dces?",
-        "a2yu8vfo8wha3vza31s2o8zkk/91mhc8y76q81eav9ai006dces?",
-        "a2yu8vfo8wha3vza31s2o8zkk/91mhc8y76q81eav9ai006dces?",
-        "a2yu8vfo8wha3vza31s2o8zkk/933gj15al7drgque412f78yz8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/933gj15al7drgque412f78yz8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/933gj15al7drgque412f78yz8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/919ejpqxqlfa2hwvlygxlp6hg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/919ejpqxqlfa2hwvlygxlp6hg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/919ejpqxqlfa2hwvlygxlp6hg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90412g2fy4gmkmk6ov7gk5a1g?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90412g2fy4gmkmk6ov7gk5a1g?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90412g2fy4gmkmk6ov7gk5a1g?",
-        "a2yu8vfo8wha3vza31s2o8zkk/92czdq0y363rvhtjiwzrjvdp0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/92czdq0y363rvhtjiwzrjvdp0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/92czdq0y363rvhtjiwzrjvdp0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/91zp0x293nnel2xfvq3msllw4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/91zp0x293nnel2xfvq3msllw4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/91zp0x293nnel2xfvq3msllw4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/933gj15al7drgque412f78yz8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/933gj15al7drgque412f78yz8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/933gj15al7drgque412f78yz8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/919ejpqxqlfa2hwvlygxlp6hg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/919ejpqxqlfa2hwvlygxlp6hg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/919ejpqxqlfa2hwvlygxlp6hg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90412g2fy4gmkmk6ov7gk5a1g?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90412g2fy4gmkmk6ov7gk5a1g?",
-        "a2yu8vfo8wha3vza31s2o8zkk/90412g2fy4gmkmk6ov7gk5a1g?",
-        "a2yu8vfo8wha3vza31s2o8zkk/92czdq0y363rvhtjiwzrjvdp0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/92czdq0y363rvhtjiwzrjvdp0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/92czdq0y363rvhtjiwzrjvdp0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/91zp0x293nnel2xfvq3msllw4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/91zp0x293nnel2xfvq3msllw4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/91zp0x293nnel2xfvq3msllw4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8kanvakf34rfsatt4624jszkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8kanvakf34rfsatt4624jszkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8kanvakf34rfsatt4624jszkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8vneqtfjwaw4g2rzeh5gqucr8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8vneqtfjwaw4g2rzeh5gqucr8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8vneqtfjwaw4g2rzeh5gqucr8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8kanvakf34rfsatt4624jszkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8kanvakf34rfsatt4624jszkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8kanvakf34rfsatt4624jszkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8vneqtfjwaw4g2rzeh5gqucr8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8vneqtfjwaw4g2rzeh5gqucr8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8vneqtfjwaw4g2rzeh5gqucr8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8kanvakf34rfsatt4624jszkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8kanvakf34rfsatt4624jszkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8kanvakf34rfsatt4624jszkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8vneqtfjwaw4g2rzeh5gqucr8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8vneqtfjwaw4g2rzeh5gqucr8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8vneqtfjwaw4g2rzeh5gqucr8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8kanvakf34rfsatt4624jszkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8kanvakf34rfsatt4624jszkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8kanvakf34rfsatt4624jszkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8vneqtfjwaw4g2rzeh5gqucr8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8vneqtfjwaw4g2rzeh5gqucr8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8vneqtfjwaw4g2rzeh5gqucr8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8zde5p8dh7zrrvdn7p4xx1xqs?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8zde5p8dh7zrrvdn7p4xx1xqs?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8zde5p8dh7zrrvdn7p4xx1xqs?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8zde5p8dh7zrrvdn7p4xx1xqs?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8zde5p8dh7zrrvdn7p4xx1xqs?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8zde5p8dh7zrrvdn7p4xx1xqs?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8zde5p8dh7zrrvdn7p4xx1xqs?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8zde5p8dh7zrrvdn7p4xx1xqs?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8zde5p8dh7zrrvdn7p4xx1xqs?",
-        "a2yu8vfo8wha3vza31s2o8zkk/96sleul31ydbnpx54a39b66ms?",
-        "a2yu8vfo8wha3vza31s2o8zkk/96sleul31ydbnpx54a39b66ms?",
-        "a2yu8vfo8wha3vza31s2o8zkk/96sleul31ydbnpx54a39b66ms?",
-        "a2yu8vfo8wha3vza31s2o8zkk/96fiql81cucmdchgavg43uaz8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/96fiql81cucmdchgavg43uaz8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/96fiql81cucmdchgavg43uaz8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/94xafla94guu5isx3ngzi0e8k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/94xafla94guu5isx3ngzi0e8k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/94xafla94guu5isx3ngzi0e8k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/95nghevt0176h5zuoode7lwd0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/95nghevt0176h5zuoode7lwd0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/95nghevt0176h5zuoode7lwd0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/96sleul31ydbnpx54a39b66ms?",
-        "a2yu8vfo8wha3vza31s2o8zkk/96sleul31ydbnpx54a39b66ms?",
-        "a2yu8vfo8wha3vza31s2o8zkk/96sleul31ydbnpx54a39b66ms?",
-        "a2yu8vfo8wha3vza31s2o8zkk/96fiql81cucmdchgavg43uaz8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/96fiql81cucmdchgavg43uaz8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/96fiql81cucmdchgavg43uaz8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/94xafla94guu5isx3ngzi0e8k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/94xafla94guu5isx3ngzi0e8k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/94xafla94guu5isx3ngzi0e8k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/95nghevt0176h5zuoode7lwd0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/95nghevt0176h5zuoode7lwd0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/95nghevt0176h5zuoode7lwd0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/93ttxgmczbo7rffk2v8uyw74k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/93ttxgmczbo7rffk2v8uyw74k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/93ttxgmczbo7rffk2v8uyw74k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/93gpr0f7o07sygi5as146oems?",
-        "a2yu8vfo8wha3vza31s2o8zkk/93gpr0f7o07sygi5as146oems?",
-        "a2yu8vfo8wha3vza31s2o8zkk/93gpr0f7o07sygi5as146oems?",
-        "a2yu8vfo8wha3vza31s2o8zkk/94k6e4yftfqyidayyl2s5sjdg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/94k6e4yftfqyidayyl2s5sjdg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/94k6e4yftfqyidayyl2s5sjdg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/960pwga5dm8f6l3ax2sbu0utw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/960pwga5dm8f6l3ax2sbu0utw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/960pwga5dm8f6l3ax2sbu0utw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9471zu995hw2of35krrflbytw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9471zu995hw2of35krrflbytw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9471zu995hw2of35krrflbytw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/95ael5h7fluxckozkgxke1jbo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/95ael5h7fluxckozkgxke1jbo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/95ael5h7fluxckozkgxke1jbo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/93ttxgmczbo7rffk2v8uyw74k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/93ttxgmczbo7rffk2v8uyw74k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/93ttxgmczbo7rffk2v8uyw74k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/93gpr0f7o07sygi5as146oems?",
-        "a2yu8vfo8wha3vza31s2o8zkk/93gpr0f7o07sygi5as146oems?",
-        "a2yu8vfo8wha3vza31s2o8zkk/93gpr0f7o07sygi5as146oems?",
-        "a2yu8vfo8wha3vza31s2o8zkk/94k6e4yftfqyidayyl2s5sjdg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/94k6e4yftfqyidayyl2s5sjdg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/94k6e4yftfqyidayyl2s5sjdg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/960pwga5dm8f6l3ax2sbu0utw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/960pwga5dm8f6l3ax2sbu0utw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/960pwga5dm8f6l3ax2sbu0utw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9471zu995hw2of35krrflbytw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9471zu995hw2of35krrflbytw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9471zu995hw2of35krrflbytw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/95ael5h7fluxckozkgxke1jbo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/95ael5h7fluxckozkgxke1jbo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/95ael5h7fluxckozkgxke1jbo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/99d0r6ocxx3k7muz0fe07dous?",
-        "a2yu8vfo8wha3vza31s2o8zkk/99d0r6ocxx3k7muz0fe07dous?",
-        "a2yu8vfo8wha3vza31s2o8zkk/99d0r6ocxx3k7muz0fe07dous?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9899rxqvxusd6wk0pdewsesyc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9899rxqvxusd6wk0pdewsesyc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9899rxqvxusd6wk0pdewsesyc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/99qafgahe31fhx4fm520or47o?",
-        "a2yu8vfo8wha3vza31s2o8zkk/99qafgahe31fhx4fm520or47o?",
-        "a2yu8vfo8wha3vza31s2o8zkk/99qafgahe31fhx4fm520or47o?",
-        "a2yu8vfo8wha3vza31s2o8zkk/98zs3ukecylbsovwdgxc00178?",
-        "a2yu8vfo8wha3vza31s2o8zkk/98zs3ukecylbsovwdgxc00178?",
-        "a2yu8vfo8wha3vza31s2o8zkk/98zs3ukecylbsovwdgxc00178?",
-        "a2yu8vfo8wha3vza31s2o8zkk/97w523twbfg4ij0jwdjsprmz8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/97w523twbfg4ij0jwdjsprmz8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/97w523twbfg4ij0jwdjsprmz8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/98mkxq34hm0uj19gyeazai68k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/98mkxq34hm0uj19gyeazai68k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/98mkxq34hm0uj19gyeazai68k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/975rcw8juw9c2xpr3f2wwvac4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/975rcw8juw9c2xpr3f2wwvac4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/975rcw8juw9c2xpr3f2wwvac4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9agpqa9efctc0mpw8bqzs4qac?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9agpqa9efctc0mpw8bqzs4qac?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9agpqa9efctc0mpw8bqzs4qac?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9a3ju78fykixunqvwma8mhtlg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9a3ju78fykixunqvwma8mhtlg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9a3ju78fykixunqvwma8mhtlg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/97ixm5l16f2fernrqn3wxswt0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/97ixm5l16f2fernrqn3wxswt0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/97ixm5l16f2fernrqn3wxswt0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/97ixm5l16f2fernrqn3wxswt0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/97ixm5l16f2fernrqn3wxswt0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/97ixm5l16f2fernrqn3wxswt0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9dt9y8y25qgpmjjqrgg3e4a38?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9dt9y8y25qgpmjjqrgg3e4a38?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9dt9y8y25qgpmjjqrgg3e4a38?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9ccetftmuj5fercpzl0f3493o?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9ccetftmuj5fercpzl0f3493o?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9ccetftmuj5fercpzl0f3493o?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9e6jgl6vwpdripk9a130kxdec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9e6jgl6vwpdripk9a130kxdec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9e6jgl6vwpdripk9a130kxdec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9d2wif47gruz83gmjix5plgyc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9d2wif47gruz83gmjix5plgyc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9d2wif47gruz83gmjix5plgyc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9dg5fzi34r6mnpwkxxmjz5kic?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9dg5fzi34r6mnpwkxxmjz5kic?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9dg5fzi34r6mnpwkxxmjz5kic?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9b78iq61t8g6mnsvymmpxwhlg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9b78iq61t8g6mnsvymmpxwhlg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9b78iq61t8g6mnsvymmpxwhlg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9atybt2vu6so3zdl9qbaitatw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9atybt2vu6so3zdl9qbaitatw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9atybt2vu6so3zdl9qbaitatw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9bm1dq1q5u05u7j4uipypmrkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9bm1dq1q5u05u7j4uipypmrkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9bm1dq1q5u05u7j4uipypmrkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9bz48dmw62ooe5w8k1j59u5uc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9bz48dmw62ooe5w8k1j59u5uc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9bz48dmw62ooe5w8k1j59u5uc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9cpnm7lcewmn9uqh9d3vej7dg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9cpnm7lcewmn9uqh9d3vej7dg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9cpnm7lcewmn9uqh9d3vej7dg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9bm1dq1q5u05u7j4uipypmrkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9bm1dq1q5u05u7j4uipypmrkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9bm1dq1q5u05u7j4uipypmrkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9bz48dmw62ooe5w8k1j59u5uc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9bz48dmw62ooe5w8k1j59u5uc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9bz48dmw62ooe5w8k1j59u5uc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9cpnm7lcewmn9uqh9d3vej7dg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9cpnm7lcewmn9uqh9d3vej7dg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9cpnm7lcewmn9uqh9d3vej7dg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9hxghastklvv07uqzbbg94t90?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9hxghastklvv07uqzbbg94t90?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9hxghastklvv07uqzbbg94t90?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9ejxq29hl7z6lepnwfem38nx0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9ejxq29hl7z6lepnwfem38nx0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9ejxq29hl7z6lepnwfem38nx0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9hk7ipae9dmvjneodlape2x3o?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9hk7ipae9dmvjneodlape2x3o?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9hk7ipae9dmvjneodlape2x3o?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9g1gni35vvd4ja3vgpsx8lwyc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9g1gni35vvd4ja3vgpsx8lwyc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9g1gni35vvd4ja3vgpsx8lwyc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9h6zod70tjpvqavatz0zror2s?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9h6zod70tjpvqavatz0zror2s?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9h6zod70tjpvqavatz0zror2s?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9fnnnholpwef4vovxgf7c14pg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9fnnnholpwef4vovxgf7c14pg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9fnnnholpwef4vovxgf7c14pg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9fafith1pqt8zkyjpcqmmh5w4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9fafith1pqt8zkyjpcqmmh5w4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9fafith1pqt8zkyjpcqmmh5w4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9ggcbaycch4njudt4nxg8dlhw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9ggcbaycch4njudt4nxg8dlhw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9ggcbaycch4njudt4nxg8dlhw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9gtkcv57u04p2fhg9bgybaadw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9gtkcv57u04p2fhg9bgybaadw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9gtkcv57u04p2fhg9bgybaadw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9ex7jzfkid79h0df4v410o2dw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9ex7jzfkid79h0df4v410o2dw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9ex7jzfkid79h0df4v410o2dw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9h6zod70tjpvqavatz0zror2s?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9h6zod70tjpvqavatz0zror2s?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9h6zod70tjpvqavatz0zror2s?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9fnnnholpwef4vovxgf7c14pg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9fnnnholpwef4vovxgf7c14pg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9fnnnholpwef4vovxgf7c14pg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9fafith1pqt8zkyjpcqmmh5w4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9fafith1pqt8zkyjpcqmmh5w4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9fafith1pqt8zkyjpcqmmh5w4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9ggcbaycch4njudt4nxg8dlhw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9ggcbaycch4njudt4nxg8dlhw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9ggcbaycch4njudt4nxg8dlhw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9gtkcv57u04p2fhg9bgybaadw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9gtkcv57u04p2fhg9bgybaadw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9gtkcv57u04p2fhg9bgybaadw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9ex7jzfkid79h0df4v410o2dw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9ex7jzfkid79h0df4v410o2dw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9ex7jzfkid79h0df4v410o2dw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9io2hkddq5sehuh27x0sd7llg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9io2hkddq5sehuh27x0sd7llg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9io2hkddq5sehuh27x0sd7llg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9jrkiu82a9hupcbfauaffzytw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9jrkiu82a9hupcbfauaffzytw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9jrkiu82a9hupcbfauaffzytw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9l9x727ma9des7666tbov9s7o?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9l9x727ma9des7666tbov9s7o?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9l9x727ma9des7666tbov9s7o?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9lp1z860yzsscyant69da1jbo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9lp1z860yzsscyant69da1jbo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9lp1z860yzsscyant69da1jbo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9k4t5s923s7ayymv8ogl7rz84?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9k4t5s923s7ayymv8ogl7rz84?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9k4t5s923s7ayymv8ogl7rz84?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9kvoucwetvxv1o1fuxsukgtn8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9kvoucwetvxv1o1fuxsukgtn8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9kvoucwetvxv1o1fuxsukgtn8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9j19olx98htqyju2rfq0d5xjo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9j19olx98htqyju2rfq0d5xjo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9j19olx98htqyju2rfq0d5xjo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9iay7p24i8e05ltlwya8fidxw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9iay7p24i8e05ltlwya8fidxw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9iay7p24i8e05ltlwya8fidxw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9io2hkddq5sehuh27x0sd7llg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9io2hkddq5sehuh27x0sd7llg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9io2hkddq5sehuh27x0sd7llg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9jrkiu82a9hupcbfauaffzytw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9jrkiu82a9hupcbfauaffzytw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9jrkiu82a9hupcbfauaffzytw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9l9x727ma9des7666tbov9s7o?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9l9x727ma9des7666tbov9s7o?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9l9x727ma9des7666tbov9s7o?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9lp1z860yzsscyant69da1jbo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9lp1z860yzsscyant69da1jbo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9lp1z860yzsscyant69da1jbo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9k4t5s923s7ayymv8ogl7rz84?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9k4t5s923s7ayymv8ogl7rz84?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9k4t5s923s7ayymv8ogl7rz84?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9kvoucwetvxv1o1fuxsukgtn8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9kvoucwetvxv1o1fuxsukgtn8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9kvoucwetvxv1o1fuxsukgtn8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9j19olx98htqyju2rfq0d5xjo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9j19olx98htqyju2rfq0d5xjo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9j19olx98htqyju2rfq0d5xjo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9iay7p24i8e05ltlwya8fidxw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9iay7p24i8e05ltlwya8fidxw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9iay7p24i8e05ltlwya8fidxw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9jehqgcu05rtb6v9o6dvuowt0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9jehqgcu05rtb6v9o6dvuowt0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9jehqgcu05rtb6v9o6dvuowt0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9ki90dkblc4l5k5rwbha9xkb8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9ki90dkblc4l5k5rwbha9xkb8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9ki90dkblc4l5k5rwbha9xkb8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9jehqgcu05rtb6v9o6dvuowt0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9jehqgcu05rtb6v9o6dvuowt0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9jehqgcu05rtb6v9o6dvuowt0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9ki90dkblc4l5k5rwbha9xkb8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9ki90dkblc4l5k5rwbha9xkb8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9ki90dkblc4l5k5rwbha9xkb8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9p0zq700t1v9ivwi8wn6q77ys?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9p0zq700t1v9ivwi8wn6q77ys?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9p0zq700t1v9ivwi8wn6q77ys?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9njpckxvpzo4dpe909q58rmdw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9njpckxvpzo4dpe909q58rmdw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9njpckxvpzo4dpe909q58rmdw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9mfwqf4bbnbahd0rjxclnf8yc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9mfwqf4bbnbahd0rjxclnf8yc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9mfwqf4bbnbahd0rjxclnf8yc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9oa8z8tgr0486b7f7y73iritw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9oa8z8tgr0486b7f7y73iritw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9oa8z8tgr0486b7f7y73iritw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9ongcp8i5cmigh47539dpr9jo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9ongcp8i5cmigh47539dpr9jo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9ongcp8i5cmigh47539dpr9jo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9m2dz7esj2tzaj11qeeyi385w?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9m2dz7esj2tzaj11qeeyi385w?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9m2dz7esj2tzaj11qeeyi385w?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9pe8l7umiohtzwkv41g96cmc4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9pe8l7umiohtzwkv41g96cmc4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9pe8l7umiohtzwkv41g96cmc4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9n6kh7y8orpjz5swz36sl7qc4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9n6kh7y8orpjz5swz36sl7qc4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9n6kh7y8orpjz5swz36sl7qc4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9mtcnpxxigti43fua836cij9w?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9mtcnpxxigti43fua836cij9w?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9mtcnpxxigti43fua836cij9w?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9nwy1sh4qoqcai36v4qlpe0b8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9nwy1sh4qoqcai36v4qlpe0b8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9nwy1sh4qoqcai36v4qlpe0b8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9nwy1sh4qoqcai36v4qlpe0b8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9nwy1sh4qoqcai36v4qlpe0b8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9nwy1sh4qoqcai36v4qlpe0b8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9sre1yngyv6caydkkfc3f43kk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9sre1yngyv6caydkkfc3f43kk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9sre1yngyv6caydkkfc3f43kk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9t4lpb6lfg4n43yn0exnr6bdg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9t4lpb6lfg4n43yn0exnr6bdg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9t4lpb6lfg4n43yn0exnr6bdg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9ra414eix6hp523smik3t9n2s?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9ra414eix6hp523smik3t9n2s?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9ra414eix6hp523smik3t9n2s?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9se8pfqsm0v1j6834ogxxjhuc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9se8pfqsm0v1j6834ogxxjhuc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9se8pfqsm0v1j6834ogxxjhuc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9q4ukdqgpg8j92po7b25ca1hw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9q4ukdqgpg8j92po7b25ca1hw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9q4ukdqgpg8j92po7b25ca1hw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9s0xz8zqc4s5yzg9hqqmj2978?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9s0xz8zqc4s5yzg9hqqmj2978?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9s0xz8zqc4s5yzg9hqqmj2978?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9qi4ea9i1pnhksr2y8kjfjjtg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9qi4ea9i1pnhksr2y8kjfjjtg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9qi4ea9i1pnhksr2y8kjfjjtg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9prpw62gvfistmnrnay5ij504?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9prpw62gvfistmnrnay5ij504?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9prpw62gvfistmnrnay5ij504?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9qwyc99dz4on5p5lq0asu3aj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9qwyc99dz4on5p5lq0asu3aj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9qwyc99dz4on5p5lq0asu3aj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9rnhagk9baggobcz02e2gwduc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9rnhagk9baggobcz02e2gwduc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9rnhagk9baggobcz02e2gwduc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9qi4ea9i1pnhksr2y8kjfjjtg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9qi4ea9i1pnhksr2y8kjfjjtg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9qi4ea9i1pnhksr2y8kjfjjtg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9prpw62gvfistmnrnay5ij504?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9prpw62gvfistmnrnay5ij504?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9prpw62gvfistmnrnay5ij504?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9qwyc99dz4on5p5lq0asu3aj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9qwyc99dz4on5p5lq0asu3aj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9qwyc99dz4on5p5lq0asu3aj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9rnhagk9baggobcz02e2gwduc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9rnhagk9baggobcz02e2gwduc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9rnhagk9baggobcz02e2gwduc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9vqivvr1rcjgae1yzmktrahhw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9vqivvr1rcjgae1yzmktrahhw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9vqivvr1rcjgae1yzmktrahhw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9ulj8ejcfq8vix3fg92y0j4lw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9ulj8ejcfq8vix3fg92y0j4lw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9ulj8ejcfq8vix3fg92y0j4lw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9w3kx4tat3mj268ul0ruqstg4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9w3kx4tat3mj268ul0ruqstg4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9w3kx4tat3mj268ul0ruqstg4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9tv1mkywjsy4haxtafu094wes?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9tv1mkywjsy4haxtafu094wes?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9tv1mkywjsy4haxtafu094wes?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9wu52lhyj0v00tq2xriqxvl78?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9wu52lhyj0v00tq2xriqxvl78?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9wu52lhyj0v00tq2xriqxvl78?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9thrpvqaluwly1wi1bmmc4844?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9thrpvqaluwly1wi1bmmc4844?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9thrpvqaluwly1wi1bmmc4844?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9u89h1r9ks4pofd2efj80qa6s?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9u89h1r9ks4pofd2efj80qa6s?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9u89h1r9ks4pofd2efj80qa6s?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9vbtg243ab03itrqlly59j0gk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9vbtg243ab03itrqlly59j0gk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9vbtg243ab03itrqlly59j0gk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9wgujb3xbyp6pfstyxhgmwu1g?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9wgujb3xbyp6pfstyxhgmwu1g?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9wgujb3xbyp6pfstyxhgmwu1g?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9uyotthyud3edvmc0phqfy8es?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9uyotthyud3edvmc0phqfy8es?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9uyotthyud3edvmc0phqfy8es?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9w3kx4tat3mj268ul0ruqstg4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9w3kx4tat3mj268ul0ruqstg4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9w3kx4tat3mj268ul0ruqstg4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9tv1mkywjsy4haxtafu094wes?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9tv1mkywjsy4haxtafu094wes?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9tv1mkywjsy4haxtafu094wes?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9wu52lhyj0v00tq2xriqxvl78?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9wu52lhyj0v00tq2xriqxvl78?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9wu52lhyj0v00tq2xriqxvl78?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9thrpvqaluwly1wi1bmmc4844?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9thrpvqaluwly1wi1bmmc4844?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9thrpvqaluwly1wi1bmmc4844?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9u89h1r9ks4pofd2efj80qa6s?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9u89h1r9ks4pofd2efj80qa6s?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9u89h1r9ks4pofd2efj80qa6s?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9vbtg243ab03itrqlly59j0gk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9vbtg243ab03itrqlly59j0gk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9vbtg243ab03itrqlly59j0gk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9wgujb3xbyp6pfstyxhgmwu1g?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9wgujb3xbyp6pfstyxhgmwu1g?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9wgujb3xbyp6pfstyxhgmwu1g?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9uyotthyud3edvmc0phqfy8es?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9uyotthyud3edvmc0phqfy8es?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9uyotthyud3edvmc0phqfy8es?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9x7ipfxd9p45p07eplk23v1uc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9x7ipfxd9p45p07eplk23v1uc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9x7ipfxd9p45p07eplk23v1uc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9zt0t2kwqd14n4aij0175idjo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9zt0t2kwqd14n4aij0175idjo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9zt0t2kwqd14n4aij0175idjo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9yp6616415wow10s1s1ld8jkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9yp6616415wow10s1s1ld8jkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9yp6616415wow10s1s1ld8jkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9x7ipfxd9p45p07eplk23v1uc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9x7ipfxd9p45p07eplk23v1uc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9x7ipfxd9p45p07eplk23v1uc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9zt0t2kwqd14n4aij0175idjo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9zt0t2kwqd14n4aij0175idjo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9zt0t2kwqd14n4aij0175idjo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9yp6616415wow10s1s1ld8jkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9yp6616415wow10s1s1ld8jkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9yp6616415wow10s1s1ld8jkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9z2cmm8ocq1vpqpp18g6lm32s?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9z2cmm8ocq1vpqpp18g6lm32s?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9z2cmm8ocq1vpqpp18g6lm32s?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a0jlvazgkqdn9ksz28bzk9yc4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a0jlvazgkqdn9ksz28bzk9yc4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a0jlvazgkqdn9ksz28bzk9yc4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9ybu8rfp6cgfel6k77lvs4jys?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9ybu8rfp6cgfel6k77lvs4jys?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9ybu8rfp6cgfel6k77lvs4jys?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9xl2rewn74ubla7v8jiklnpjo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9xl2rewn74ubla7v8jiklnpjo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9xl2rewn74ubla7v8jiklnpjo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9xyjw9s43rymjcx95a5ttqw44?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9xyjw9s43rymjcx95a5ttqw44?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9xyjw9s43rymjcx95a5ttqw44?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9z2cmm8ocq1vpqpp18g6lm32s?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9z2cmm8ocq1vpqpp18g6lm32s?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9z2cmm8ocq1vpqpp18g6lm32s?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a0jlvazgkqdn9ksz28bzk9yc4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a0jlvazgkqdn9ksz28bzk9yc4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a0jlvazgkqdn9ksz28bzk9yc4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9ybu8rfp6cgfel6k77lvs4jys?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9ybu8rfp6cgfel6k77lvs4jys?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9ybu8rfp6cgfel6k77lvs4jys?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9xl2rewn74ubla7v8jiklnpjo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9xl2rewn74ubla7v8jiklnpjo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9xl2rewn74ubla7v8jiklnpjo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9xyjw9s43rymjcx95a5ttqw44?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9xyjw9s43rymjcx95a5ttqw44?",
-        "a2yu8vfo8wha3vza31s2o8zkk/9xyjw9s43rymjcx95a5ttqw44?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a1p3sgimmehbxlwgg1uqtrqxg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a1p3sgimmehbxlwgg1uqtrqxg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a1p3sgimmehbxlwgg1uqtrqxg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a1brbecd45jbvk67dya4ogufo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a1brbecd45jbvk67dya4ogufo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a1brbecd45jbvk67dya4ogufo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a1p3sgimmehbxlwgg1uqtrqxg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a1p3sgimmehbxlwgg1uqtrqxg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a1p3sgimmehbxlwgg1uqtrqxg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a1brbecd45jbvk67dya4ogufo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a1brbecd45jbvk67dya4ogufo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a1brbecd45jbvk67dya4ogufo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a49ux9wq873algwev2k4fuxw4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a49ux9wq873algwev2k4fuxw4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a49ux9wq873algwev2k4fuxw4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a2sxswzolg36f6tpde2si5gr8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a2sxswzolg36f6tpde2si5gr8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a2sxswzolg36f6tpde2si5gr8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a22e0dg92xfxdh36d93h60xzo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a22e0dg92xfxdh36d93h60xzo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a22e0dg92xfxdh36d93h60xzo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a0ykb4o7mgr5sibc3zwrwvqxg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a0ykb4o7mgr5sibc3zwrwvqxg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a0ykb4o7mgr5sibc3zwrwvqxg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a49ux9wq873algwev2k4fuxw4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a49ux9wq873algwev2k4fuxw4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a49ux9wq873algwev2k4fuxw4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a2sxswzolg36f6tpde2si5gr8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a2sxswzolg36f6tpde2si5gr8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a2sxswzolg36f6tpde2si5gr8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a22e0dg92xfxdh36d93h60xzo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a22e0dg92xfxdh36d93h60xzo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a22e0dg92xfxdh36d93h60xzo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a0ykb4o7mgr5sibc3zwrwvqxg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a0ykb4o7mgr5sibc3zwrwvqxg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a0ykb4o7mgr5sibc3zwrwvqxg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a3wrg7cw8ps19jbe51sxlafis?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a3wrg7cw8ps19jbe51sxlafis?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a3wrg7cw8ps19jbe51sxlafis?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a36777ai2yjef3b50q8enmyac?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a36777ai2yjef3b50q8enmyac?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a36777ai2yjef3b50q8enmyac?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a3jfhb5t2j3k0jg5vnjrh87pw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a3jfhb5t2j3k0jg5vnjrh87pw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a3jfhb5t2j3k0jg5vnjrh87pw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a2fr2d8uw49guyz3x2cts1vkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a2fr2d8uw49guyz3x2cts1vkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a2fr2d8uw49guyz3x2cts1vkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a3wrg7cw8ps19jbe51sxlafis?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a3wrg7cw8ps19jbe51sxlafis?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a3wrg7cw8ps19jbe51sxlafis?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a36777ai2yjef3b50q8enmyac?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a36777ai2yjef3b50q8enmyac?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a36777ai2yjef3b50q8enmyac?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a3jfhb5t2j3k0jg5vnjrh87pw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a3jfhb5t2j3k0jg5vnjrh87pw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a3jfhb5t2j3k0jg5vnjrh87pw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a2fr2d8uw49guyz3x2cts1vkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a2fr2d8uw49guyz3x2cts1vkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a2fr2d8uw49guyz3x2cts1vkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a5qj9eah9f7sslh411a6e7dhw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a5qj9eah9f7sslh411a6e7dhw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a5qj9eah9f7sslh411a6e7dhw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a658j3innjty3dokzcqidlous?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a658j3innjty3dokzcqidlous?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a658j3innjty3dokzcqidlous?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a6iqayh8ola61f3by9rjjgges?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a6iqayh8ola61f3by9rjjgges?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a6iqayh8ola61f3by9rjjgges?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a5qj9eah9f7sslh411a6e7dhw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a5qj9eah9f7sslh411a6e7dhw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a5qj9eah9f7sslh411a6e7dhw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a658j3innjty3dokzcqidlous?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a658j3innjty3dokzcqidlous?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a658j3innjty3dokzcqidlous?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a6iqayh8ola61f3by9rjjgges?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a6iqayh8ola61f3by9rjjgges?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a6iqayh8ola61f3by9rjjgges?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a4n3op13pf2wht3t6ftt2u0wk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a4n3op13pf2wht3t6ftt2u0wk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a4n3op13pf2wht3t6ftt2u0wk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a508gjpexm1ulovd97v8e311w?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a508gjpexm1ulovd97v8e311w?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a508gjpexm1ulovd97v8e311w?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a5dgbcnlzdluai37lt9w2sdn8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a5dgbcnlzdluai37lt9w2sdn8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a5dgbcnlzdluai37lt9w2sdn8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a7zw0px1mlvmmxrevr0vfm3h0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a7zw0px1mlvmmxrevr0vfm3h0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a7zw0px1mlvmmxrevr0vfm3h0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a794g2yvbxl4o4yjyku98v1n8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a794g2yvbxl4o4yjyku98v1n8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a794g2yvbxl4o4yjyku98v1n8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a6vwdfqbgi8dgyzr63ec1yvpw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a6vwdfqbgi8dgyzr63ec1yvpw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a6vwdfqbgi8dgyzr63ec1yvpw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a7movjks11sk5gkteat3euj2s?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a7movjks11sk5gkteat3euj2s?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a7movjks11sk5gkteat3euj2s?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a4n3op13pf2wht3t6ftt2u0wk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a4n3op13pf2wht3t6ftt2u0wk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a4n3op13pf2wht3t6ftt2u0wk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a508gjpexm1ulovd97v8e311w?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a508gjpexm1ulovd97v8e311w?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a508gjpexm1ulovd97v8e311w?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a5dgbcnlzdluai37lt9w2sdn8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a5dgbcnlzdluai37lt9w2sdn8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a5dgbcnlzdluai37lt9w2sdn8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a7zw0px1mlvmmxrevr0vfm3h0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a7zw0px1mlvmmxrevr0vfm3h0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a7zw0px1mlvmmxrevr0vfm3h0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a794g2yvbxl4o4yjyku98v1n8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a794g2yvbxl4o4yjyku98v1n8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a794g2yvbxl4o4yjyku98v1n8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a6vwdfqbgi8dgyzr63ec1yvpw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a6vwdfqbgi8dgyzr63ec1yvpw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a6vwdfqbgi8dgyzr63ec1yvpw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a7movjks11sk5gkteat3euj2s?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a7movjks11sk5gkteat3euj2s?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a7movjks11sk5gkteat3euj2s?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aazhpg7705ws9l5w4878e8zys?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aazhpg7705ws9l5w4878e8zys?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aazhpg7705ws9l5w4878e8zys?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a8qjuhuze8zpv1qxo5iaksob8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a8qjuhuze8zpv1qxo5iaksob8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a8qjuhuze8zpv1qxo5iaksob8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aakrtff926b8gudoqruclczys?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aakrtff926b8gudoqruclczys?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aakrtff926b8gudoqruclczys?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a93z5r5usduub8zdlkeckyln8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a93z5r5usduub8zdlkeckyln8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a93z5r5usduub8zdlkeckyln8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/abcjmxk52lh1z5r8mh1br20ic?",
-        "a2yu8vfo8wha3vza31s2o8zkk/abcjmxk52lh1z5r8mh1br20ic?",
-        "a2yu8vfo8wha3vza31s2o8zkk/abcjmxk52lh1z5r8mh1br20ic?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a9h861235mrf70bi2mtmhgefo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a9h861235mrf70bi2mtmhgefo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a9h861235mrf70bi2mtmhgefo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8octy95gyrhaedmsbax8u1pn8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8octy95gyrhaedmsbax8u1pn8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8octy95gyrhaedmsbax8u1pn8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aa7hej525cznjes3vrzt8ttec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aa7hej525cznjes3vrzt8ttec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aa7hej525cznjes3vrzt8ttec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aa7hej525cznjes3vrzt8ttec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aa7hej525cznjes3vrzt8ttec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aa7hej525cznjes3vrzt8ttec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/afemf5i31n8h5l80kf30o5990?",
-        "a2yu8vfo8wha3vza31s2o8zkk/afemf5i31n8h5l80kf30o5990?",
-        "a2yu8vfo8wha3vza31s2o8zkk/afemf5i31n8h5l80kf30o5990?",
-        "a2yu8vfo8wha3vza31s2o8zkk/adxaijl6pnl84nqzbiqzmelg4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/adxaijl6pnl84nqzbiqzmelg4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/adxaijl6pnl84nqzbiqzmelg4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/actqxu3bxht7r2ym8j94b9t04?",
-        "a2yu8vfo8wha3vza31s2o8zkk/actqxu3bxht7r2ym8j94b9t04?",
-        "a2yu8vfo8wha3vza31s2o8zkk/actqxu3bxht7r2ym8j94b9t04?",
-        "a2yu8vfo8wha3vza31s2o8zkk/adk4obru5n93xwye1vrofygb8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/adk4obru5n93xwye1vrofygb8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/adk4obru5n93xwye1vrofygb8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aeo1m4gl60dr1hprr5ry04ahg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aeo1m4gl60dr1hprr5ry04ahg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aeo1m4gl60dr1hprr5ry04ahg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aeap9eh17culprg5cdt0ara50?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aeap9eh17culprg5cdt0ara50?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aeap9eh17culprg5cdt0ara50?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ad6yc7dafv6npo2j4abxio1zo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ad6yc7dafv6npo2j4abxio1zo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ad6yc7dafv6npo2j4abxio1zo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/af1azwetcuz0jjqlgoc84wufo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/af1azwetcuz0jjqlgoc84wufo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/af1azwetcuz0jjqlgoc84wufo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ac332y1b55bv99eoz4jkntxjo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ac332y1b55bv99eoz4jkntxjo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ac332y1b55bv99eoz4jkntxjo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/acgczj0ajvb7fzn0zjg4zrbis?",
-        "a2yu8vfo8wha3vza31s2o8zkk/acgczj0ajvb7fzn0zjg4zrbis?",
-        "a2yu8vfo8wha3vza31s2o8zkk/acgczj0ajvb7fzn0zjg4zrbis?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aeap9eh17culprg5cdt0ara50?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aeap9eh17culprg5cdt0ara50?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aeap9eh17culprg5cdt0ara50?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ad6yc7dafv6npo2j4abxio1zo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ad6yc7dafv6npo2j4abxio1zo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ad6yc7dafv6npo2j4abxio1zo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/af1azwetcuz0jjqlgoc84wufo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/af1azwetcuz0jjqlgoc84wufo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/af1azwetcuz0jjqlgoc84wufo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ac332y1b55bv99eoz4jkntxjo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ac332y1b55bv99eoz4jkntxjo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ac332y1b55bv99eoz4jkntxjo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/acgczj0ajvb7fzn0zjg4zrbis?",
-        "a2yu8vfo8wha3vza31s2o8zkk/acgczj0ajvb7fzn0zjg4zrbis?",
-        "a2yu8vfo8wha3vza31s2o8zkk/acgczj0ajvb7fzn0zjg4zrbis?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aeap9eh17culprg5cdt0ara50?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aeap9eh17culprg5cdt0ara50?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aeap9eh17culprg5cdt0ara50?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ad6yc7dafv6npo2j4abxio1zo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ad6yc7dafv6npo2j4abxio1zo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ad6yc7dafv6npo2j4abxio1zo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/af1azwetcuz0jjqlgoc84wufo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/af1azwetcuz0jjqlgoc84wufo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/af1azwetcuz0jjqlgoc84wufo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ac332y1b55bv99eoz4jkntxjo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ac332y1b55bv99eoz4jkntxjo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ac332y1b55bv99eoz4jkntxjo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/acgczj0ajvb7fzn0zjg4zrbis?",
-        "a2yu8vfo8wha3vza31s2o8zkk/acgczj0ajvb7fzn0zjg4zrbis?",
-        "a2yu8vfo8wha3vza31s2o8zkk/acgczj0ajvb7fzn0zjg4zrbis?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aeap9eh17culprg5cdt0ara50?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aeap9eh17culprg5cdt0ara50?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aeap9eh17culprg5cdt0ara50?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ad6yc7dafv6npo2j4abxio1zo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ad6yc7dafv6npo2j4abxio1zo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ad6yc7dafv6npo2j4abxio1zo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/af1azwetcuz0jjqlgoc84wufo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/af1azwetcuz0jjqlgoc84wufo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/af1azwetcuz0jjqlgoc84wufo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ac332y1b55bv99eoz4jkntxjo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ac332y1b55bv99eoz4jkntxjo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ac332y1b55bv99eoz4jkntxjo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/acgczj0ajvb7fzn0zjg4zrbis?",
-        "a2yu8vfo8wha3vza31s2o8zkk/acgczj0ajvb7fzn0zjg4zrbis?",
-        "a2yu8vfo8wha3vza31s2o8zkk/acgczj0ajvb7fzn0zjg4zrbis?",
-        "a2yu8vfo8wha3vza31s2o8zkk/agk75hocwu52qpfx3qsw1668k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/agk75hocwu52qpfx3qsw1668k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/agk75hocwu52qpfx3qsw1668k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ahau8xem0xf6ockbksahzv8yc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ahau8xem0xf6ockbksahzv8yc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ahau8xem0xf6ockbksahzv8yc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ais0givft6ih3uua8786a7klw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ais0givft6ih3uua8786a7klw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ais0givft6ih3uua8786a7klw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aj58dlyxn08czq1yzbo5hx6vo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aj58dlyxn08czq1yzbo5hx6vo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aj58dlyxn08czq1yzbo5hx6vo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ai1huef1vxp819nva5o1ulslw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ai1huef1vxp819nva5o1ulslw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ai1huef1vxp819nva5o1ulslw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/agk75hocwu52qpfx3qsw1668k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/agk75hocwu52qpfx3qsw1668k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/agk75hocwu52qpfx3qsw1668k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ahau8xem0xf6ockbksahzv8yc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ahau8xem0xf6ockbksahzv8yc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ahau8xem0xf6ockbksahzv8yc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ais0givft6ih3uua8786a7klw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ais0givft6ih3uua8786a7klw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ais0givft6ih3uua8786a7klw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aj58dlyxn08czq1yzbo5hx6vo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aj58dlyxn08czq1yzbo5hx6vo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aj58dlyxn08czq1yzbo5hx6vo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ai1huef1vxp819nva5o1ulslw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ai1huef1vxp819nva5o1ulslw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ai1huef1vxp819nva5o1ulslw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/agk75hocwu52qpfx3qsw1668k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/agk75hocwu52qpfx3qsw1668k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/agk75hocwu52qpfx3qsw1668k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ahau8xem0xf6ockbksahzv8yc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ahau8xem0xf6ockbksahzv8yc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ahau8xem0xf6ockbksahzv8yc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ais0givft6ih3uua8786a7klw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ais0givft6ih3uua8786a7klw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ais0givft6ih3uua8786a7klw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aj58dlyxn08czq1yzbo5hx6vo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aj58dlyxn08czq1yzbo5hx6vo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aj58dlyxn08czq1yzbo5hx6vo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ai1huef1vxp819nva5o1ulslw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ai1huef1vxp819nva5o1ulslw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ai1huef1vxp819nva5o1ulslw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/agxdpcqohxr8onw3q163ppzpw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/agxdpcqohxr8onw3q163ppzpw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/agxdpcqohxr8onw3q163ppzpw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aho6p3koizwv4h98bm3y8zi1g?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aho6p3koizwv4h98bm3y8zi1g?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aho6p3koizwv4h98bm3y8zi1g?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aieoisa7cff7qyblknnimsefo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aieoisa7cff7qyblknnimsefo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aieoisa7cff7qyblknnimsefo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/afs14ucprzp7tchqnrbubqyvo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/afs14ucprzp7tchqnrbubqyvo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/afs14ucprzp7tchqnrbubqyvo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ag6ugiv8scrihf0rtkh9b2uj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ag6ugiv8scrihf0rtkh9b2uj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ag6ugiv8scrihf0rtkh9b2uj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ag6ugiv8scrihf0rtkh9b2uj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ag6ugiv8scrihf0rtkh9b2uj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ag6ugiv8scrihf0rtkh9b2uj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ag6ugiv8scrihf0rtkh9b2uj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ag6ugiv8scrihf0rtkh9b2uj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ag6ugiv8scrihf0rtkh9b2uj8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/am55r9j4pobyand7hl8hlp6hg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/am55r9j4pobyand7hl8hlp6hg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/am55r9j4pobyand7hl8hlp6hg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/amievflz4ff83rnagcdv01jpw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/amievflz4ff83rnagcdv01jpw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/amievflz4ff83rnagcdv01jpw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/akztt6yk2tbi9tck35llmb4lw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/akztt6yk2tbi9tck35llmb4lw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/akztt6yk2tbi9tck35llmb4lw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/alejsd8y85q5bnjlowjy085jo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/alejsd8y85q5bnjlowjy085jo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/alejsd8y85q5bnjlowjy085jo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ajvwpjgoosejzmtm8rcc48iz8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ajvwpjgoosejzmtm8rcc48iz8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ajvwpjgoosejzmtm8rcc48iz8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/am55r9j4pobyand7hl8hlp6hg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/am55r9j4pobyand7hl8hlp6hg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/am55r9j4pobyand7hl8hlp6hg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/amievflz4ff83rnagcdv01jpw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/amievflz4ff83rnagcdv01jpw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/amievflz4ff83rnagcdv01jpw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/akztt6yk2tbi9tck35llmb4lw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/akztt6yk2tbi9tck35llmb4lw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/akztt6yk2tbi9tck35llmb4lw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/alejsd8y85q5bnjlowjy085jo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/alejsd8y85q5bnjlowjy085jo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/alejsd8y85q5bnjlowjy085jo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ajvwpjgoosejzmtm8rcc48iz8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ajvwpjgoosejzmtm8rcc48iz8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ajvwpjgoosejzmtm8rcc48iz8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/am55r9j4pobyand7hl8hlp6hg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/am55r9j4pobyand7hl8hlp6hg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/am55r9j4pobyand7hl8hlp6hg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/amievflz4ff83rnagcdv01jpw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/amievflz4ff83rnagcdv01jpw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/amievflz4ff83rnagcdv01jpw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/akztt6yk2tbi9tck35llmb4lw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/akztt6yk2tbi9tck35llmb4lw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/akztt6yk2tbi9tck35llmb4lw?",
-        "a2yu8vfo8wha3vza31s2o8zkk/alejsd8y85q5bnjlowjy085jo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/alejsd8y85q5bnjlowjy085jo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/alejsd8y85q5bnjlowjy085jo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ajvwpjgoosejzmtm8rcc48iz8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ajvwpjgoosejzmtm8rcc48iz8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ajvwpjgoosejzmtm8rcc48iz8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/amvozlwp8fvk2jxq3kld3v8yc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/amvozlwp8fvk2jxq3kld3v8yc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/amvozlwp8fvk2jxq3kld3v8yc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/akmlpvec5t7y39sktgqsl711w?",
-        "a2yu8vfo8wha3vza31s2o8zkk/akmlpvec5t7y39sktgqsl711w?",
-        "a2yu8vfo8wha3vza31s2o8zkk/akmlpvec5t7y39sktgqsl711w?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ak9a6pwrwk6318tr277ka232s?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ak9a6pwrwk6318tr277ka232s?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ak9a6pwrwk6318tr277ka232s?",
-        "a2yu8vfo8wha3vza31s2o8zkk/alrvl63ny8hyp01bbryh07190?",
-        "a2yu8vfo8wha3vza31s2o8zkk/alrvl63ny8hyp01bbryh07190?",
-        "a2yu8vfo8wha3vza31s2o8zkk/alrvl63ny8hyp01bbryh07190?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ajimb70urd5w6fgsgfjiqs104?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ajimb70urd5w6fgsgfjiqs104?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ajimb70urd5w6fgsgfjiqs104?",
-        "a2yu8vfo8wha3vza31s2o8zkk/amvozlwp8fvk2jxq3kld3v8yc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/amvozlwp8fvk2jxq3kld3v8yc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/amvozlwp8fvk2jxq3kld3v8yc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/akmlpvec5t7y39sktgqsl711w?",
-        "a2yu8vfo8wha3vza31s2o8zkk/akmlpvec5t7y39sktgqsl711w?",
-        "a2yu8vfo8wha3vza31s2o8zkk/akmlpvec5t7y39sktgqsl711w?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ak9a6pwrwk6318tr277ka232s?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ak9a6pwrwk6318tr277ka232s?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ak9a6pwrwk6318tr277ka232s?",
-        "a2yu8vfo8wha3vza31s2o8zkk/alrvl63ny8hyp01bbryh07190?",
-        "a2yu8vfo8wha3vza31s2o8zkk/alrvl63ny8hyp01bbryh07190?",
-        "a2yu8vfo8wha3vza31s2o8zkk/alrvl63ny8hyp01bbryh07190?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ajimb70urd5w6fgsgfjiqs104?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ajimb70urd5w6fgsgfjiqs104?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ajimb70urd5w6fgsgfjiqs104?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8w0jyfgfmbatat2agw3up6ivo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8w0jyfgfmbatat2agw3up6ivo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8w0jyfgfmbatat2agw3up6ivo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8w0jyfgfmbatat2agw3up6ivo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8w0jyfgfmbatat2agw3up6ivo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8w0jyfgfmbatat2agw3up6ivo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8w0jyfgfmbatat2agw3up6ivo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8w0jyfgfmbatat2agw3up6ivo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8w0jyfgfmbatat2agw3up6ivo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/anmwkwmosl9cpi7vanwh5i8t0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/anmwkwmosl9cpi7vanwh5i8t0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/anmwkwmosl9cpi7vanwh5i8t0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/an9ln0a9a6nb0qkys7kee1el0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/an9ln0a9a6nb0qkys7kee1el0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/an9ln0a9a6nb0qkys7kee1el0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aphrfjua5hgrfxicxc0qtdvkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aphrfjua5hgrfxicxc0qtdvkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aphrfjua5hgrfxicxc0qtdvkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aodiglwne0u3t0uhq7j67khsk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aodiglwne0u3t0uhq7j67khsk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aodiglwne0u3t0uhq7j67khsk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/anmwkwmosl9cpi7vanwh5i8t0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/anmwkwmosl9cpi7vanwh5i8t0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/anmwkwmosl9cpi7vanwh5i8t0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/an9ln0a9a6nb0qkys7kee1el0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/an9ln0a9a6nb0qkys7kee1el0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/an9ln0a9a6nb0qkys7kee1el0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aphrfjua5hgrfxicxc0qtdvkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aphrfjua5hgrfxicxc0qtdvkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aphrfjua5hgrfxicxc0qtdvkk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aodiglwne0u3t0uhq7j67khsk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aodiglwne0u3t0uhq7j67khsk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aodiglwne0u3t0uhq7j67khsk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aqacj6cxbc0pp7pgi51v5lpn8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aqacj6cxbc0pp7pgi51v5lpn8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aqacj6cxbc0pp7pgi51v5lpn8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aqn8y1plo4ajlkklgupzdxvdg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aqn8y1plo4ajlkklgupzdxvdg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aqn8y1plo4ajlkklgupzdxvdg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ap4jfkmbalgz2inl2nubb1nv8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ap4jfkmbalgz2inl2nubb1nv8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ap4jfkmbalgz2inl2nubb1nv8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/apv0cyog4h3zf9wn4119tiwic?",
-        "a2yu8vfo8wha3vza31s2o8zkk/apv0cyog4h3zf9wn4119tiwic?",
-        "a2yu8vfo8wha3vza31s2o8zkk/apv0cyog4h3zf9wn4119tiwic?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aoqym8at2czhutrw11kn19pg4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aoqym8at2czhutrw11kn19pg4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aoqym8at2czhutrw11kn19pg4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ao09gsfvksd3rh3xqg45t9y50?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ao09gsfvksd3rh3xqg45t9y50?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ao09gsfvksd3rh3xqg45t9y50?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ao09gsfvksd3rh3xqg45t9y50?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ao09gsfvksd3rh3xqg45t9y50?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ao09gsfvksd3rh3xqg45t9y50?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ao09gsfvksd3rh3xqg45t9y50?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ao09gsfvksd3rh3xqg45t9y50?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ao09gsfvksd3rh3xqg45t9y50?",
-        "a2yu8vfo8wha3vza31s2o8zkk/atyflnua71525n9echirgqqs4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/atyflnua71525n9echirgqqs4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/atyflnua71525n9echirgqqs4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/asuk3i8obk5c3foows4fe05jo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/asuk3i8obk5c3foows4fe05jo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/asuk3i8obk5c3foows4fe05jo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ardi3o3gopgahoh0i4aeesmc4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ardi3o3gopgahoh0i4aeesmc4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ardi3o3gopgahoh0i4aeesmc4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/atyflnua71525n9echirgqqs4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/atyflnua71525n9echirgqqs4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/atyflnua71525n9echirgqqs4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/asuk3i8obk5c3foows4fe05jo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/asuk3i8obk5c3foows4fe05jo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/asuk3i8obk5c3foows4fe05jo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ardi3o3gopgahoh0i4aeesmc4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ardi3o3gopgahoh0i4aeesmc4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ardi3o3gopgahoh0i4aeesmc4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/atyflnua71525n9echirgqqs4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/atyflnua71525n9echirgqqs4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/atyflnua71525n9echirgqqs4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/asuk3i8obk5c3foows4fe05jo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/asuk3i8obk5c3foows4fe05jo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/asuk3i8obk5c3foows4fe05jo?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ardi3o3gopgahoh0i4aeesmc4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ardi3o3gopgahoh0i4aeesmc4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ardi3o3gopgahoh0i4aeesmc4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aubp69dom7t66d3ym8xn2c8wk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aubp69dom7t66d3ym8xn2c8wk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aubp69dom7t66d3ym8xn2c8wk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/arqn5atwyvesannc0vmmk2rys?",
-        "a2yu8vfo8wha3vza31s2o8zkk/arqn5atwyvesannc0vmmk2rys?",
-        "a2yu8vfo8wha3vza31s2o8zkk/arqn5atwyvesannc0vmmk2rys?",
-        "a2yu8vfo8wha3vza31s2o8zkk/atl4ft5jup9s4mm0b9wxw1rmc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/atl4ft5jup9s4mm0b9wxw1rmc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/atl4ft5jup9s4mm0b9wxw1rmc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/at7tf3153t0mn79yhgk5wjxuc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/at7tf3153t0mn79yhgk5wjxuc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/at7tf3153t0mn79yhgk5wjxuc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ar0dll9lziv6k9krphhfnisyc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ar0dll9lziv6k9krphhfnisyc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ar0dll9lziv6k9krphhfnisyc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/as3ytyr3219uiz1oitn2lyjv8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/as3ytyr3219uiz1oitn2lyjv8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/as3ytyr3219uiz1oitn2lyjv8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ashaual1otvuzhnk0bmsb84yc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ashaual1otvuzhnk0bmsb84yc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ashaual1otvuzhnk0bmsb84yc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ashaual1otvuzhnk0bmsb84yc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ashaual1otvuzhnk0bmsb84yc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ashaual1otvuzhnk0bmsb84yc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/abprg83lt99aqb7ln3v07ugic?",
-        "a2yu8vfo8wha3vza31s2o8zkk/abprg83lt99aqb7ln3v07ugic?",
-        "a2yu8vfo8wha3vza31s2o8zkk/abprg83lt99aqb7ln3v07ugic?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8sqhx0tv3zrkhsxdh8odzut5g?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8sqhx0tv3zrkhsxdh8odzut5g?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8sqhx0tv3zrkhsxdh8odzut5g?",
-        "a2yu8vfo8wha3vza31s2o8zkk/abprg83lt99aqb7ln3v07ugic?",
-        "a2yu8vfo8wha3vza31s2o8zkk/abprg83lt99aqb7ln3v07ugic?",
-        "a2yu8vfo8wha3vza31s2o8zkk/abprg83lt99aqb7ln3v07ugic?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8sqhx0tv3zrkhsxdh8odzut5g?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8sqhx0tv3zrkhsxdh8odzut5g?",
-        "a2yu8vfo8wha3vza31s2o8zkk/8sqhx0tv3zrkhsxdh8odzut5g?",
-        "a2yu8vfo8wha3vza31s2o8zkk/axow1rwirzzegqocifv9qi7tg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/axow1rwirzzegqocifv9qi7tg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/axow1rwirzzegqocifv9qi7tg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aw8267n4ak580qql40vhk1x5g?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aw8267n4ak580qql40vhk1x5g?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aw8267n4ak580qql40vhk1x5g?",
-        "a2yu8vfo8wha3vza31s2o8zkk/axow1rwirzzegqocifv9qi7tg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/axow1rwirzzegqocifv9qi7tg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/axow1rwirzzegqocifv9qi7tg?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aw8267n4ak580qql40vhk1x5g?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aw8267n4ak580qql40vhk1x5g?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aw8267n4ak580qql40vhk1x5g?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aupq8kei0k7zxecx0tfohg6j8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aupq8kei0k7zxecx0tfohg6j8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aupq8kei0k7zxecx0tfohg6j8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/av2ws9x3wo5qf2rffe40wkxec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/av2ws9x3wo5qf2rffe40wkxec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/av2ws9x3wo5qf2rffe40wkxec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/awl64l0nproimbb2ytgbnwbo4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/awl64l0nproimbb2ytgbnwbo4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/awl64l0nproimbb2ytgbnwbo4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/avhqdd9jbetmpf7dzej3ek650?",
-        "a2yu8vfo8wha3vza31s2o8zkk/avhqdd9jbetmpf7dzej3ek650?",
-        "a2yu8vfo8wha3vza31s2o8zkk/avhqdd9jbetmpf7dzej3ek650?",
-        "a2yu8vfo8wha3vza31s2o8zkk/awydevpkdss04r9khtuszt2qc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/awydevpkdss04r9khtuszt2qc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/awydevpkdss04r9khtuszt2qc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ay23l6jkzdxc7izv6280ca5g4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ay23l6jkzdxc7izv6280ca5g4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ay23l6jkzdxc7izv6280ca5g4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/axbl1q3s2oh1yoxh5txdl8bo4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/axbl1q3s2oh1yoxh5txdl8bo4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/axbl1q3s2oh1yoxh5txdl8bo4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/avuv8j7oywvt1aywo0x6ub8k4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/avuv8j7oywvt1aywo0x6ub8k4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/avuv8j7oywvt1aywo0x6ub8k4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aupq8kei0k7zxecx0tfohg6j8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aupq8kei0k7zxecx0tfohg6j8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aupq8kei0k7zxecx0tfohg6j8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/av2ws9x3wo5qf2rffe40wkxec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/av2ws9x3wo5qf2rffe40wkxec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/av2ws9x3wo5qf2rffe40wkxec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/awl64l0nproimbb2ytgbnwbo4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/awl64l0nproimbb2ytgbnwbo4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/awl64l0nproimbb2ytgbnwbo4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/avhqdd9jbetmpf7dzej3ek650?",
-        "a2yu8vfo8wha3vza31s2o8zkk/avhqdd9jbetmpf7dzej3ek650?",
-        "a2yu8vfo8wha3vza31s2o8zkk/avhqdd9jbetmpf7dzej3ek650?",
-        "a2yu8vfo8wha3vza31s2o8zkk/awydevpkdss04r9khtuszt2qc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/awydevpkdss04r9khtuszt2qc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/awydevpkdss04r9khtuszt2qc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ay23l6jkzdxc7izv6280ca5g4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ay23l6jkzdxc7izv6280ca5g4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ay23l6jkzdxc7izv6280ca5g4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/axbl1q3s2oh1yoxh5txdl8bo4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/axbl1q3s2oh1yoxh5txdl8bo4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/axbl1q3s2oh1yoxh5txdl8bo4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/avuv8j7oywvt1aywo0x6ub8k4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/avuv8j7oywvt1aywo0x6ub8k4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/avuv8j7oywvt1aywo0x6ub8k4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aupq8kei0k7zxecx0tfohg6j8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aupq8kei0k7zxecx0tfohg6j8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aupq8kei0k7zxecx0tfohg6j8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/av2ws9x3wo5qf2rffe40wkxec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/av2ws9x3wo5qf2rffe40wkxec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/av2ws9x3wo5qf2rffe40wkxec?",
-        "a2yu8vfo8wha3vza31s2o8zkk/awl64l0nproimbb2ytgbnwbo4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/awl64l0nproimbb2ytgbnwbo4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/awl64l0nproimbb2ytgbnwbo4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/avhqdd9jbetmpf7dzej3ek650?",
-        "a2yu8vfo8wha3vza31s2o8zkk/avhqdd9jbetmpf7dzej3ek650?",
-        "a2yu8vfo8wha3vza31s2o8zkk/avhqdd9jbetmpf7dzej3ek650?",
-        "a2yu8vfo8wha3vza31s2o8zkk/awydevpkdss04r9khtuszt2qc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/awydevpkdss04r9khtuszt2qc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/awydevpkdss04r9khtuszt2qc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ay23l6jkzdxc7izv6280ca5g4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ay23l6jkzdxc7izv6280ca5g4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ay23l6jkzdxc7izv6280ca5g4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/axbl1q3s2oh1yoxh5txdl8bo4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/axbl1q3s2oh1yoxh5txdl8bo4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/axbl1q3s2oh1yoxh5txdl8bo4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/avuv8j7oywvt1aywo0x6ub8k4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/avuv8j7oywvt1aywo0x6ub8k4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/avuv8j7oywvt1aywo0x6ub8k4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a068sit8ppctyt2bycf9szris?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a068sit8ppctyt2bycf9szris?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a068sit8ppctyt2bycf9szris?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a068sit8ppctyt2bycf9szris?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a068sit8ppctyt2bycf9szris?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a068sit8ppctyt2bycf9szris?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a068sit8ppctyt2bycf9szris?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a068sit8ppctyt2bycf9szris?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a068sit8ppctyt2bycf9szris?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a068sit8ppctyt2bycf9szris?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a068sit8ppctyt2bycf9szris?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a068sit8ppctyt2bycf9szris?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a8d5x7whnvf1kwfgmh0nurzf8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a8d5x7whnvf1kwfgmh0nurzf8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a8d5x7whnvf1kwfgmh0nurzf8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a8d5x7whnvf1kwfgmh0nurzf8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a8d5x7whnvf1kwfgmh0nurzf8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a8d5x7whnvf1kwfgmh0nurzf8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a8d5x7whnvf1kwfgmh0nurzf8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a8d5x7whnvf1kwfgmh0nurzf8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a8d5x7whnvf1kwfgmh0nurzf8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a8d5x7whnvf1kwfgmh0nurzf8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a8d5x7whnvf1kwfgmh0nurzf8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/a8d5x7whnvf1kwfgmh0nurzf8?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b1fpmgby6z13hh6q7r7omu0wk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b1fpmgby6z13hh6q7r7omu0wk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b1fpmgby6z13hh6q7r7omu0wk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b12an4r7konj2a0gqbal4k9p0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b12an4r7konj2a0gqbal4k9p0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b12an4r7konj2a0gqbal4k9p0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/azwid581h1equakz911gwo00k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/azwid581h1equakz911gwo00k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/azwid581h1equakz911gwo00k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b1fpmgby6z13hh6q7r7omu0wk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b1fpmgby6z13hh6q7r7omu0wk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b1fpmgby6z13hh6q7r7omu0wk?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b12an4r7konj2a0gqbal4k9p0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b12an4r7konj2a0gqbal4k9p0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b12an4r7konj2a0gqbal4k9p0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/azwid581h1equakz911gwo00k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/azwid581h1equakz911gwo00k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/azwid581h1equakz911gwo00k?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b1t41vmkoj260sqvkmtqjxic4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b1t41vmkoj260sqvkmtqjxic4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b1t41vmkoj260sqvkmtqjxic4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b09wrup88ah1rurszus915st0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b09wrup88ah1rurszus915st0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b09wrup88ah1rurszus915st0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b0p1zpve58b2x70jzhzhah2qc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b0p1zpve58b2x70jzhzhah2qc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b0p1zpve58b2x70jzhzhah2qc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/az5smbqo6fonij8ob30o9uvx0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/az5smbqo6fonij8ob30o9uvx0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/az5smbqo6fonij8ob30o9uvx0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aysmum6if0fd6myzlpjn8hno4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aysmum6if0fd6myzlpjn8hno4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/aysmum6if0fd6myzlpjn8hno4?",
-        "a2yu8vfo8wha3vza31s2o8zkk/azj0rl2obqyzvtggkv50mtbmc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/azj0rl2obqyzvtggkv50mtbmc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/azj0rl2obqyzvtggkv50mtbmc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ayfaqrlux9mbe7gfu4xbmt990?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ayfaqrlux9mbe7gfu4xbmt990?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ayfaqrlux9mbe7gfu4xbmt990?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ayfaqrlux9mbe7gfu4xbmt990?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ayfaqrlux9mbe7gfu4xbmt990?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ayfaqrlux9mbe7gfu4xbmt990?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ayfaqrlux9mbe7gfu4xbmt990?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ayfaqrlux9mbe7gfu4xbmt990?",
-        "a2yu8vfo8wha3vza31s2o8zkk/ayfaqrlux9mbe7gfu4xbmt990?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b40p4gaukuu9y5gd98hytoums?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b40p4gaukuu9y5gd98hytoums?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b40p4gaukuu9y5gd98hytoums?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b2wtd1uf1x4sr73aypnj1twd0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b2wtd1uf1x4sr73aypnj1twd0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b2wtd1uf1x4sr73aypnj1twd0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b3a186bejl92dthe2eklthbmc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b3a186bejl92dthe2eklthbmc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b3a186bejl92dthe2eklthbmc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b4rby93ba1lulq4s6c8ynnx1w?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b4rby93ba1lulq4s6c8ynnx1w?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b4rby93ba1lulq4s6c8ynnx1w?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b40p4gaukuu9y5gd98hytoums?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b40p4gaukuu9y5gd98hytoums?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b40p4gaukuu9y5gd98hytoums?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b2wtd1uf1x4sr73aypnj1twd0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b2wtd1uf1x4sr73aypnj1twd0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b2wtd1uf1x4sr73aypnj1twd0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b3a186bejl92dthe2eklthbmc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b3a186bejl92dthe2eklthbmc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b3a186bejl92dthe2eklthbmc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b4rby93ba1lulq4s6c8ynnx1w?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b4rby93ba1lulq4s6c8ynnx1w?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b4rby93ba1lulq4s6c8ynnx1w?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b40p4gaukuu9y5gd98hytoums?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b40p4gaukuu9y5gd98hytoums?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b40p4gaukuu9y5gd98hytoums?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b2wtd1uf1x4sr73aypnj1twd0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b2wtd1uf1x4sr73aypnj1twd0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b2wtd1uf1x4sr73aypnj1twd0?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b3a186bejl92dthe2eklthbmc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b3a186bejl92dthe2eklthbmc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b3a186bejl92dthe2eklthbmc?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b4rby93ba1lulq4s6c8ynnx1w?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b4rby93ba1lulq4s6c8ynnx1w?",
-        "a2yu8vfo8wha3vza31s2o8zkk/b4rby93ba1lulq4s6c8ynnx1w?",
-    ]
-    
-    # Remove duplicatas
-    unique_urls = remove_duplicates(team_urls)
-    
-    # Salva as URLs únicas em um arquivo
-    save_unique_urls_to_file('unique_urls777.txt', unique_urls)
+    parser = argparse.ArgumentParser(description="Remove URLs de partidas repetidas, mantendo a ordem")
+    parser.add_argument("entrada", nargs="?",
+                        help="Arquivo com um link por linha ('-' para a entrada padrão). Sem ele, usa o registro de partidas")
+    parser.add_argument("--saida", default="unique_urls777.txt", help="Arquivo onde as URLs únicas são salvas")
+    parser.add_argument("--limite-memoria", type=int, default=LIMITE_CHAVES_MEMORIA,
+                        help="Chaves mantidas na memória antes de usar o índice em disco")
+    args = parser.parse_args()
+
+    if args.entrada:
+        # Lê, remove as duplicatas e grava linha a linha, sem carregar o arquivo inteiro
+        entrada = sys.stdin if args.entrada == "-" else open(args.entrada, "r", encoding="utf-8")
+        with entrada:
+            quantidade = save_unique_urls_to_file(args.saida, remover_duplicados_stream(entrada, args.limite_memoria))
+    else:
+        # Partidas do registro (cada partida aparece uma única vez)
+        registro = RegistroPartidas()
+        team_urls = registro.codigos(**competicao_padrao().filtros_registro())
+        registro.fechar()
+        quantidade = save_unique_urls_to_file(args.saida, remove_duplicates(team_urls))
 
-    print(f"URLs únicas foram salvas em 'unique_urls.txt'")
+    print(f"{quantidade} URLs únicas foram salvas em '{args.saida}'")
 
 
 if __name__ == "__main__":
@@ -1686,7 +140,4 @@ def load_unique_urls_from_file(filename):
     """
     with open(filename, 'r') as f:
         urls = f.read().splitlines()  # Lê cada linha e remove os "\n"
-    return urls
-
-# No seu código principal
-unique_urls = load_unique_urls_from_file('unique_urls2.txt')
\ No newline at end of file
+    return urls
\ No newline at end of file
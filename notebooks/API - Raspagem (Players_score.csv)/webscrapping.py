@@ -1,60 +1,72 @@
-# Esse arquivo pega todos os links dos jogos do Brasileirão até uma data específica. Essa raspagem é essencial, pois é através dela que teremos acesso às APIs. 
-
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
-from datetime import datetime, timedelta
+# Esse arquivo pega todos os links dos jogos das competições configuradas em competicoes.json (por padrão, o Brasileirão 2024).
+# Essa raspagem é essencial, pois é através dela que teremos acesso às APIs.
+
+import argparse
+import logging
+import os
+import queue
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from calendario_fifa import API_BASE_URL, buscar_links_partidas_calendario
+from competicoes import ARQUIVO_COMPETICOES, carregar_competicoes, competicao_padrao
+from estado_raspagem import ARQUIVO_ESTADO, EstadoRaspagem
+from fila_trabalho import FilaTrabalho, trabalhar
+from limitador_taxa import LimitadorAdaptativo, limitador_fifa
+from log_raspagem import Progresso, adicionar_argumentos_log, configurar_log_dos_argumentos, obter_log
+from registro_partidas import ID_COMPETICAO_PADRAO, RegistroPartidas
+from requests.exceptions import RequestException
+
+log = obter_log("webscrapping")
+
+# Endereço do site da FIFA. Pode ser trocado pela variável de ambiente para usar o servidor local de testes
+SITE_BASE_URL = os.environ.get("FIFA_SITE_BASE_URL", "https://www.fifa.com")
+
+# Intervalo inicial (em segundos) entre o carregamento de duas páginas, somando todas as sessões abertas.
+# A partir dele o limitador adaptativo acelera ou desacelera conforme o site responde.
+INTERVALO_ENTRE_REQUISICOES = 2
+
+# Uma página que demora mais que isso para renderizar é tratada como sinal de sobrecarga
+LATENCIA_ALVO_PAGINA = 20
+
+# Quantidade de datas que cada trabalhador pega da fila de uma vez (no modo fila)
+DATAS_POR_LOTE = 31
+
+# Função que cria um WebDriver do Chrome com modo "headless" (sem interface gráfica)
+def criar_driver():
+    # O Selenium só é importado quando o navegador é realmente usado, já que a descoberta pelo calendário não precisa dele
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.chrome.options import Options
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")  # Executa o navegador sem abrir janelas
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+
+    # Inicializa o driver do Chrome usando o gerenciador do WebDriver
+    return webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
+
+# Função que usa o Selenium para buscar os links das partidas de futebol em uma URL específica.
+# Devolve a lista de links e None quando a coleta falhou. Um tempo limite também conta como falha, já que não dá
+# para distinguir uma página sem jogos de uma página que não carregou; a data é tentada de novo mais tarde.
+def buscar_links_partidas_selenium(url, driver, id_competicao=ID_COMPETICAO_PADRAO):
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
 
-# Função para gerar uma lista de datas entre 13 de abril de 2024 e 21 de setembro de 2024
-# Essas datas serão usadas para construir as URLs de cada dia
-def gerar_datas_2024():
-    inicio = datetime(2024, 4, 13)  # Data de início da coleta de links
-    fim = datetime(2024, 9, 21)     # Data final para a coleta de links
-    delta = timedelta(days=1)       # Incremento diário
-    datas = []
-    data_atual = inicio
-    # Gera a lista de datas no formato 'YYYY-MM-DD'
-    while data_atual <= fim:
-        datas.append(data_atual.strftime('%Y-%m-%d'))
-        data_atual += delta
-    return datas
-
-# Configuração do WebDriver para o Chrome com modo "headless" (sem interface gráfica)
-chrome_options = Options()
-chrome_options.add_argument("--headless")  # Executa o navegador sem abrir janelas
-chrome_options.add_argument("--disable-gpu")
-chrome_options.add_argument("--no-sandbox")
-chrome_options.add_argument("--disable-dev-shm-usage")
-
-# Inicializa o driver do Chrome usando o gerenciador do WebDriver
-driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
-
-# Definimos a URL base do site da FIFA com filtros para jogos da Série A do Brasileirão
-url_base = 'https://www.fifa.com/pt/match-centre?date={}&sortBy=Popular&term=Serie+A&idCompetition=2000000078'
-
-# Gera a lista de datas de 2024, que serão inseridas na URL
-datas_2024 = gerar_datas_2024()
-
-# Lista para armazenar todos os links de jogos encontrados
-todos_links_partidas = []
-
-# Função que usa o Selenium para buscar os links das partidas de futebol em uma URL específica
-def buscar_links_partidas_selenium(url):
     try:
         # Abre a URL no navegador
         driver.get(url)
-        print(f"Carregando a página: {url}")
-        
+        log.debug("Carregando a página: %s", url)
+
         # Espera até que todos os elementos de jogos estejam carregados na página (máximo 30 segundos)
         wait = WebDriverWait(driver, 30)
-        jogos = wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, 'a[href*="/pt/match-centre/match/2000000078/"]')))
-        
+        jogos = wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, f'a[href*="/pt/match-centre/match/{id_competicao}/"]')))
+
         links_partidas = []
         # Para cada jogo encontrado, tenta obter o atributo 'href' (link)
         for jogo in jogos:
@@ -63,43 +75,215 @@ def buscar_links_partidas_selenium(url):
                 if href:
                     links_partidas.append(href)    # Adiciona o link à lista de links
             except StaleElementReferenceException:
-                print("Elemento obsoleto, continuando para o próximo")
+                log.debug("Elemento obsoleto, continuando para o próximo")
                 continue
-        
+
         return links_partidas
     except TimeoutException:
-        print(f"Tempo limite excedido ao carregar a página {url}")  # Se a página não carregar no tempo limite
-        return []
+        log.warning("Tempo limite excedido ao carregar a página %s", url)  # Se a página não carregar no tempo limite
+        return None
     except Exception as e:
-        print(f"Erro ao buscar links na página {url}: {e}")  # Captura qualquer erro durante a execução
-        return []
-
-# Laço para percorrer todas as datas geradas
-for data in datas_2024:
-    url_data = url_base.format(data)  # Insere a data na URL base
-    print(f"Acessando: {url_data}")
-    
-    # Busca os links das partidas para a data atual
-    links_partidas = buscar_links_partidas_selenium(url_data)
-    
-    # Se encontrar links de jogos, adiciona à lista principal
-    if links_partidas:
-        todos_links_partidas.extend(links_partidas)
-        print(f"Jogos encontrados para {data}: {len(links_partidas)} jogos")
-    # Caso não encontre nenhum jogo para a data específica
-    else:
-        print(f"Nenhum jogo encontrado para a data {data}")
-    
-    # Pausa de 2 segundos entre as requisições para não sobrecarregar o servidor
-    time.sleep(2)
-
-# Após a coleta, exibe todos os links encontrados
-if todos_links_partidas:
-    print("\nLinks das partidas do Brasileirão 2024 encontrados:")
-    for link in todos_links_partidas:
-        print(link)
-else:
-    print("Nenhum link de partidas encontrado em todos os dias verificados.")
-
-# Fecha o WebDriver ao final da execução
-driver.quit()
+        log.warning("Erro ao buscar links na página %s: %s", url, e)  # Captura qualquer erro durante a execução
+        return None
+
+# Limitador das páginas do site: começa em uma página a cada `intervalo` segundos e nunca deixa mais páginas
+# carregando ao mesmo tempo do que `n_sessoes`. Deve ser criado uma vez e compartilhado por todas as chamadas
+# de buscar_links_em_paralelo, para que o ritmo valha para todas as competições juntas.
+def criar_limitador_paginas(n_sessoes=1, intervalo=INTERVALO_ENTRE_REQUISICOES):
+    return LimitadorAdaptativo(taxa_inicial=1 / intervalo, taxa_maxima=max(1.0, n_sessoes / intervalo),
+                               concorrencia_inicial=n_sessoes, concorrencia_maxima=n_sessoes,
+                               latencia_alvo=LATENCIA_ALVO_PAGINA)
+
+# Função que percorre as datas com `n_sessoes` navegadores em paralelo.
+# As datas funcionam como uma fila de trabalho: cada sessão pega a próxima data livre assim que termina a anterior.
+# Se um estado de raspagem for informado, cada data é registrada nele assim que termina.
+# Sem um limitador informado, cria um só para esta chamada.
+def buscar_links_em_paralelo(datas, n_sessoes=1, intervalo=INTERVALO_ENTRE_REQUISICOES, estado=None, competicao=None,
+                             limitador=None):
+    competicao = competicao or competicao_padrao()
+    fila_datas = queue.Queue()
+    for data in datas:
+        fila_datas.put(data)
+
+    # Limitador compartilhado entre todas as sessões (e, vindo de main, entre todas as competições)
+    limitador = limitador or criar_limitador_paginas(n_sessoes, intervalo)
+    links_por_data = {}  # Resultado de cada data, juntado na ordem original no final
+    lock_resultados = threading.Lock()
+    progresso = Progresso(log, f"[{competicao.nome}] Páginas", len(datas), "páginas")
+
+    def sessao():
+        driver = criar_driver()
+        try:
+            while True:
+                try:
+                    data = fila_datas.get_nowait()
+                except queue.Empty:
+                    return  # Não há mais datas para processar
+                url_data = SITE_BASE_URL + competicao.url_match_centre(data)  # Página da competição na data
+
+                # Respeita o limite global antes de abrir a página
+                limitador.adquirir()
+                inicio_pagina = time.monotonic()
+                links_partidas = buscar_links_partidas_selenium(url_data, driver, competicao.id_competicao)
+                # Páginas que carregaram (com ou sem jogos) contam como resposta boa; erros não ajustam o ritmo
+                limitador.liberar(None if links_partidas is None else 200, time.monotonic() - inicio_pagina)
+
+                with lock_resultados:
+                    links_por_data[data] = links_partidas or []
+                if estado is not None:
+                    if links_partidas is None:
+                        estado.registrar(data, [], "erro")
+                    else:
+                        estado.registrar(data, links_partidas, "ok" if links_partidas else "vazio")
+
+                progresso.avancar(erros=links_partidas is None)
+                if links_partidas:
+                    log.info("Jogos encontrados para %s: %d jogos", data, len(links_partidas), extra={"amostra": "data"})
+                # Caso não encontre nenhum jogo para a data específica
+                else:
+                    log.debug("Nenhum jogo encontrado para a data %s", data)
+        finally:
+            # Fecha o WebDriver da sessão ao final da execução
+            driver.quit()
+
+    # Nunca abre mais navegadores do que datas a processar
+    sessoes = [threading.Thread(target=sessao) for _ in range(max(1, min(n_sessoes, len(datas))))]
+    for thread in sessoes:
+        thread.start()
+    for thread in sessoes:
+        thread.join()
+    progresso.concluir()
+
+    # Junta os resultados seguindo a ordem das datas, para que a saída não dependa de qual sessão terminou antes
+    todos_links_partidas = []
+    for data in datas:
+        todos_links_partidas.extend(links_por_data.get(data, []))
+
+    log.info("%d sessões, limitador de taxa: %s", len(sessoes), limitador.metricas())
+    return todos_links_partidas
+
+# Guarda na memória o resultado de cada data de um lote. Tem a mesma interface de EstadoRaspagem.registrar,
+# então pode ser passado às funções de coleta no lugar do estado em disco.
+class ResultadosDatas:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.datas = {}
+
+    def registrar(self, data, links, status):
+        with self.lock:
+            self.datas[data] = (list(links), status)
+
+    # Datas ainda sem resultado ou que deram erro
+    def datas_pendentes(self, datas):
+        return [data for data in datas if self.datas.get(data, ([], "erro"))[1] == "erro"]
+
+# Coleta as datas de um lote com o backend escolhido (voltando para o Selenium se o calendário falhar).
+# Devolve {data: links} apenas das datas coletadas sem erro.
+def coletar_datas(datas, args, estado, competicao, limitador=None):
+    pendentes = list(datas)
+    if args.backend == "calendario":
+        try:
+            buscar_links_partidas_calendario(pendentes, competicao.id_competicao, base_url=args.base_url, estado=estado)
+            pendentes = []
+            log.info("Limitador de taxa: %s", limitador_fifa.metricas())
+        except RequestException as e:
+            # Se o calendário não responder, volta para a raspagem com o navegador
+            log.warning("Erro ao consultar o calendário (%s), usando o Selenium", e)
+            pendentes = estado.datas_pendentes(pendentes)
+    if pendentes:
+        buscar_links_em_paralelo(pendentes, args.sessoes, args.intervalo, estado, competicao, limitador)
+
+# Modo fila: vários processos (ou máquinas) dividem as datas por uma fila de trabalho compartilhada.
+# Cada lote de datas é confirmado na fila junto com os links encontrados, e as partidas vão para o registro.
+def trabalhar_na_fila(competicao, datas, args, limitador=None):
+    fila = FilaTrabalho(args.fila, fila=f"datas:{competicao.nome}", trabalhador=args.trabalhador)
+    fila.enfileirar(datas)
+    if args.refazer:
+        fila.reabrir(datas)
+    registro = RegistroPartidas()
+
+    def processar(datas_lote):
+        resultados = ResultadosDatas()
+        coletar_datas(datas_lote, args, resultados, competicao, limitador)
+        coletadas = {data: links for data, (links, status) in resultados.datas.items()
+                     if status != "erro" and data in datas_lote}
+        registro.registrar_links((link for links in coletadas.values() for link in links), competicao.id_competicao)
+        return coletadas
+
+    trabalhar(fila, processar, DATAS_POR_LOTE)
+    links_por_data = fila.resultados(datas)
+    registro.fechar()
+    fila.fechar()
+    return [link for data in datas for link in links_por_data.get(data, [])]
+
+# Coleta os links de uma competição e grava as partidas no registro. Devolve todos os links conhecidos da temporada.
+def coletar_competicao(competicao, args, limitador=None):
+    # Gera a lista de datas da temporada, que serão inseridas na URL
+    datas = competicao.datas()
+
+    if args.fila:
+        links = trabalhar_na_fila(competicao, datas, args, limitador)
+        log.info("[%s] Fila concluída: %d links de partidas", competicao.nome, len(links))
+        return links
+
+    # Carrega o estado da última execução (um arquivo por competição) e separa apenas as datas que ainda precisam ser visitadas
+    estado = EstadoRaspagem(competicao.caminho_saida(args.estado))
+    datas_pendentes = datas if args.refazer else estado.datas_pendentes(datas)
+    log.info("[%s] %d de %d datas precisam ser coletadas", competicao.nome, len(datas_pendentes), len(datas))
+
+    if datas_pendentes:
+        coletar_datas(datas_pendentes, args, estado, competicao, limitador)
+
+    # Lista com todos os links de jogos encontrados, juntando os já salvos com os coletados agora
+    todos_links_partidas = estado.links(datas)
+
+    # Grava as partidas no registro, de onde os outros scripts leem os códigos
+    registro = RegistroPartidas()
+    novas = registro.registrar_links(todos_links_partidas, competicao.id_competicao)
+    log.info("[%s] %d novas partidas gravadas no registro (%d no total)", competicao.nome, novas, len(registro))
+    registro.fechar()
+    return todos_links_partidas
+
+def main():
+    parser = argparse.ArgumentParser(description="Coleta os links das partidas das competições configuradas no site da FIFA")
+    parser.add_argument("--competicoes", nargs="*",
+                        help="Nomes das competições de competicoes.json a coletar (padrão: todas)")
+    parser.add_argument("--config", default=ARQUIVO_COMPETICOES, help="Arquivo de configuração das competições")
+    parser.add_argument("--backend", choices=["calendario", "selenium"], default="calendario",
+                        help="Fonte dos links: calendário JSON da API (padrão) ou renderização das páginas com o Selenium")
+    parser.add_argument("--base-url", default=API_BASE_URL,
+                        help="URL base da API da FIFA (útil para apontar para um servidor local de testes)")
+    parser.add_argument("--estado", default=ARQUIVO_ESTADO,
+                        help="Arquivo com o estado da raspagem (dentro da pasta de cada competição), usado para continuar de onde parou")
+    parser.add_argument("--refazer", action="store_true",
+                        help="Ignora o estado salvo e coleta todas as datas novamente")
+    parser.add_argument("--sessoes", type=int, default=1, help="Quantidade de navegadores headless em paralelo")
+    parser.add_argument("--intervalo", type=float, default=INTERVALO_ENTRE_REQUISICOES,
+                        help="Intervalo inicial, em segundos, entre duas páginas abertas (somando todas as sessões)")
+    parser.add_argument("--fila", help="Arquivo SQLite da fila de trabalho compartilhada entre vários trabalhadores")
+    parser.add_argument("--trabalhador", help="Nome deste trabalhador na fila (padrão: máquina:processo)")
+    adicionar_argumentos_log(parser)
+    args = parser.parse_args()
+    configurar_log_dos_argumentos(args)
+
+    competicoes = carregar_competicoes(args.config, args.competicoes)
+
+    # As competições são coletadas em paralelo; os limitadores de taxa são os mesmos para todas
+    # (limitador_fifa para a API e um único limitador para as páginas abertas pelo Selenium)
+    limitador_paginas = criar_limitador_paginas(args.sessoes, args.intervalo)
+    with ThreadPoolExecutor(max_workers=len(competicoes)) as executor:
+        links_por_competicao = list(executor.map(
+            lambda competicao: coletar_competicao(competicao, args, limitador_paginas), competicoes))
+
+    # Após a coleta, resume os links encontrados (a lista completa aparece em nível DEBUG)
+    for competicao, todos_links_partidas in zip(competicoes, links_por_competicao):
+        if todos_links_partidas:
+            log.info("%d links de partidas de %s encontrados", len(todos_links_partidas), competicao.nome)
+            if log.isEnabledFor(logging.DEBUG):
+                for link in todos_links_partidas:
+                    log.debug(link)
+        else:
+            log.warning("Nenhum link de partidas de %s encontrado em todos os dias verificados.", competicao.nome)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+# Funções de pré-processamento dos DataFrames do projeto (tratamento de nulos, remoção de colunas,
+# tratamento de outliers e normalização). A explicação de cada função fica no notebook pre_processing.ipynb.
+#
+# O módulo é importado diretamente (import pre_processing), sem o import_ipynb, e depende apenas do numpy e do pandas.
+
+import json
+import warnings
+import numpy as np
+import pandas as pd
+
+def pre_processing(dataset):
+    dataset, columns_trate, null_fill_values = trate_null_value(dataset)  # Trata valores nulos nas colunas do DataFrame.
+    # Remove, em uma única passagem, as colunas que contêm apenas valores zero ou apenas valores nulos.
+    dataset, columns_drop, selected_columns = prune_columns(dataset)
+    columns_drop_zero, columns_drop_null = columns_drop["zero"], columns_drop["null"]
+    dataset, outlier_bounds = trate_outliers(dataset)  # Substitui outliers nas colunas numéricas pela mediana.
+    # Transforma colunas categóricas em códigos e normaliza todas as colunas para média 0 e desvio padrão 1.
+    # O transformador guarda também o que foi aprendido nas etapas anteriores, para tratar novos dados igual ao treino.
+    transformer = PreProcessingTransformer(null_fill_values, selected_columns, outlier_bounds)
+    dataset = transformer.fit_normalize(dataset)
+    return dataset, columns_trate, columns_drop_zero, columns_drop_null, transformer
+
+#Função que trata valores nulos
+# As medianas das colunas numéricas e as modas das colunas categóricas são calculadas de uma vez para o DataFrame
+# inteiro, e os nulos são preenchidos com um único fillna (coluna -> valor). Os valores são calculados para todas
+# as colunas, mesmo as que não têm nulos no treino, e devolvidos em fill_values: passados de novo, tratam os dados
+# de inferência da mesma forma, inclusive colunas que só têm nulos nesses dados.
+def trate_null_value(dataset, fill_values=None):
+    null_columns = dataset.columns[dataset.isnull().any()]  # Colunas que contêm valores nulos
+    if fill_values is None:
+        numerics_columns = dataset.select_dtypes(include=[np.number]).columns
+        categoricals_columns = dataset.columns.difference(numerics_columns, sort=False)
+        medians = dataset[numerics_columns].median()  # Mediana de cada coluna numérica, ignorando os NaN
+        # Moda de cada coluna categórica; em caso de empate fica a menor, como em Series.mode()[0].
+        # Sem linhas, ou com todas as colunas categóricas vazias, mode() não tem nenhuma linha e não há moda
+        modes = dataset[categoricals_columns].mode()
+        modes = modes.iloc[0] if len(modes) else pd.Series(np.nan, index=categoricals_columns, dtype=object)
+        # Colunas sem nenhum valor não nulo não têm mediana nem moda, e ficam como estão
+        fill_values = {column: value for column, value in pd.concat([medians, modes]).items() if pd.notna(value)}
+
+    # Só as colunas que têm nulos entram no fillna e em columns_trate (nos dados de inferência costumam ser poucas)
+    fill_columns = {column: fill_values[column] for column in null_columns if column in fill_values}
+    columns_trate = [f"Coluna '{column}' foi tratada, pois continha valores nulos." for column in fill_columns]
+    if fill_columns:
+        dataset = dataset.fillna(fill_columns)
+    return dataset, columns_trate, fill_values
+
+# Função que remove, de uma só vez, as colunas que não trazem informação: só zeros, só valores nulos
+# e (opcionalmente) um único valor repetido em todas as linhas. As três máscaras são calculadas para o DataFrame
+# inteiro e as colunas são removidas com um único drop, sem reconstruir o DataFrame a cada coluna.
+# As colunas mantidas são devolvidas em selected_columns, e podem ser passadas de novo para selecionar
+# as mesmas colunas nos dados de inferência.
+def prune_columns(dataset, zero=True, null=True, constant=False, selected_columns=None):
+    columns_drop = {"zero": [], "null": [], "constant": []}
+    if selected_columns is not None:
+        return dataset[selected_columns], columns_drop, selected_columns
+
+    false_mask = pd.Series(False, index=dataset.columns)
+    zero_mask = (dataset == 0).all() if zero else false_mask  # Colunas em que todos os valores são zero
+    null_mask = dataset.isnull().all() if null else false_mask  # Colunas em que todos os valores são nulos
+    if constant:
+        # Colunas numéricas: todos os valores iguais aos da primeira linha (NaN conta como igual a NaN)
+        numerics = dataset.select_dtypes(include=[np.number])
+        values = numerics.to_numpy(dtype=float)
+        first = values[:1]
+        same = (values == first) | (np.isnan(values) & np.isnan(first))
+        constant_mask = pd.Series(same.all(axis=0), index=numerics.columns)
+        # Demais colunas: no máximo um valor distinto
+        others = dataset.columns.difference(numerics.columns, sort=False)
+        constant_mask = pd.concat([constant_mask, dataset[others].nunique(dropna=False) <= 1]).reindex(dataset.columns)
+    else:
+        constant_mask = false_mask
+
+    # Cada coluna removida aparece em uma única lista: zeros, depois nulos, depois valor constante
+    for column in dataset.columns[zero_mask]:
+        columns_drop["zero"].append(f"Coluna '{column}' foi removida, pois contém apenas zeros.")
+    for column in dataset.columns[null_mask & ~zero_mask]:
+        columns_drop["null"].append(f"Coluna '{column}' excluída porque está completamente vazia.")
+    for column in dataset.columns[constant_mask & ~zero_mask & ~null_mask]:
+        columns_drop["constant"].append(f"Coluna '{column}' foi removida, pois contém um único valor.")
+
+    drop_mask = zero_mask | null_mask | constant_mask
+    selected_columns = list(dataset.columns[~drop_mask])
+    return dataset.drop(columns=dataset.columns[drop_mask]), columns_drop, selected_columns
+
+# Troca várias colunas de uma vez pelos valores de uma matriz. Atribuir dataset[columns] = values recria
+# o DataFrame a cada coluna; aqui a matriz vira um único bloco, juntado ao restante das colunas.
+def replace_columns(dataset, columns, values):
+    if len(columns) == 0:
+        return dataset
+    block = pd.DataFrame(values, index=dataset.index, columns=columns)
+    return pd.concat([dataset.drop(columns=columns), block], axis=1)[dataset.columns]
+
+# Função para excluir colunas com valores que só contenham zeros
+def drop_columns_zero_values(dataset):
+    dataset, columns_drop, _ = prune_columns(dataset, zero=True, null=False)
+    return dataset, columns_drop["zero"]
+
+# Função para excluir colunas que só tenham valores nulos
+def drop_columns_null_values(dataset):
+    dataset, columns_drop, _ = prune_columns(dataset, zero=False, null=True)
+    return dataset, columns_drop["null"]
+
+# Função que trata os outliers de todas as colunas numéricas de uma vez, sobre a matriz do numpy.
+# Para cada coluna são calculados os limites inferior e superior:
+#   - method="zscore": média +- threshold desvios padrão (equivale a |zscore| > threshold);
+#   - method="mad": mediana +- threshold * 1.4826 * MAD (desvio absoluto mediano), menos sensível aos próprios outliers.
+# Os valores fora dos limites são trocados pela mediana da coluna (ou, com clip=True, levados até o limite mais
+# próximo). Colunas sem variação não têm outliers. Os limites e as medianas são devolvidos em bounds, e podem ser
+# passados de novo para tratar os dados de inferência sem recalcular nada.
+def trate_outliers(dataset, method="zscore", threshold=3, clip=False, bounds=None):
+    if bounds is None:
+        numerics_columns = dataset.select_dtypes(include=[np.number]).columns
+        values = dataset[numerics_columns].to_numpy(dtype=float)
+        if method not in ("zscore", "mad"):
+            raise ValueError(f"Método de outliers desconhecido: {method}")
+        # Colunas só com NaN geram avisos de "All-NaN slice"; os limites delas ficam NaN e nada é alterado
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            median = np.nanmedian(values, axis=0) if len(values) else np.full(values.shape[1], np.nan)
+            if method == "zscore":
+                center = np.nanmean(values, axis=0)
+                scale = np.nanstd(values, axis=0)  # Mesmo desvio padrão (ddof=0) do scipy.stats.zscore
+            else:
+                center = median
+                scale = 1.4826 * np.nanmedian(np.abs(values - median), axis=0)
+        # Sem variação (ou sem valores) a coluna não tem outliers: os limites ficam infinitos
+        scale = np.where(scale > 0, scale, np.inf)
+        bounds = pd.DataFrame({"lower": center - threshold * scale, "upper": center + threshold * scale,
+                               "median": median}, index=numerics_columns)
+    else:
+        bounds = bounds[bounds.index.isin(dataset.columns)]
+        values = dataset[bounds.index].to_numpy(dtype=float)
+
+    lower = bounds["lower"].to_numpy()
+    upper = bounds["upper"].to_numpy()
+    if clip:
+        values = np.clip(values, lower, upper)  # NaN continua NaN
+    else:
+        values = np.where((values < lower) | (values > upper), bounds["median"].to_numpy(), values)
+    return replace_columns(dataset, bounds.index, values), bounds
+
+# Transformador ajustado com tudo o que o pré-processamento aprendeu no treino: os valores de preenchimento dos
+# nulos, as colunas mantidas, os limites de outliers e a normalização. A normalização é feita sobre a matriz inteira:
+# as colunas categóricas viram códigos inteiros (a posição da categoria na lista ordenada, como no LabelEncoder,
+# e -1 para categorias que não existiam no treino) e todas as colunas são padronizadas com média 0 e desvio padrão 1,
+# como no StandardScaler. Assim transform e inverse_transform são uma única operação sobre a matriz.
+# O transformador pode ser salvo em JSON (save/load); o modelo_time_ganhador o salva junto do modelo e o usa para
+# desfazer a normalização das previsões, e as linhas de inferência devem passar por transform antes do modelo.
+class PreProcessingTransformer:
+    def __init__(self, fill_values=None, selected_columns=None, outlier_bounds=None,
+                 columns=(), categories=None, mean=(), scale=()):
+        self.fill_values = fill_values
+        self.selected_columns = selected_columns
+        self.outlier_bounds = outlier_bounds
+        self.columns = list(columns)  # Colunas normalizadas, na ordem do DataFrame
+        self.categories = categories or {}  # Coluna categórica -> categorias conhecidas, ordenadas
+        self.mean = np.asarray(mean, dtype=float)
+        self.scale = np.asarray(scale, dtype=float)
+
+    # Ajusta a normalização: colunas numéricas e categóricas, categorias, médias e desvios padrão.
+    # Com standardize=False as colunas só são codificadas, sem padronização.
+    def fit(self, dataset, standardize=True):
+        self.columns = list(dataset.select_dtypes(include=[np.number, 'object']).columns)
+        self.categories = {column: np.sort(dataset[column].dropna().unique()).tolist()
+                           for column in dataset[self.columns].select_dtypes(include=['object']).columns}
+        if not standardize:
+            self.mean = np.zeros(len(self.columns))
+            self.scale = np.ones(len(self.columns))
+            return self
+        values = self._encoded_values(dataset)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            self.mean = np.nanmean(values, axis=0)
+            variance = np.nanvar(values, axis=0)
+        # Como no StandardScaler, colunas sem variação (descontado o erro de arredondamento) são apenas centralizadas
+        samples = np.sum(~np.isnan(values), axis=0)
+        eps = np.finfo(np.float64).eps
+        constant = variance <= samples * eps * variance + (samples * self.mean * eps) ** 2
+        self.scale = np.where(constant, 1.0, np.sqrt(variance))
+        return self
+
+    # Matriz com os códigos inteiros no lugar das categorias
+    def _encoded_values(self, dataset):
+        encoded = dataset[self.columns].copy()
+        for column, categories in self.categories.items():
+            encoded[column] = pd.Categorical(encoded[column], categories=categories).codes
+        return encoded.to_numpy(dtype=float)
+
+    # Normaliza as colunas ajustadas (as demais colunas ficam como estão)
+    def normalize(self, dataset):
+        return replace_columns(dataset, self.columns, (self._encoded_values(dataset) - self.mean) / self.scale)
+
+    def fit_normalize(self, dataset):
+        return self.fit(dataset).normalize(dataset)
+
+    # Aplica todo o pré-processamento do treino a novos dados (ex.: linhas de inferência), sem recalcular nada
+    def transform(self, dataset):
+        if self.fill_values is not None:
+            dataset, _, _ = trate_null_value(dataset, self.fill_values)
+        if self.selected_columns is not None:
+            dataset, _, _ = prune_columns(dataset, selected_columns=self.selected_columns)
+        if self.outlier_bounds is not None:
+            dataset, _ = trate_outliers(dataset, bounds=self.outlier_bounds)
+        return self.normalize(dataset)
+
+    # Desfaz a normalização: volta à escala original e troca os códigos pelas categorias.
+    # Códigos que não correspondem a nenhuma categoria conhecida voltam como nulos.
+    def inverse_transform(self, dataset):
+        columns = [column for column in self.columns if column in dataset.columns]
+        positions = [self.columns.index(column) for column in columns]
+        dataset = replace_columns(dataset, columns, dataset[columns].to_numpy(dtype=float) * self.scale[positions]
+                                  + self.mean[positions])
+        for column, categories in self.categories.items():
+            if column in dataset.columns:
+                codes = np.rint(dataset[column].to_numpy(dtype=float))
+                valid = (codes >= 0) & (codes < len(categories))
+                # None no fim da lista: os códigos inválidos apontam para ele
+                known = np.array(categories + [None], dtype=object)
+                dataset[column] = known[np.where(valid, codes, len(categories)).astype(int)]
+        return dataset
+
+    def to_dict(self):
+        bounds = self.outlier_bounds
+        return {
+            "fill_values": None if self.fill_values is None else [[column, _python(value)]
+                                                                  for column, value in self.fill_values.items()],
+            "selected_columns": self.selected_columns,
+            "outlier_bounds": None if bounds is None else {"columns": list(bounds.index),
+                                                           **{key: bounds[key].tolist() for key in bounds.columns}},
+            "columns": self.columns,
+            "categories": [[column, categories] for column, categories in self.categories.items()],
+            "mean": self.mean.tolist(),
+            "scale": self.scale.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        bounds = data["outlier_bounds"]
+        if bounds is not None:
+            bounds = dict(bounds)
+            columns = bounds.pop("columns")
+            bounds = pd.DataFrame(bounds, index=columns)
+        return cls(
+            fill_values=None if data["fill_values"] is None else dict(map(tuple, data["fill_values"])),
+            selected_columns=data["selected_columns"],
+            outlier_bounds=bounds,
+            columns=data["columns"],
+            categories=dict(map(tuple, data["categories"])),
+            mean=data["mean"],
+            scale=data["scale"],
+        )
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+# Converte escalares do numpy para tipos do Python, para gravar em JSON
+def _python(value):
+    return value.item() if isinstance(value, np.generic) else value
+
+# Função para normalizar colunas numéricas (média 0 e desvio padrão 1), com um único transformador para todas elas
+def normalize_numerics_columns(dataset):
+    transformer = PreProcessingTransformer().fit(dataset.select_dtypes(include=[np.number]))
+    return transformer.normalize(dataset), transformer
+
+# Função para normalizar colunas categóricas: cada categoria vira um código inteiro, com um único transformador
+def normalize_categoricals_columns(dataset):
+    transformer = PreProcessingTransformer().fit(dataset.select_dtypes(include=['object']), standardize=False)
+    dataset = transformer.normalize(dataset).astype({column: int for column in transformer.columns})
+    return dataset, transformer
+
+# Função para reverter a normalização das colunas categóricas
+def reverse_categoricals_columns(dataset, transformer):
+    return transformer.inverse_transform(dataset)
+
+# Função para reverter a normalização das colunas numéricas
+def reverse_numerics_columns(dataset, transformer):
+    return transformer.inverse_transform(dataset)